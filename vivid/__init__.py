@@ -15,9 +15,12 @@ from vivid.classes.line_segment import LineSegment
 from vivid.classes.relation import Relation
 from vivid.classes.relation_symbol import RelationSymbol
 from vivid.classes.state import State
+from vivid.classes.state import WorldBudgetExceededError
 from vivid.classes.valueset import ValueSet
+from vivid.classes.valueset import FrozenValueSet
 from vivid.classes.variable_assignment import VariableAssignment
 from vivid.classes.vocabulary import Vocabulary
+from vivid.classes.world import World
 
 from vivid.classes.inference_rules import thinning, widening, observe
 from vivid.classes.inference_rules import diagrammatic_absurdity
@@ -10,12 +10,26 @@ class Attribute(object):
     An Attribute is a finite set :math:`A` with an associated label :math:`l`.
 
     :ivar label: The associated label :math:`l` of the Attribute :math:`A`.
+    :cvar _max_domain_size: The largest number of discrete values an \
+    Attribute object may have for its ValueSets to be represented as \
+    bitmasks.
+    :cvar _max_cached_bitmasks: The number of bitmasks of FrozenValueSet \
+    objects an Attribute object caches before its cache is cleared.
     :ivar value_set: A ValueSet object functioning as the set of values that \
     the attribute can take on (e.g {small,large}).
+    :ivar _bit_positions: A lazily built mapping from each discrete value \
+    (paired with its type) of the Attribute object to a bit position; \
+    empty if the values of the Attribute object are not a small finite \
+    domain and ``None`` until first used.
+    :ivar _bitmasks: The cached bitmasks of FrozenValueSet objects, keyed \
+    by their content.
     :ivar _is_Attribute: An identifier to use in place of ``type`` or \
     ``isinstance``.
     """
 
+    _max_domain_size = 4096
+    _max_cached_bitmasks = 4096
+
     def __init__(self, label, value_set):
         """
         Construct an Attribute object.
@@ -35,6 +49,8 @@ class Attribute(object):
             raise TypeError("l parameter must be a string")
 
         self._label = label
+        self._bit_positions = None
+        self._bitmasks = {}
         self._is_Attribute = True
 
         if hasattr(value_set, "_is_ValueSet"):
@@ -110,7 +126,127 @@ class Attribute(object):
         Deepcopy an Attribute object via the ``copy.deepcopy`` method.
         """
 
-        return Attribute(deepcopy(self._label), deepcopy(self._value_set))
+        attribute = Attribute(
+            deepcopy(self._label), deepcopy(self._value_set))
+        # the domain is unchanged so its bit positions and bitmasks are shared
+        attribute._bit_positions = self._bit_positions
+        attribute._bitmasks = self._bitmasks
+        return attribute
+
+    def get_bitmask(self, value_set):
+        """
+        Return the bitmask of the values in the ValueSet object in the
+        ``value_set`` parameter w.r.t. the bit positions of the values of the
+        calling Attribute object (see ``_get_bit_positions``), where bit
+        :math:`i` is set if the value at position :math:`i` is in
+        ``value_set`` or some Interval in it; the discrete values of subsets,
+        unions and differences of such ValueSets are then those of ``&``,
+        ``|`` and ``& ~`` of their bitmasks. As ValueSet does not treat an
+        Interval as the set of its discrete values, these only agree with the
+        ValueSet operators on ValueSets holding no Interval objects.
+        The bitmasks of FrozenValueSet objects are cached.
+
+        :param value_set: The ValueSet object to get the bitmask of.
+        :type  value_set: ValueSet
+
+        :return: The bitmask of ``value_set`` or ``None`` if the values of \
+        the calling Attribute object are not a small finite domain or some \
+        value in ``value_set`` is not in it.
+        :rtype: ``int`` | ``long`` | ``None``
+        """
+
+        positions = self._get_bit_positions()
+        if not positions:
+            return None
+
+        is_frozen = hasattr(value_set, "_is_FrozenValueSet")
+        if is_frozen:
+            try:
+                return self._bitmasks[value_set._content_key]
+            except KeyError:
+                pass
+
+        bitmask = 0
+        for value in value_set:
+            # an Interval with more values than the domain can't be in it
+            if hasattr(value, "_is_Interval") and \
+                    value.count_values() > len(positions):
+                bitmask = None
+                break
+            try:
+                for key in Attribute._get_bit_keys(value):
+                    bitmask |= 1 << positions[key]
+            except (KeyError, TypeError, ValueError):
+                bitmask = None
+                break
+
+        if is_frozen:
+            if len(self._bitmasks) >= Attribute._max_cached_bitmasks:
+                self._bitmasks.clear()
+            self._bitmasks[value_set._content_key] = bitmask
+
+        return bitmask
+
+    def _get_bit_positions(self):
+        """
+        Return the bit positions of the values of the calling Attribute
+        object, building them on first use; every discrete value of the
+        ValueSet of the calling Attribute object (i.e., with ``int`` and
+        ``long`` Intervals discretized) is paired with its type and given the
+        next bit position.
+
+        :return: A ``dict`` mapping (type, value) pairs to bit positions, \
+        empty if the ValueSet of the calling Attribute object contains a \
+        ``float`` Interval or an object other than an Interval, or has more \
+        than ``Attribute._max_domain_size`` discrete values.
+        :rtype: ``dict``
+        """
+
+        if self._bit_positions is None:
+            positions = {}
+            try:
+                size = 0
+                for value in self._value_set:
+                    if hasattr(value, "_is_Interval"):
+                        size += value.count_values()
+                    else:
+                        size += 1
+                if size > Attribute._max_domain_size:
+                    raise ValueError("domain too large")
+
+                for value in self._value_set:
+                    for key in Attribute._get_bit_keys(value):
+                        positions.setdefault(key, len(positions))
+            except (TypeError, ValueError):
+                positions = {}
+            self._bit_positions = positions
+
+        return self._bit_positions
+
+    @staticmethod
+    def _get_bit_keys(value):
+        """
+        Return the (type, value) pairs of the discrete values of the value in
+        the ``value`` parameter, i.e., of every value of an ``int`` or
+        ``long`` Interval or of the value itself.
+
+        :return: The (type, value) pairs of ``value``.
+        :rtype: ``list``
+
+        :raises ValueError: ``float`` Intervals have no discrete values.
+        :raises TypeError: Only base types and Intervals have (type, value) \
+        pairs.
+        """
+
+        if hasattr(value, "_is_Interval"):
+            if value._type is float:
+                raise ValueError("float Intervals have no discrete values")
+            return [(value._type, v) for v in value.discretize()]
+
+        if type(value) not in ValueSet._base_types:
+            raise TypeError(str(type(value)) + " has no discrete values")
+
+        return [(type(value), value)]
 
     def __str__(self):
         "Return a readable string representation of the Attribute object."""
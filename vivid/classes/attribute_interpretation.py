@@ -38,6 +38,8 @@ class AttributeInterpretation(object):
     :ivar table: The interpretation table of the attribute interpretation.
     :ivar relation_symbols: A copy of the RelationSymbol objects from \
     :math:`\Sigma` (for convenient access).
+    :ivar entries: A mapping from the name of each RelationSymbol object to \
+    its entry in the interpretation table (for constant time lookup).
     :ivar is_AttributeInterpretation: An identifier to use in place of \
     ``type`` or ``isinstance``.
     """
@@ -178,6 +180,9 @@ class AttributeInterpretation(object):
 
         self._table = interpretation_table
         self._relation_symbols = [e[0] for e in interpretation_table]
+        self._entries = {}
+        for entry in interpretation_table:
+            self._entries.setdefault(entry[0]._name, entry)
         self._is_AttributeInterpretation = True
 
     def __eq__(self, other):
@@ -255,6 +260,29 @@ class AttributeInterpretation(object):
         for entry in self._table:
             yield entry
 
+    def get_entry(self, name):
+        """
+        Return the entry of the interpretation table whose RelationSymbol
+        object has the name given by the ``name`` parameter; entries are
+        indexed by name so the lookup takes constant time.
+
+        :param name: The name of the RelationSymbol object of the entry.
+        :type  name: ``str``
+
+        :return: The entry of the interpretation table, i.e., a list of the \
+        RelationSymbol object, the arity of its realization, the subscript \
+        of its realization (e.g. ``'R1'``) and its profile.
+        :rtype: ``list``
+
+        :raises KeyError: Some RelationSymbol object in the interpretation \
+        table must have the name given by the ``name`` parameter.
+        """
+
+        try:
+            return self._entries[name]
+        except KeyError:
+            raise KeyError(name + " not in interpretation table")
+
     def __str__(self):
         """
         Return a readable string representation of the AttributeInterpretation
@@ -173,6 +173,41 @@ class ConstantAssignment(Assignment):
             deepcopy(self._attribute_system),
             deepcopy(self._mapping))
 
+    def _derive(self, mapping=None, attribute_system=None):
+        """
+        Return a ConstantAssignment object derived from the calling
+        ConstantAssignment object without validation or deep copies; the
+        derived object shares the Vocabulary object :math:`\Sigma` and
+        (unless another is given) the AttributeSystem object
+        :math:`\mathcal{S}` of the calling object by reference and has its own
+        mapping.
+
+        :param mapping: An optional mapping, known to be valid, to use in \
+        place of a copy of the calling object's mapping.
+        :type  mapping: ``dict`` | ``None``
+        :param attribute_system: An optional AttributeSystem object, equal \
+        to that of the calling object, to reference instead.
+        :type  attribute_system: AttributeSystem | ``None``
+
+        :return: The derived ConstantAssignment object.
+        :rtype: ConstantAssignment
+        """
+
+        if mapping is None:
+            mapping = dict(self._mapping)
+        if attribute_system is None:
+            attribute_system = self._attribute_system
+
+        derived = object.__new__(ConstantAssignment)
+        derived._vocabulary = self._vocabulary
+        derived._attribute_system = attribute_system
+        derived._mapping = mapping
+        derived._source = mapping.keys()
+        derived._target = mapping.values()
+        derived._is_Assignment = True
+        derived._is_ConstantAssignment = True
+        return derived
+
     def add_mapping(self, constant_symbol, obj):
         """
         Extend the calling ConstantAssignment object by adding a new mapping
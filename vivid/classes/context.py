@@ -97,7 +97,8 @@ class Context(object):
         return Context(deepcopy(self._assumption_base),
                        deepcopy(self._named_state))
 
-    def entails_formula(self, formula, attribute_interpretation):
+    def entails_formula(self, formula, attribute_interpretation,
+                        processes=None):
         """
         Determine if the calling Context object
         :math:`{\gamma = (\\beta; (\sigma; \\rho))}` entails the Formula object
@@ -112,6 +113,9 @@ class Context(object):
         :math:`I` to use for the interpretation of truth values during the \
         evauation of :math:`\gamma \models F`.
         :type  attribute_interpretation: AttributeInterpretation
+        :param processes: The number of worker processes to split the \
+        possible worlds across or ``None`` to check them serially.
+        :type  processes: ``int`` | ``None``
 
         :return: Whether or not :math:`\gamma \models F`, that is, whether or \
         not :math:`(w;\widehat{\\rho})\models_{\chi}\gamma` implies \
@@ -119,12 +123,16 @@ class Context(object):
         :math:`(w;\widehat{\\rho})` and variable assignments :math:`\chi`.
         :rtype: ``bool``
 
-        :raises TypeError: ``formula`` parameter must be a Formula object and \
+        :raises TypeError: ``formula`` parameter must be a Formula object, \
         ``attribute_interpretation`` parameter must be an \
-        AttributeInterpretation object.
+        AttributeInterpretation object and ``processes`` parameter must be \
+        an ``int`` or ``None``.
         :raises ValueError: The calling Context object and the Formula object \
         :math:`F` provided in the ``formula`` parameter must share the same \
-        underlying Vocabulary object :math:`\Sigma`.
+        underlying Vocabulary object :math:`\Sigma` and ``processes`` \
+        parameter must be positive.
+        :raises WorldBudgetExceededError: The number of worlds and \
+        VariableAssignment objects to check must not exceed the world budget.
         """
 
         # Check for exceptions first.
@@ -140,25 +148,10 @@ class Context(object):
                 "Formula must be over the same vocabulary used to create"
                 "ConstantAssignment within this Context.")
 
-        # get all possible worlds and variable assignments.
-        possible_worlds = self._named_state.get_worlds()
+        return self._entails(formula, attribute_interpretation, processes)
 
-        # for every possible world and variable assignment, if the world
-        # satisfies the context, but not the formula, this Context does not
-        # entail the Formula, return False, otherwise return True aftewards.
-        for world in possible_worlds:
-            for X in world._generate_variable_assignments():
-                satisfies_context = world.satisfies_context(
-                    self, X, attribute_interpretation)
-                satisfies_formula = world.satisfies_formula(
-                    formula, X, attribute_interpretation)
-
-                if satisfies_context and not satisfies_formula:
-                    return False
-
-        return True
-
-    def entails_named_state(self, named_state, attribute_interpretation):
+    def entails_named_state(self, named_state, attribute_interpretation,
+                            processes=None):
         """
         Determine if the calling Context object
         :math:`{\gamma = (\\beta; (\sigma; \\rho))}` entails the NamedState
@@ -175,6 +168,9 @@ class Context(object):
         :math:`I` to use for the interpretation of truth values during the \
         evauation of :math:`\gamma \models (\sigma^{\prime};\\rho^{\prime})`.
         :type  attribute_interpretation: AttributeInterpretation
+        :param processes: The number of worker processes to split the \
+        possible worlds across or ``None`` to check them serially.
+        :type  processes: ``int`` | ``None``
 
         :return: Whether or not \
         :math:`\gamma \models (\sigma^{\prime};\\rho^{\prime})`, \
@@ -185,12 +181,15 @@ class Context(object):
         :rtype: ``bool``
 
         :raises TypeError: ``named_state`` parameter must be a NamedState \
-        object and ``attribute_interpretation`` parameter must be an \
-        AttributeInterpretation object.
+        object, ``attribute_interpretation`` parameter must be an \
+        AttributeInterpretation object and ``processes`` parameter must be \
+        an ``int`` or ``None``.
         :raises ValueError: The calling Context object and the NamedState \
         object :math:`(\sigma^{\prime};\\rho^{\prime})` provided in the \
         ``named_state`` parameter must share the same underlying Vocabulary \
-        object :math:`\Sigma`.
+        object :math:`\Sigma` and ``processes`` parameter must be positive.
+        :raises WorldBudgetExceededError: The number of worlds and \
+        VariableAssignment objects to check must not exceed the world budget.
         """
 
         # Check for exceptions first.
@@ -207,22 +206,235 @@ class Context(object):
                 "ConstantAssignment as the Vocabulary of the "
                 "ConstantAssignment within this Context.")
 
-        # get all possible worlds and variable assignments.
-        possible_worlds = self._named_state.get_worlds()
+        return self._entails(named_state, attribute_interpretation, processes)
+
+    def _entails(self, target, attribute_interpretation, processes=None):
+        """
+        Determine if the calling Context object :math:`\gamma` entails the
+        Formula or NamedState object in the ``target`` parameter, i.e., that
+        no world :math:`(w;\widehat{\\rho})` derivable from the NamedState
+        object of :math:`\gamma` refutes ``target`` (see ``_refutes``). Only
+        one world per orbit of interchangeable objects is checked (see
+        ``NamedState.get_worlds``).
+
+        When ``processes`` is provided, the possible worlds are split into
+        contiguous chunks checked by a ``multiprocessing`` pool of that many
+        worker processes; as soon as any worker finds a counterexample, every
+        other worker is signalled to stop and the pool is terminated.
+
+        When the truth value cache of the Formula class is enabled (see
+        ``Formula.set_cache_size``), the result is held in that cache under
+        the contents of the calling Context object, ``target`` and the
+        AttributeInterpretation object (see ``_get_cache_key``), so asking
+        the same question of an unchanged Context object again only costs a
+        lookup.
+
+        :raises TypeError: ``processes`` parameter must be an ``int`` or \
+        ``None``.
+        :raises ValueError: ``processes`` parameter must be positive.
+        :raises WorldBudgetExceededError: The number of worlds and \
+        VariableAssignment objects to check must not exceed the world budget.
+        """
+
+        if processes is not None:
+            if type(processes) != int:
+                raise TypeError("processes parameter must be an int or None")
+            if processes < 1:
+                raise ValueError("processes parameter must be positive")
+
+        from formula import Formula
+
+        key = self._get_cache_key(target, attribute_interpretation)
+        entailed = Formula._lookup_cache(key)
+        if entailed is None:
+            entailed = self._check_worlds(
+                target, attribute_interpretation, processes)
+            Formula._store_cache(key, entailed)
+
+        return entailed
+
+    def _get_cache_key(self, target, attribute_interpretation):
+        """
+        Return the key of the entailment of the Formula or NamedState object
+        in the ``target`` parameter by the calling Context object w.r.t. the
+        AttributeInterpretation object in the ``attribute_interpretation``
+        parameter in the truth value cache of the Formula class. The key is
+        built from contents rather than identities: the Vocabulary
+        :math:`\Sigma`, the objects, Relation definitions, ascriptions and
+        ConstantAssignment of each NamedState object, the Formula objects of
+        the AssumptionBase and the interpretation table.
+
+        :return: The key of the entailment or ``None`` if the cache is \
+        disabled.
+        :rtype: ``tuple`` | ``None``
+        """
+
+        from formula import Formula
+
+        if not Formula._cache_size:
+            return None
+
+        def get_named_state_key(named_state):
+            """Return the contents of a NamedState object as a tuple."""
+            attribute_system = named_state._attribute_system
+            relations = attribute_system._attribute_structure._relations
+            ao_pairs = sorted(named_state._ascriptions.keys())
+            return (tuple(attribute_system._objects),
+                    tuple(sorted([(subscript, relation._definition)
+                                  for subscript, relation
+                                  in relations.iteritems()])),
+                    tuple(ao_pairs),
+                    named_state.get_fingerprint(ao_pairs),
+                    tuple(sorted(named_state._p._mapping.items())))
+
+        if hasattr(target, "_is_Formula"):
+            target_key = (target._name, tuple(target._terms))
+        else:
+            target_key = get_named_state_key(target)
+
+        assumptions = tuple([(formula._name, tuple(formula._terms))
+                             for formula in self._assumption_base])
+        table = tuple([(entry[0]._name, entry[2], tuple(entry[3]))
+                       for entry in attribute_interpretation])
+
+        return ("entails", self._named_state._p._vocabulary._key(),
+                get_named_state_key(self._named_state), assumptions,
+                target_key, table)
 
-        # for every possible world and variable assignment, if the world
-        # satisfies this Context, but not the NamedState, this Context does not
-        # entail the NamedState, return False, otherwise return True aftewards.
-        for world in possible_worlds:
-            for X in world._generate_variable_assignments():
-                satisfies_context = world.satisfies_context(
-                    self, X, attribute_interpretation)
-                satisfies_named_state = world.satisfies_named_state(
-                    named_state)
+    def _check_worlds(self, target, attribute_interpretation, processes):
+        """
+        Determine if the calling Context object entails the Formula or
+        NamedState object in the ``target`` parameter by checking the worlds
+        derivable from its NamedState object (see ``_entails``).
+
+        :raises WorldBudgetExceededError: The number of worlds and \
+        VariableAssignment objects to check must not exceed the world budget.
+        """
+
+        # worlds that only differ by a permutation of objects the Context
+        # and target cannot tell apart either all refute the target or none
+        # of them do, so only one world per orbit is checked.
+        named_states = ()
+        if hasattr(target, "_is_NamedState"):
+            named_states = (target,)
+
+        # ensure the enumeration below fits the world budget before starting
+        from state import State
+        world_count = self._named_state.count_worlds(True, named_states)
+        State._check_world_budget(
+            world_count * self._named_state.count_variable_assignments())
+
+        if processes is None:
+            # get all possible worlds (as compact World objects sharing the
+            # discretized ascriptions of the NamedState) and check each one.
+            possible_worlds = self._named_state.get_worlds(
+                compact=True, reduce_symmetry=True, named_states=named_states)
+            for world in possible_worlds:
+                if self._refutes(world, target, attribute_interpretation):
+                    return False
+            return True
 
-                if satisfies_context and not satisfies_named_state:
+        from multiprocessing import Event, Pool
+
+        # split the worlds into a few chunks per process so that idle
+        # workers can pick up the remaining work
+        chunk_count = max(1, min(world_count, processes * 4))
+        bounds = [world_count * i // chunk_count
+                  for i in range(chunk_count + 1)]
+        chunks = zip(bounds[:-1], bounds[1:])
+
+        # the pool's processes are forked with the Context, target and
+        # AttributeInterpretation so only the chunk bounds are sent to them;
+        # each worker generates the worlds of its chunks directly from their
+        # bounds (see NamedState._generate_compact_worlds)
+        cancelled = Event()
+        pool = Pool(processes, _initialize_worker,
+                    (cancelled, self, target, attribute_interpretation))
+        try:
+            for refuted in pool.imap_unordered(_check_chunk, chunks):
+                if refuted:
+                    cancelled.set()
                     return False
-        return True
+            return True
+        finally:
+            pool.terminate()
+            pool.join()
+
+    def _refutes(self, world, target, attribute_interpretation):
+        """
+        Determine if the world :math:`(w;\widehat{\\rho})` in the ``world``
+        parameter is a counterexample to the entailment of the Formula or
+        NamedState object in the ``target`` parameter by the calling Context
+        object, i.e., for some VariableAssignment object :math:`\chi`, the
+        world satisfies the calling Context object but not ``target``.
+
+        :return: Whether or not ``world`` refutes the entailment of \
+        ``target``.
+        :rtype: ``bool``
+        """
+
+        # for every variable assignment, if the world satisfies this Context,
+        # but not the target, this Context does not entail the target.
+        for X in world._generate_variable_assignments():
+            satisfies_context = world.satisfies_context(
+                self, X, attribute_interpretation)
+            if hasattr(target, "_is_Formula"):
+                satisfies_target = world.satisfies_formula(
+                    target, X, attribute_interpretation)
+            else:
+                satisfies_target = world.satisfies_named_state(target)
+
+            if satisfies_context and not satisfies_target:
+                return True
+
+        return False
+
+
+# state of each worker process of Context._entails; set once per process by
+# _initialize_worker
+_worker = {}
+
+
+def _initialize_worker(cancelled, context, target, attribute_interpretation):
+    """Store the state shared by every chunk checked by a worker process."""
+    named_states = ()
+    if hasattr(target, "_is_NamedState"):
+        named_states = (target,)
+
+    _worker["cancelled"] = cancelled
+    _worker["context"] = context
+    _worker["target"] = target
+    _worker["attribute_interpretation"] = attribute_interpretation
+    _worker["classes"] = context._named_state._get_interchangeable_objects(
+        *named_states)
+
+
+def _check_chunk(bounds):
+    """
+    Determine if any world in the chunk of worlds given by the ``bounds``
+    parameter (a (start, stop) pair of world indices) refutes the entailment
+    being checked by the worker process; stop early if another worker has
+    already found a counterexample.
+    """
+
+    cancelled = _worker["cancelled"]
+    context = _worker["context"]
+    target = _worker["target"]
+    attribute_interpretation = _worker["attribute_interpretation"]
+
+    # the chunk's worlds are generated from its bounds, skipping none
+    start, stop = bounds
+    worlds = context._named_state._generate_compact_worlds(
+        _worker["classes"], start, stop)
+
+    for world in worlds:
+        if cancelled.is_set():
+            return False
+        if context._refutes(world, target, attribute_interpretation):
+            cancelled.set()
+            return True
+
+    return False
 
 
 def main():
@@ -1,5 +1,7 @@
 """This section introduces the Formula class."""
 
+import threading
+from collections import OrderedDict
 from variable_assignment import VariableAssignment
 
 
@@ -12,10 +14,20 @@ class Formula(object):
     Formula is defined over.
     :ivar name: The name of the Formula object.
     :ivar terms: The terms of the Formula object.
+    :ivar template: The cached profile template of the Formula object (see \
+    ``Formula._get_template``).
     :ivar is_Formula: An identifier to use in place of ``type`` or \
     ``isinstance``.
     """
 
+    _chunk_size = 65536
+    _cache = OrderedDict()
+    _cache_size = 0
+    _cache_hits = 0
+    _cache_misses = 0
+    _cache_lock = threading.Lock()
+    _interval_parser = None
+
     def __init__(self, vocabulary, name, *terms):
         """
         Construct a Formula object.
@@ -72,6 +84,7 @@ class Formula(object):
         self._vocabulary = vocabulary
         self._name = deepcopy(name)
         self._terms = list(terms)
+        self._template = None
         self._is_Formula = True
 
     def __eq__(self, other):
@@ -188,7 +201,18 @@ class Formula(object):
                        deepcopy(self._name),
                        *deepcopy(self._terms))
 
-    def assign_truth_value(self, attribute_interpretation, named_state, X):
+    def __getstate__(self):
+        """
+        Return the state of a Formula object for pickling; the cached profile
+        template is dropped.
+        """
+
+        state = dict(self.__dict__)
+        state["_template"] = None
+        return state
+
+    def assign_truth_value(self, attribute_interpretation, named_state, X,
+                           symbolic=False, spread=False, vectorized=False):
         """
         Assign a truth value in
         :math:`\{\\textbf{true}, \\textbf{false}, \\textbf{unknown}\}`
@@ -224,10 +248,11 @@ class Formula(object):
         (:math:`\delta_{i}(s_{j})` for some set of the possible values of
         :math:`i` and :math:`j`) to use in the Relation object's definition
         when creating the evaluatable expression. Now, all worlds
-        :math:`(w;\widehat{\\rho})` derivable from the NamedState are generated
-        and the ValueSets of the attribute-object pairs in the profile
-        (consisting of single elements) are extracted from the ascriptions of
-        these worlds.
+        :math:`(w;\widehat{\\rho})` derivable from the NamedState are
+        projected onto the profile, i.e., only the distinct valuations of the
+        attribute-object pairs in the profile (the basis of :math:`F` w.r.t.
+        :math:`\\rho` and :math:`\chi`) are generated; attribute-object pairs
+        outside of the profile are never enumerated.
 
         5. The single element ValueSets are zipped together with the arguments
         in the Relation object definition (the :math:`i`\ th attribute-object
@@ -239,15 +264,77 @@ class Formula(object):
         world :math:`(w;\widehat{\\rho})`.
 
         6. Each parser in the ParserSet object will then try to evaluate the
-        expression and save the truth value for each
-        :math:`(w;\widehat{\\rho})`. If some expression is unevaluatable for
-        all parsers in the ParserSet a ValueError is raised.
+        expression of each :math:`(w;\widehat{\\rho})` in turn (see
+        ``ParserSet.evaluate``; expressions already evaluated are looked up in
+        its cache). If some expression is unevaluatable for all parsers in the
+        ParserSet a ValueError is raised. When the definition of the Relation
+        object can be compiled (see ``Relation.get_evaluator``), steps 5 and 6
+        are skipped for every valuation the compiled definition accepts
+        (e.g., valuations of only ``bool``, ``int``, ``float`` and ``long``
+        values, or of Point and LineSegment objects for definitions calling
+        their functions); the compiled definition is called with the values
+        directly instead.
 
         7. If the expression of every world :math:`(w;\widehat{\\rho})`
         evaluates to True, the truth value returned is **true**, if the
         expression of every world evaluates to False, the truth value returned
         is **false** and if the expressions of any two worlds evaluate to
-        different values, the truth value returned is **unknown**.
+        different values, the truth value returned is **unknown**; in the
+        latter case, **unknown** is returned as soon as the second value is
+        seen and the remaining worlds are not evaluated.
+
+        If the ``vectorized`` parameter is ``True``, NumPy is installed, the
+        definition of the Relation object can be compiled and the ValueSets
+        of the attribute-object pairs in the profile only hold int, float and
+        long values and Interval objects (or only non-generic Point objects
+        or only non-generic LineSegment objects for definitions calling a
+        function with a batch counterpart, e.g., ``Point.batch_is_on``),
+        steps 5 through 7 are carried out on NumPy arrays holding the
+        valuations of step 4 (in chunks of at most ``Formula._chunk_size``
+        valuations at a time) rather than one valuation at a time; see
+        ``Relation.get_evaluator``.
+
+        If the ``spread`` parameter is ``True``, the valuations of step 4 are
+        generated extremes first (see ``State.get_projected_valuations``) so
+        that expressions that evaluate to different values tend to come up
+        early and step 7 can return **unknown** sooner.
+
+        If the ``symbolic`` parameter is ``True`` and the ValueSets of the
+        attribute-object pairs in the profile only hold int, float and long
+        values and Interval objects, steps 4 through 7 are replaced by the
+        symbolic evaluation of the RHS of the Relation object's definition
+        over whole Intervals using interval arithmetic (see
+        ``TruthValueParser.evaluate_intervals``); Intervals are only split
+        when the truth value over them is **unknown**. Symbolic evaluation
+        keeps the discretized semantics of steps 4 through 7: it only decides
+        the truth value when it holds over every real point of an Interval
+        (and therefore over every discretized value), and when some float
+        Interval leaves the truth value **unknown**, steps 4 through 7 are
+        carried out as usual over its discretized values. E.g., ``h1 = 1.5``
+        over ``Interval(0.0, 3.0)`` is **false** either way, as 1.5 is not
+        among the discretized values. If the definition cannot be evaluated
+        this way, steps 4 through 7 are carried out as usual as well.
+
+        If the truth value cache is enabled (see ``Formula.set_cache_size``),
+        steps 4 through 7 are skipped when the same question was answered
+        before: truth values are held in a bounded least-recently-used cache
+        shared by all Formula objects and keyed by the definition of the
+        Relation object, the compiled profile of step 3 (which accounts for
+        the terms of :math:`F`, :math:`\\rho` and :math:`\chi`), the
+        contents of the ascriptions of the basis (see
+        ``State.get_fingerprint``) and the ``symbolic`` parameter. As the key
+        is built from contents, changing an ascription never yields a stale
+        truth value; ``Formula.clear_cache`` empties the cache.
+
+        :param symbolic: Whether or not to evaluate numeric definitions \
+        symbolically with interval arithmetic.
+        :type  symbolic: ``bool``
+        :param spread: Whether or not to generate the valuations of the \
+        basis extremes first.
+        :type  spread: ``bool``
+        :param vectorized: Whether or not to evaluate numeric definitions \
+        over arrays of valuations with NumPy.
+        :type  vectorized: ``bool``
 
         :return: A truth value in the set \
         :math:`\{\\textbf{true}, \\textbf{false}, \\textbf{unknown}\}`
@@ -255,8 +342,8 @@ class Formula(object):
 
         :raises TypeError: ``attribute_interpretation`` parameter must be an \
         AttributeInterpretation object, ``named_state`` parameter must be a \
-        NamedState object and ``X`` parameter must be a VariableAssignment \
-        object.
+        NamedState (or World) object and ``X`` parameter must be a \
+        VariableAssignment object.
         :raises ValueError: This Formula object, the AttributeInterpretation \
         object in the ``attribute_interpretation`` parameter, the NamedState \
         object in the ``named_state`` parameter and the VariableAssignment \
@@ -281,14 +368,134 @@ class Formula(object):
         definition.
         """
 
-        def get_relation_arguments(definition):
-            """Return the arguments provided in Relation definition."""
+        if not hasattr(attribute_interpretation,
+                       "_is_AttributeInterpretation"):
+            raise TypeError(
+                "attribute_interpretation parameter must an "
+                "AttributeInterpretation object")
 
-            start_paren = definition.find('(')
-            end_paren = definition.find(')')
+        if not hasattr(named_state, "_is_NamedState") and \
+                not hasattr(named_state, "_is_World"):
+            raise TypeError(
+                "named_state parameter must be a NamedState object")
 
-            arg_string = definition[start_paren + 1:end_paren]
-            return arg_string.split(',')
+        if not hasattr(X, "_is_VariableAssignment"):
+            raise TypeError(
+                "X parameter must be a VariableAssignment object")
+
+        compiled_profile = self._get_profile(
+            attribute_interpretation, named_state, X)
+        if compiled_profile is None:
+            return "unknown"
+
+        relation, relation_args, profile = compiled_profile
+
+        # the truth value only depends on the valuations of the ao-pairs in
+        # the profile (i.e., the basis of this Formula w.r.t. p and X), so
+        # only enumerate the distinct valuations of the basis rather than
+        # every world of the named state.
+        basis = []
+        for ao_pair in profile:
+            if ao_pair not in basis:
+                basis.append(ao_pair)
+
+        key = Formula._get_cache_key(relation, profile, named_state, symbolic)
+        truth_value = Formula._lookup_cache(key)
+        if truth_value is None:
+            truth_value = self._compute_truth_value(
+                relation, relation_args, profile, basis, named_state,
+                symbolic, spread, vectorized)
+            Formula._store_cache(key, truth_value)
+
+        return truth_value
+
+    def _compute_truth_value(self, relation, relation_args, profile, basis,
+                             named_state, symbolic, spread, vectorized):
+        """
+        Compute the truth value of the calling Formula object from its
+        compiled profile (steps 4 through 7 of ``assign_truth_value``).
+
+        :return: A truth value in the set \
+        :math:`\{\\textbf{true}, \\textbf{false}, \\textbf{unknown}\}`
+        :rtype: ``bool`` | ``str``
+
+        :raises ValueError: See ``assign_truth_value``.
+        """
+
+        if symbolic and not hasattr(named_state, "_is_World"):
+            truth_value = self._assign_interval_truth_value(
+                relation, relation_args, profile, basis, named_state)
+            if truth_value is not None:
+                return truth_value
+
+        evaluation = Formula._prepare_evaluation(
+            relation, relation_args, profile, basis)
+
+        if vectorized and not hasattr(named_state, "_is_World"):
+            truth_value = self._assign_vectorized_truth_value(
+                relation, evaluation[1], basis, named_state)
+            if truth_value is not None:
+                return truth_value
+
+        valuations = named_state.get_projected_valuations(basis, spread)
+
+        # we now check the formula against each possible valuation of the basis
+        from parsers.parser_set import ParserSet
+        parser_set = ParserSet()
+
+        seen = set([])
+        for valuation in valuations:
+            result = Formula._evaluate_valuation(
+                relation, evaluation, valuation, parser_set)
+
+            # once both True and False have been seen, the truth value can
+            # only be unknown
+            seen.add(bool(result))
+            if len(seen) == 2:
+                return "unknown"
+
+        if False in seen:
+            return False
+        else:
+            return True
+
+    @staticmethod
+    def assign_truth_values(attribute_interpretation, named_state, X,
+                            *formulae):
+        """
+        Assign a truth value in
+        :math:`\{\\textbf{true}, \\textbf{false}, \\textbf{unknown}\}`
+        to each of the Formula objects :math:`F_{1}, \ldots, F_{k}` provided
+        as optional positional arguments in the ``formulae`` parameter given
+        the NamedState object :math:`(\sigma;\\rho)` in the ``named_state``
+        parameter and VariableAssignment object :math:`\chi` in the ``X``
+        parameter w.r.t. the AttributeInterpretation object :math:`I`; the
+        result is the same as calling ``assign_truth_value`` on each Formula
+        object.
+
+        Rather than enumerating the valuations of the basis of each Formula
+        object separately, the Formula objects are grouped by identical bases
+        (i.e., the same set of attribute-object pairs) and the valuations of
+        the basis of each group are enumerated once; each valuation is
+        evaluated for every Formula object of the group whose truth value is
+        not yet known to be **unknown**. Formula objects whose bases merely
+        overlap are not grouped, as enumerating the product of the union of
+        their bases may cost far more than enumerating each basis.
+
+        :param formulae: Any amount of Formula objects \
+        :math:`F_{1}, \ldots, F_{k}`.
+        :type  formulae: Formula
+
+        :return: The truth value of each Formula object, in order.
+        :rtype: ``list``
+
+        :raises TypeError: ``attribute_interpretation`` parameter must be an \
+        AttributeInterpretation object, ``named_state`` parameter must be a \
+        NamedState (or World) object, ``X`` parameter must be a \
+        VariableAssignment object and every optional positional argument \
+        must be a Formula object.
+        :raises ValueError: See ``assign_truth_value``.
+        """
 
         if not hasattr(attribute_interpretation,
                        "_is_AttributeInterpretation"):
@@ -296,7 +503,8 @@ class Formula(object):
                 "attribute_interpretation parameter must an "
                 "AttributeInterpretation object")
 
-        if not hasattr(named_state, "_is_NamedState"):
+        if not hasattr(named_state, "_is_NamedState") and \
+                not hasattr(named_state, "_is_World"):
             raise TypeError(
                 "named_state parameter must be a NamedState object")
 
@@ -304,66 +512,342 @@ class Formula(object):
             raise TypeError(
                 "X parameter must be a VariableAssignment object")
 
-        if self._vocabulary == attribute_interpretation._vocabulary == \
-                named_state._p._vocabulary == X._vocabulary:
-            pass
-        else:
-            raise ValueError(
-                "Vocabulry's of Formula, AttributeInterpretation, NamedState, "
-                "and VariableAssignment must match")
+        for formula in formulae:
+            if not hasattr(formula, "_is_Formula"):
+                raise TypeError(
+                    "All positional arguments provided in formulae must be "
+                    "Formula objects.")
 
-        # name should always be in interpretation table
-        for entry in attribute_interpretation:
-            if entry[0]._name == self._name:
-                R_I = entry
-                break
-        else:
-            raise ValueError(self._name + " must be in intepretation table")
+        def get_key(formula):
+            """Return a key distinguishing Formulae by the order of terms."""
+            return (id(formula._vocabulary), formula._name,
+                    tuple(formula._terms))
+
+        # Formula equality ignores the order of terms, so truth values are
+        # keyed by get_key
+        truth_values = {}
+        # the truth value cache key of each Formula object to evaluate
+        cache_keys = {}
+        # the Formula objects (with their compiled profiles) of each group,
+        # keyed by the set of ao-pairs of their common basis
+        groups = OrderedDict()
+        for formula in formulae:
+            key = get_key(formula)
+            if key in truth_values:
+                continue
+
+            compiled_profile = formula._get_profile(
+                attribute_interpretation, named_state, X)
+            if compiled_profile is None:
+                truth_values[key] = "unknown"
+                continue
+
+            cache_key = Formula._get_cache_key(
+                compiled_profile[0], compiled_profile[2], named_state, False)
+            truth_value = Formula._lookup_cache(cache_key)
+            if truth_value is not None:
+                truth_values[key] = truth_value
+                continue
+            truth_values[key] = None
+            cache_keys[key] = cache_key
+
+            groups.setdefault(frozenset(compiled_profile[2]), []).append(
+                (formula, compiled_profile))
+
+        from parsers.parser_set import ParserSet
+        parser_set = ParserSet()
+
+        for members in groups.itervalues():
+            basis = []
+            for formula, (relation, relation_args, profile) in members:
+                for ao_pair in profile:
+                    if ao_pair not in basis:
+                        basis.append(ao_pair)
+
+            undecided = []
+            for formula, (relation, relation_args, profile) in members:
+                evaluation = Formula._prepare_evaluation(
+                    relation, relation_args, profile, basis)
+                undecided.append((formula, relation, evaluation, set([])))
+
+            for valuation in named_state.get_projected_valuations(basis):
+                for entry in list(undecided):
+                    formula, relation, evaluation, seen = entry
+                    result = Formula._evaluate_valuation(
+                        relation, evaluation, valuation, parser_set)
+
+                    # once both True and False have been seen, the truth
+                    # value can only be unknown
+                    seen.add(bool(result))
+                    if len(seen) == 2:
+                        truth_values[get_key(formula)] = "unknown"
+                        undecided.remove(entry)
+
+                if not undecided:
+                    break
+
+            for formula, relation, evaluation, seen in undecided:
+                truth_values[get_key(formula)] = \
+                    False if False in seen else True
+
+        for key, cache_key in cache_keys.iteritems():
+            Formula._store_cache(cache_key, truth_values[key])
+
+        return [truth_values[get_key(formula)] for formula in formulae]
+
+    @staticmethod
+    def _get_cache_key(relation, profile, named_state, symbolic):
+        """
+        Return the key of the truth value of a Formula object with the
+        compiled profile in the ``profile`` parameter whose corresponding
+        Relation object is given by the ``relation`` parameter in the truth
+        value cache, given the NamedState (or World) object in the
+        ``named_state`` parameter (see ``assign_truth_value``).
+
+        :return: The key of the truth value or ``None`` if the cache is \
+        disabled.
+        :rtype: ``tuple`` | ``None``
+        """
+
+        if not Formula._cache_size:
+            return None
+
+        return (relation._definition, tuple(profile),
+                named_state.get_fingerprint(profile), bool(symbolic))
+
+    @staticmethod
+    def _lookup_cache(key):
+        """
+        Return the truth value held under the key given by the ``key``
+        parameter in the truth value cache or ``None`` if there is none.
+        """
+
+        if key is None:
+            return None
+
+        with Formula._cache_lock:
+            try:
+                truth_value = Formula._cache.pop(key)
+            except KeyError:
+                Formula._cache_misses += 1
+                return None
+
+            # reinsert to mark key as most recently used
+            Formula._cache[key] = truth_value
+            Formula._cache_hits += 1
+            return truth_value
+
+    @staticmethod
+    def _store_cache(key, truth_value):
+        """
+        Hold the truth value in the ``truth_value`` parameter under the key
+        given by the ``key`` parameter in the truth value cache, evicting the
+        least recently used truth values beyond the size of the cache.
+        """
+
+        if key is None:
+            return
+
+        with Formula._cache_lock:
+            if Formula._cache_size:
+                Formula._cache[key] = truth_value
+                while len(Formula._cache) > Formula._cache_size:
+                    Formula._cache.popitem(last=False)
+
+    @staticmethod
+    def set_cache_size(size):
+        """
+        Set the maximum number of truth values held in the truth value cache
+        of ``assign_truth_value`` and ``assign_truth_values``; the cache also
+        holds the entailments checked by Context objects (see
+        ``Context._entails``). The least recently used truth values are
+        evicted first. The cache is disabled (i.e., of size ``0``) by
+        default.
+
+        :param size: The maximum number of cached truth values; ``0`` \
+        disables the cache.
+        :type  size: ``int``
+
+        :raises TypeError: ``size`` parameter must be an ``int``.
+        :raises ValueError: ``size`` parameter must be non-negative.
+        """
+
+        if type(size) not in [int, long]:
+            raise TypeError("size parameter must be of type int")
+
+        if size < 0:
+            raise ValueError("size parameter must be non-negative")
+
+        with Formula._cache_lock:
+            Formula._cache_size = size
+            while len(Formula._cache) > size:
+                Formula._cache.popitem(last=False)
+
+    @staticmethod
+    def get_cache_info():
+        """
+        Return the statistics of the truth value cache of
+        ``assign_truth_value`` and ``assign_truth_values``.
+
+        :return: A CacheInfo named tuple of the number of cache hits, the \
+        number of cache misses, the maximum size of the cache and the \
+        current size of the cache.
+        :rtype: ``CacheInfo``
+        """
+
+        from parsers.parser_set import CacheInfo
+
+        with Formula._cache_lock:
+            return CacheInfo(Formula._cache_hits, Formula._cache_misses,
+                             Formula._cache_size, len(Formula._cache))
+
+    @staticmethod
+    def clear_cache():
+        """
+        Clear the truth value cache of ``assign_truth_value`` and
+        ``assign_truth_values`` and reset its statistics; use this to
+        invalidate every cached truth value, e.g., after redefining a parser.
+        """
+
+        with Formula._cache_lock:
+            Formula._cache.clear()
+            Formula._cache_hits = 0
+            Formula._cache_misses = 0
+
+    def _get_profile(self, attribute_interpretation, named_state, X):
+        """
+        Find the Relation object corresponding to the calling Formula object
+        in the interpretation table of the AttributeInterpretation object
+        :math:`I` in the ``attribute_interpretation`` parameter and compile
+        the profile of the calling Formula object into attribute-object pairs
+        w.r.t. the ConstantAssignment object :math:`\\rho` of the
+        ``named_state`` parameter and the VariableAssignment object
+        :math:`\chi` in the ``X`` parameter (steps 1 through 3 of
+        ``assign_truth_value``).
+
+        :return: A 3-tuple of the Relation object, the arguments of its \
+        definition and the compiled profile, or ``None`` if some term of the \
+        calling Formula object is in neither :math:`\\rho` nor :math:`\chi`.
+        :rtype: ``tuple`` | ``None``
+
+        :raises ValueError: See ``assign_truth_value``.
+        """
+
+        def get_relation_arguments(definition):
+            """Return the arguments provided in Relation definition."""
+
+            start_paren = definition.find('(')
+            end_paren = definition.find(')')
+
+            arg_string = definition[start_paren + 1:end_paren]
+            return arg_string.split(',')
+
+        # the Vocabulary objects are almost always the same object so check
+        # identity before comparing them
+        vocabulary = self._vocabulary
+        for other in [attribute_interpretation._vocabulary,
+                      named_state._p._vocabulary, X._vocabulary]:
+            if other is not vocabulary and other != vocabulary:
+                raise ValueError(
+                    "Vocabulry's of Formula, AttributeInterpretation, "
+                    "NamedState, and VariableAssignment must match")
+
+        subscript, template = self._get_template(attribute_interpretation)
 
         p = named_state._p
-        profile = list(R_I[3])
-        terms = self._terms
         relation = named_state._attribute_system._attribute_structure[
-            int(R_I[2][1:])]
+            subscript]
 
-        if len(profile) != len(relation._DR):
+        if len(template) != len(relation._DR):
             raise ValueError(
                 "number of profile pairs must be equal to the number "
                 "of arguments the relation takes")
 
-        # compiling profile into attribute object pairs that will be
-        # substituted into the expression
+        # Replace Vocabulary C and V's with their respective objects
+        # according to p and X
+        profile = []
+        for label, term in template:
+            try:
+                obj = p._mapping[term]
+            except KeyError:
+                try:
+                    obj = X._mapping[term]
+                except KeyError:
+                    return None
+
+            profile.append((label, obj))
+
+        relation_args = get_relation_arguments(relation._definition)
+
+        return relation, relation_args, profile
+
+    def _get_template(self, attribute_interpretation):
+        """
+        Return the subscript of the Relation object corresponding to the
+        calling Formula object in the interpretation table of the
+        AttributeInterpretation object :math:`I` in the
+        ``attribute_interpretation`` parameter along with the profile
+        template of the calling Formula object, i.e., its profile with the
+        index of each pair replaced by the corresponding term (steps 1 and 2
+        of ``assign_truth_value``). The result is cached for the last
+        AttributeInterpretation object used.
+
+        :return: A 2-tuple of the subscript of the Relation object and the \
+        list of label-term pairs of the profile template.
+        :rtype: ``tuple``
+
+        :raises ValueError: The calling Formula object must match an entry \
+        in the interpretation table of :math:`I` and every index of the \
+        profile must correspond to a term of the calling Formula object.
+        """
+
+        if self._template is not None and \
+                self._template[0] is attribute_interpretation:
+            return self._template[1:]
+
+        # name should always be in interpretation table
+        try:
+            R_I = attribute_interpretation.get_entry(self._name)
+        except KeyError:
+            raise ValueError(self._name + " must be in intepretation table")
+
+        terms = self._terms
 
         # check if each index is valid in respect to list of terms
         # i.e., j_x has corresponding (t^{p,X})_{j_x}
-        for index in [pair[1] for pair in profile]:
+        for index in [pair[1] for pair in R_I[3]]:
             if index > len(terms):
                 raise ValueError(
                     "each index corresponds to an index in formula's terms "
                     "list; indicies may not exceed the amount of terms")
 
-        profile_copy = [pr for pr in profile]
-
         # for each pair in profile grab formula term corresponding to the
         # pair's index; shifted down 1 as indexing starts at 0 and not 1 then
         # rewrite that pair with the corresponding term instead of index
-        profile = map(lambda pair: (pair[0], terms[pair[1] - 1]), profile)
+        template = [(pair[0], terms[pair[1] - 1]) for pair in R_I[3]]
 
-        # Replace Vocabulary C and V's with their respective objects
-        # according to p and X
-        for i, pair in enumerate(profile):
-            try:
-                obj = p._mapping[pair[1]]
-            except KeyError:
-                try:
-                    obj = X._mapping[pair[1]]
-                except KeyError:
-                    return "unknown"
+        self._template = (attribute_interpretation, int(R_I[2][1:]), template)
+        return self._template[1:]
 
-            profile[i] = (pair[0], obj)
+    @staticmethod
+    def _prepare_evaluation(relation, relation_args, profile, basis):
+        """
+        Prepare the evaluation of the definition of the Relation object in
+        the ``relation`` parameter for valuations of the attribute-object
+        pairs in ``basis``; the i-th argument in ``relation_args`` takes the
+        value of the i-th attribute-object pair in ``profile``.
+
+        :return: A 4-tuple of the compiled definition of ``relation``, the \
+        position in ``basis`` of the value of each argument of the definition \
+        (in order), the arguments sorted longest first and the position in \
+        ``basis`` of the value of each sorted argument.
+        :rtype: ``tuple``
+        """
 
-        relation_args = get_relation_arguments(relation._definition)
-        worlds = named_state.get_worlds()
+        # the compiled definition takes the values of the arguments of the
+        # definition in order, i.e., in the order of the profile
+        evaluator = relation.get_evaluator()
+        arg_positions = [basis.index(ao_pair) for ao_pair in profile]
 
         # sort by longest arguments firsts so we can ensure unambiguous
         # replacement when swapping in the valuations associated with the
@@ -372,50 +856,225 @@ class Formula(object):
             list(t) for t in zip(*sorted(zip(relation_args, profile),
                                  key=lambda x: len(x[0]),
                                  reverse=True)))
+        positions = [basis.index(ao_pair) for ao_pair in profile]
 
-        # we now check the formula against each possible world within the state
-        # First, create a ParserSet object so we can attempt parsing of formula
-        from parsers.parser_set import ParserSet
-        parser_set = ParserSet()
+        return evaluator, arg_positions, relation_args, positions
 
-        truth_values = []
-        for world in worlds:
-            # break reference from Relation
-            definition = str(relation._definition)
-
-            # zip arguments in Relation and valuations together
-            valuations = [
-                world._ascriptions[ao_pair] for ao_pair in profile]
-            substitutions = zip(relation_args, valuations)
-
-            for substitution in substitutions:
-                pattern, valueset = substitution
-                # we're swapping in a valuation valueset so just shed
-                # the prefix 'V(' and suffix ')'
-                value = str(valueset)[2:-1]
-                definition = definition.replace(pattern, value)
-
-            # trim the LHS of the definition to make evaluatable expression
-            expression = definition[definition.find(" <=> ") + 5:]
-
-            # Try each parser in ParserSet; raise ValueError if no parser
-            # can successfully parse formula
-            for parser in parser_set:
-                try:
-                    result = parser(expression)
-                    truth_values.append(result)
-                    break
-                except:
-                    pass
+    @staticmethod
+    def _evaluate_valuation(relation, evaluation, valuation, parser_set):
+        """
+        Evaluate the definition of the Relation object in the ``relation``
+        parameter for the valuation of the basis in the ``valuation``
+        parameter using the result of ``Formula._prepare_evaluation`` in the
+        ``evaluation`` parameter (steps 5 and 6 of ``assign_truth_value``).
+
+        :return: The result of evaluating the definition.
+
+        :raises ValueError: Some parser in the ParserSet object in the \
+        ``parser_set`` parameter must be able to evaluate the expression.
+        """
+
+        evaluator, arg_positions, relation_args, positions = evaluation
+
+        if evaluator is not None:
+            try:
+                return evaluator(
+                    *[valuation[position] for position in arg_positions])
+            except (ArithmeticError, TypeError, ValueError):
+                pass
+
+        # break reference from Relation
+        definition = str(relation._definition)
+
+        # zip arguments in Relation and valuations together
+        values = [str(valuation[position]) for position in positions]
+        substitutions = zip(relation_args, values)
+
+        for substitution in substitutions:
+            pattern, value = substitution
+            definition = definition.replace(pattern, value)
+
+        # trim the LHS of the definition to make evaluatable expression
+        expression = definition[definition.find(" <=> ") + 5:]
+
+        # Let the ParserSet evaluate the expression; raises ValueError if
+        # no parser can successfully parse formula
+        return parser_set.evaluate(expression, relation)
+
+    @staticmethod
+    def _assign_vectorized_truth_value(relation, arg_positions, basis,
+                                       named_state):
+        """
+        Assign a truth value to the definition of the Relation object in the
+        ``relation`` parameter over every valuation of the attribute-object
+        pairs in ``basis`` by evaluating the vectorized definition over NumPy
+        arrays of the valuations, ``Formula._chunk_size`` valuations at a
+        time.
+
+        :return: A truth value in the set \
+        :math:`\{\\textbf{true}, \\textbf{false}, \\textbf{unknown}\}` \
+        or ``None`` if the definition cannot be evaluated this way.
+        :rtype: ``bool`` | ``str`` | ``None``
+        """
+
+        evaluator = relation.get_evaluator(vectorized=True)
+        if evaluator is None:
+            return None
+
+        import numpy
+
+        labels, valuesets = named_state._discretize_ascriptions(basis)
+        arrays = []
+        for valueset in valuesets:
+            array = Formula._get_value_array(valueset)
+            if array is None:
+                return None
+            arrays.append(array)
+
+        shape = tuple(len(valueset) for valueset in valuesets)
+        count = 1
+        for length in shape:
+            count *= length
+
+        seen = set([])
+        start = 0
+        while start < count:
+            stop = min(start + Formula._chunk_size, count)
+            # the i-th array of indices holds the index into the i-th
+            # discretized ValueSet of each valuation of the chunk
+            indices = numpy.unravel_index(numpy.arange(start, stop), shape)
+            try:
+                results = evaluator(*[arrays[i][indices[i]]
+                                      for i in arg_positions])
+            except (ArithmeticError, TypeError, ValueError):
+                return None
+
+            results = numpy.asarray(results, dtype=bool)
+            if results.shape != (stop - start,):
+                return None
+
+            if results.all():
+                seen.add(True)
+            elif not results.any():
+                seen.add(False)
             else:
-                raise ValueError("Unable to parse formula")
+                return "unknown"
 
-        if all(truth_values):
-            return True
-        elif not any(truth_values):
+            if len(seen) == 2:
+                return "unknown"
+            start = stop
+
+        if False in seen:
             return False
         else:
-            return "unknown"
+            return True
+
+    @staticmethod
+    def _get_value_array(values):
+        """
+        Return the values in the ``values`` parameter as a NumPy array for
+        ``Formula._assign_vectorized_truth_value``: an array of numbers if
+        every value is an ``int``, ``float`` or ``long``, an array of rows of
+        coordinates if every value is a Point object and an array of rows of
+        pairs of endpoints if every value is a LineSegment object (the Point
+        and LineSegment objects must all be non-generic and of the same
+        dimension).
+
+        :return: The array of values or ``None`` if the values cannot be \
+        held in an array this way.
+        :rtype: ``numpy.ndarray`` | ``None``
+        """
+
+        import numpy
+
+        if all([type(value) in [int, float, long] for value in values]):
+            return numpy.array(list(values), dtype=float)
+
+        if all([hasattr(value, "_is_Point") for value in values]):
+            rows = [value._coordinate for value in values]
+        elif all([hasattr(value, "_is_LineSegment") for value in values]):
+            rows = [(value._start_point._coordinate,
+                     value._end_point._coordinate) for value in values]
+        else:
+            return None
+
+        if not values or any([value._is_generic for value in values]) or \
+                len(set([value._dimension for value in values])) != 1:
+            return None
+
+        return numpy.array(rows, dtype=float)
+
+    @staticmethod
+    def _assign_interval_truth_value(relation, relation_args, profile, basis,
+                                     named_state):
+        """
+        Assign a truth value to the definition of the Relation object in the
+        ``relation`` parameter over the ValueSets of the attribute-object
+        pairs in ``basis`` using interval arithmetic; one box is evaluated
+        for each combination of elements of the ValueSets.
+
+        A truth value of **true** or **false** holds over every real point
+        of each box and thus over every discretized value, so it agrees with
+        enumeration. Interval arithmetic treats float Intervals as continuous
+        however, and it overestimates expressions in which a variable occurs
+        more than once (e.g., ``h1 - h1``) over a float Interval that cannot
+        be split down to single values; a truth value of **unknown** over a
+        float Interval may therefore disagree with the discretized values,
+        so ``None`` is returned for the truth value to be determined by
+        enumeration instead.
+
+        :return: A truth value in the set \
+        :math:`\{\\textbf{true}, \\textbf{false}, \\textbf{unknown}\}` \
+        or ``None`` if the definition cannot be evaluated symbolically.
+        :rtype: ``bool`` | ``str`` | ``None``
+        """
+
+        from itertools import product
+        from pyparsing import ParseBaseException
+        from parsers.truth_value_parser import TruthValueParser
+
+        # TruthValueParser objects hold no parse state so one is shared
+        if Formula._interval_parser is None:
+            Formula._interval_parser = TruthValueParser()
+        parser = Formula._interval_parser
+
+        elements = []
+        has_float_interval = False
+        for ao_pair in basis:
+            valueset = named_state._ascriptions[ao_pair]
+            for value in valueset:
+                if hasattr(value, "_is_Interval"):
+                    has_float_interval |= value._type is float
+                elif type(value) not in [int, float, long]:
+                    return None
+            elements.append(list(valueset))
+
+        # each argument of the definition ranges over the values of the
+        # ao-pair it's zipped with in the profile
+        variables = {arg.strip(): basis.index(ao_pair)
+                     for arg, ao_pair in zip(relation_args, profile)}
+        definition = relation._definition
+        expression = definition[definition.find(" <=> ") + 5:]
+
+        seen = set([])
+        for box in product(*elements):
+            try:
+                truth_value = parser.evaluate_intervals(
+                    expression, dict(enumerate(box)), variables)
+            except (ParseBaseException, ArithmeticError, IndexError, KeyError,
+                    TypeError, ValueError):
+                return None
+
+            if truth_value == "unknown":
+                return None if has_float_interval else "unknown"
+            seen.add(truth_value)
+            if len(seen) == 2:
+                return "unknown"
+
+        if not seen:
+            return None
+
+        return seen.pop()
 
     @staticmethod
     def get_basis(constant_assignment, variable_assignment,
@@ -487,19 +1146,9 @@ class Formula(object):
                     "All positional arguments provided in formulae must be "
                     "Formula objects.")
 
-            # name should always be in interpretation table
-            for entry in attribute_interpretation:
-                if entry[0]._name == formula._name:
-                    R_I = entry
-                    break
-            else:
-                raise ValueError(
-                    formula._name + " must be in intepretation table")
-
-            profile = list(R_I[3])
-            terms = formula._terms
-
-            profile = map(lambda pair: (pair[0], terms[pair[1] - 1]), profile)
+            subscript, profile = formula._get_template(
+                attribute_interpretation)
+            profile = list(profile)
 
             # Replace Vocabulary C and V's with their respective objects
             # according to p and X
@@ -268,13 +268,10 @@ def sentential_to_sentential(context, F1, F2, G, attribute_interpretation,
             context._named_state._p._vocabulary,
             context._named_state._attribute_system, {}, dummy=True)
 
-    F1_holds = F1.assign_truth_value(attribute_interpretation,
-                                     context._named_state,
-                                     variable_assignment)
-
-    F2_holds = F2.assign_truth_value(attribute_interpretation,
-                                     context._named_state,
-                                     variable_assignment)
+    F1_holds, F2_holds = Formula.assign_truth_values(attribute_interpretation,
+                                                     context._named_state,
+                                                     variable_assignment,
+                                                     F1, F2)
 
     if F1_holds is not True and F2_holds is not True:
         raise ValueError("disjunction F1 OR F2 does not hold")
@@ -492,13 +489,10 @@ def sentential_to_diagrammatic(context, F1, F2, named_state,
             context._named_state._p._vocabulary,
             context._named_state._attribute_system, {}, dummy=True)
 
-    F1_holds = F1.assign_truth_value(attribute_interpretation,
-                                     context._named_state,
-                                     variable_assignment)
-
-    F2_holds = F2.assign_truth_value(attribute_interpretation,
-                                     context._named_state,
-                                     variable_assignment)
+    F1_holds, F2_holds = Formula.assign_truth_values(attribute_interpretation,
+                                                     context._named_state,
+                                                     variable_assignment,
+                                                     F1, F2)
 
     if F1_holds is not True and F2_holds is not True:
         raise ValueError("disjunction F1 OR F2 does not hold")
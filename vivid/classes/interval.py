@@ -241,19 +241,61 @@ class Interval(object):
         ``1.0`` and ``1`` for int, float, and long Intervals respectively.
         :type  jump: None|int|float|long
 
-        :return: A list of discrete values contained in the calling Interval \
-        with a step size of ``jump``\.
-        :rtype: ``list``
+        :return: A lazy sequence of the discrete values contained in the \
+        calling Interval with a step size of ``jump``\.
+        :rtype: DiscreteRange
+
+        :raises TypeError: If a jump is provided, it must be an ``int``, \
+        ``float``, or ``long`` and match the type of the calling Interval.
+        """
+
+        jump = self._get_jump(jump)
+
+        return DiscreteRange(
+            self._infimum, jump, self.count_values(jump))
+
+    def count_values(self, jump=None):
+        """
+        Return the number of values within the range of the calling interval,
+        i.e., the length of the list ``discretize`` would return, without
+        discretizing the calling Interval.
+
+        :param jump: The jump to use after each value. Defaults to ``1``, \
+        ``1.0`` and ``1`` for int, float, and long Intervals respectively.
+        :type  jump: None|int|float|long
+
+        :return: The number of discrete values contained in the calling \
+        Interval with a step size of ``jump``\.
+        :rtype: ``int`` | ``long``
 
         :raises TypeError: If a jump is provided, it must be an ``int``, \
         ``float``, or ``long`` and match the type of the calling Interval.
         """
 
-        def frange(x, y, jump):
-                """Get value in an inclusive range with step size of jump."""
-                while x <= y:
-                    yield x
-                    x += jump
+        jump = self._get_jump(jump)
+
+        from math import floor
+        count = int(floor((self._supremum - self._infimum) / jump)) + 1
+
+        # the division may round either way for floats; recompute the count
+        # from the values themselves (the value at index i being
+        # infimum + i * jump, see DiscreteRange) so none exceeds the supremum
+        while count > 1 and \
+                self._infimum + (count - 1) * jump > self._supremum:
+            count -= 1
+        while self._infimum + count * jump <= self._supremum:
+            count += 1
+
+        return count
+
+    def _get_jump(self, jump):
+        """
+        Validate the jump provided for the discretization of the calling
+        Interval or return the default jump if none is provided.
+
+        :raises TypeError: If a jump is provided, it must be an ``int``, \
+        ``float``, or ``long`` and match the type of the calling Interval.
+        """
 
         # if jump is provided, check if it's compatible with the calling Interval
         if jump:
@@ -273,7 +315,7 @@ class Interval(object):
             else:
                 jump = 1L
 
-        return [i for i in frange(self._infimum, self._supremum, jump)]
+        return jump
 
     def __str__(self):
         """
@@ -304,26 +346,6 @@ class Interval(object):
         containing only Interval objects.
         """
 
-        def can_collapse(lis):
-            """Try to collapse some 2 Interval's returning True on success."""
-            for i, interval_i in enumerate(lis):
-                for j, interval_j in enumerate(lis):
-                    # ignore when we're looking at the same Interval
-                    if i == j:
-                        continue
-                    # if Interval i is subsumed by Interval j, get rid of it
-                    if interval_i in interval_j:
-                        lis.remove(interval_i)
-                        return True
-                    # if Intervals overlap, add them and remove old Intervals
-                    elif interval_i <= interval_j:
-                        lis.append(interval_i | interval_j)
-                        lis.remove(interval_i)
-                        lis.remove(interval_j)
-                        return True
-
-            return False
-
         if not isinstance(intervals, list):
             raise TypeError("intervals must be a list")
 
@@ -332,16 +354,180 @@ class Interval(object):
             raise TypeError(
                 "Only Intervals objects can be collapsed.")
 
-        # split intervals by type
-        int_intervals = [i for i in intervals if i._type == int]
-        float_intervals = [i for i in intervals if i._type == float]
-        long_intervals = [i for i in intervals if i._type == long]
-
-        # collapse Intervals for as long as posible
-        while can_collapse(int_intervals): pass
-        while can_collapse(float_intervals): pass
-        while can_collapse(long_intervals): pass
+        # collapse the Intervals of each type in a single sweep
+        output = []
+        for interval_type in [int, float, long]:
+            typed_intervals = [i for i in intervals
+                               if i._type == interval_type]
+            output += Interval._sweep(typed_intervals, [], 0)[0]
 
-        # recombine and send back
-        output = int_intervals + float_intervals + long_intervals
         return output
+
+    @staticmethod
+    def _sweep(intervals, values, diff):
+        """
+        Merge Intervals of a single type together with values of the same
+        type in one pass over their sorted bounds. Intervals that overlap or
+        are at most ``diff`` apart are merged, values contained in an
+        Interval or at most ``diff`` away from one are absorbed into it and
+        every other value is kept as is.
+
+        :param intervals: The Intervals to merge.
+        :type  intervals: list
+        :param values: The values to absorb into ``intervals``.
+        :type  values: list
+        :param diff: The largest gap to bridge between two consecutive \
+        bounds, i.e., ``1`` (or ``1L``) for discrete Intervals and ``0`` to \
+        only merge overlapping ones.
+        :type  diff: int|float|long
+
+        :return: A 2-tuple of the sorted, disjoint Intervals and the sorted \
+        values not absorbed by any of them.
+        :rtype: ``tuple``
+        """
+
+        bounds = [(i._infimum, i._supremum, True) for i in intervals]
+        bounds += [(value, value, False) for value in values]
+        bounds.sort()
+
+        merged, remaining = [], []
+
+        def close(inf, sup, has_interval, run_values):
+            """Close a run of consecutive bounds."""
+            if has_interval:
+                merged.append(Interval(inf, sup))
+            else:
+                remaining.extend(run_values)
+
+        # each run is [infimum, supremum, contains an Interval, values]
+        run = None
+        for inf, sup, is_interval in bounds:
+            if run and inf <= run[1] + diff:
+                run[1] = max(run[1], sup)
+                run[2] = run[2] or is_interval
+                if not is_interval:
+                    run[3].append(inf)
+            else:
+                if run:
+                    close(*run)
+                run = [inf, sup, is_interval, [] if is_interval else [inf]]
+        if run:
+            close(*run)
+
+        return merged, remaining
+
+
+class DiscreteRange(object):
+    """
+    DiscreteRange class. A lazy, sized and indexable sequence of the
+    discrete values of an Interval, i.e., :math:`start + i \cdot jump` for
+    :math:`i \in \{0, \ldots, n-1\}`; values are computed when accessed so
+    no list of them is ever built.
+
+    :ivar start: The first value of the DiscreteRange.
+    :ivar jump: The step between consecutive values.
+    :ivar length: The number of values :math:`n` in the DiscreteRange.
+    """
+
+    def __init__(self, start, jump, length):
+        """
+        Construct a DiscreteRange object.
+
+        :param start: The first value of the DiscreteRange.
+        :type  start: int|float|long
+        :param jump: The step between consecutive values.
+        :type  jump: int|float|long
+        :param length: The number of values in the DiscreteRange.
+        :type  length: int|long
+        """
+
+        self._start = start
+        self._jump = jump
+        self._length = length
+
+    def __len__(self):
+        """Return the number of values in the DiscreteRange object."""
+        return self._length
+
+    def __getitem__(self, index):
+        """
+        Retrieve the value at the index given by ``index`` parameter
+        (e.g. ``DiscreteRange[index]``); negative indices count from the end
+        and slices return a ``list``.
+
+        :raises IndexError: ``index`` must be in :math:`\{-n, \ldots, n-1\}`.
+        :raises TypeError: ``index`` must be an ``int``, ``long`` or slice.
+        """
+
+        if isinstance(index, slice):
+            return [self[i] for i in xrange(*index.indices(self._length))]
+        if type(index) not in [int, long]:
+            raise TypeError("indices must be of type int")
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Invalid index: " + str(index))
+        return self._start + index * self._jump
+
+    def __iter__(self):
+        """Provide an iterator for DiscreteRange objects."""
+        for index in xrange(self._length):
+            yield self._start + index * self._jump
+
+    def __contains__(self, value):
+        """
+        Determine if a value is in the DiscreteRange object, i.e., if it
+        equals some value of the DiscreteRange object as for a ``list`` of
+        its values (e.g., ``3.0`` and ``3L`` are in the discretization of
+        ``Interval(0, 5)``); numbers are looked up by their position rather
+        than by scanning the values.
+        """
+
+        if not isinstance(value, (int, long, float)):
+            return any(v == value for v in self)
+
+        try:
+            index = int(round((value - self._start) / float(self._jump)))
+        except (OverflowError, ValueError):
+            # value is infinite or not a number
+            return False
+
+        # check the neighbours of index in case of rounding error
+        for i in xrange(max(index - 1, 0), min(index + 2, self._length)):
+            if self[i] == value:
+                return True
+        return False
+
+    def __eq__(self, other):
+        """
+        Determine if the DiscreteRange object holds the same values in the
+        same order as a sequence via the ``==`` operator.
+        """
+
+        from itertools import izip
+        try:
+            if len(self) != len(other):
+                return False
+        except TypeError:
+            return False
+        return all(a == b for a, b in izip(self, other))
+
+    def __ne__(self, other):
+        """
+        Determine if the DiscreteRange object and a sequence differ via the
+        ``!=`` operator.
+        """
+
+        return not self.__eq__(other)
+
+    def __str__(self):
+        """
+        Return a readable string representation of the DiscreteRange object.
+        """
+
+        return "DR(" + str(self._start) + ", " + str(self._jump) + ", " + \
+            str(self._length) + ")"
+
+    def __repr__(self):
+        """Return a string representation of the DiscreteRange object."""
+        return self.__str__()
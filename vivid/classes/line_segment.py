@@ -248,6 +248,48 @@ class LineSegment(object):
 
         return point.meets(line_1[0], line_1[1], line_2[0], line_2[1])
 
+    @staticmethod
+    def batch_meets(points, lines_1, lines_2):
+        """
+        Determine, for a batch of points and pairs of line segments given as
+        NumPy arrays of coordinates, whether each pair of line segments meets
+        at the corresponding point; the batch counterpart of ``meets`` (see
+        ``Point.batch_is_on``). Requires NumPy.
+
+        :param points: The coordinates of the points.
+        :type  points: ``numpy.ndarray``
+        :param lines_1: The coordinates of the endpoints of the first line \
+        segment of each pair; an array with one more axis than ``points``, \
+        the second to last of which holds the two endpoints.
+        :type  lines_1: ``numpy.ndarray``
+        :param lines_2: The coordinates of the endpoints of the second line \
+        segment of each pair.
+        :type  lines_2: ``numpy.ndarray``
+
+        :return: A boolean array of whether or not each pair of line \
+        segments meets at its point.
+        :rtype: ``numpy.ndarray``
+
+        :raises ImportError: NumPy must be installed.
+        :raises ValueError: See ``Point.batch_is_on``.
+        """
+
+        import numpy
+
+        points = numpy.asarray(points, dtype=float)
+        lines_1 = numpy.asarray(lines_1, dtype=float)
+        lines_2 = numpy.asarray(lines_2, dtype=float)
+
+        for lines in [lines_1, lines_2]:
+            if lines.ndim != points.ndim + 1 or lines.shape[-2] != 2:
+                raise ValueError(
+                    "arrays of line segments must hold two endpoints in "
+                    "place of each point")
+
+        return Point.batch_meets(points,
+                                 lines_1[..., 0, :], lines_1[..., 1, :],
+                                 lines_2[..., 0, :], lines_2[..., 1, :])
+
     @staticmethod
     def unstringify(line_segment_string):
         """
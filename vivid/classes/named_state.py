@@ -58,11 +58,10 @@ class NamedState(State):
                 "ConstantAssignment AttributeSystem and "
                 "State AttributeSystem must match")
 
-        from copy import deepcopy
         State.__init__(self, attribute_system, ascriptions)
-        self._p = deepcopy(p)
-        # reassign vocabulary to keep reference since Vocabulary's are mutable
-        self._p._vocabulary = p._vocabulary
+        # the ConstantAssignment shares this NamedState's copy of the
+        # AttributeSystem and keeps the reference to the (mutable) Vocabulary
+        self._p = p._derive(attribute_system=self._attribute_system)
         self._is_NamedState = True
 
     def __eq__(self, other):
@@ -90,15 +89,12 @@ class NamedState(State):
         """
         Deepcopy a NamedState object via the ``copy.deepcopy`` method.
         This does not break the reference to the underlying Vocabulary object
-        :math:`\Sigma`.
+        :math:`\Sigma`; the (immutable) ascriptions are shared with the copy.
         """
 
-        from copy import deepcopy
-
-        return NamedState(
-            deepcopy(self._attribute_system),
-            deepcopy(self._p),
-            deepcopy(self._ascriptions))
+        named_state_copy = NamedState(self._attribute_system, self._p)
+        named_state_copy._ascriptions = dict(self._ascriptions)
+        return named_state_copy
 
     def __le__(self, other):
         """
@@ -121,17 +117,39 @@ class NamedState(State):
         if not same_attr_systems or not same_vocabularies:
             return False
 
-        self_state = State(self._attribute_system, self._ascriptions)
-        other_state = State(other._attribute_system, other._ascriptions)
-
         # if this State is an extension of other State or this
         # ConstantAssignment is a superset of other ConstantAssignment,
         # this NamedState is an extension of other NamedState
-        if self_state <= other_state and self._p >= other._p:
+        if State.__le__(self, other) and self._p >= other._p:
             return True
         else:
             return False
 
+    def _derive(self, ascriptions={}, p=None):
+        """
+        Return a NamedState object derived from the calling NamedState object
+        that shares its AttributeSystem object :math:`\mathcal{S}` and its
+        ascriptions by reference (copy-on-write); see ``State._derive``.
+
+        :param ascriptions: Already validated FrozenValueSet objects to \
+        ascribe to attribute-object pairs of the derived NamedState object in \
+        place of those of the calling NamedState object.
+        :type  ascriptions: ``dict``
+        :param p: An optional ConstantAssignment object over the same \
+        AttributeSystem object :math:`\mathcal{S}` to use in place of the \
+        calling NamedState object's ConstantAssignment object :math:`\rho`.
+        :type  p: ConstantAssignment | ``None``
+
+        :return: The derived NamedState object.
+        :rtype: NamedState
+        """
+
+        derived = object.__new__(NamedState)
+        self._share(derived, ascriptions)
+        derived._p = self._p if p is None else p
+        derived._is_NamedState = True
+        return derived
+
     def add_object(self, obj, ascriptions=None, constant_symbol=None):
         """
         Add an object :math:`s^{\prime}` to the calling NamedState object's
@@ -177,16 +195,16 @@ class NamedState(State):
 
             # Add object, then add mapping so any errors happen before mutation
             State.add_object(self, obj, ascriptions)
-            self._p._attribute_system._objects = sorted(
-                self._p._attribute_system._objects + [obj])
+            # the ConstantAssignment may be shared with other NamedStates, so
+            # derive a new one over the extended AttributeSystem
+            self._p = self._p._derive(attribute_system=self._attribute_system)
 
             self._p._mapping[constant_symbol] = obj
             self._p._source.append(constant_symbol)
             self._p._target.append(obj)
         else:
             State.add_object(self, obj, ascriptions)
-            self._p._attribute_system._objects = sorted(
-                self._p._attribute_system._objects + [obj])
+            self._p = self._p._derive(attribute_system=self._attribute_system)
 
     def is_world(self):
         """
@@ -202,57 +220,500 @@ class NamedState(State):
         # if state is a world and p is total, this NamedState is a world
         return State.is_world(self) and self._p.is_total()
 
-    def get_worlds(self):
+    def get_worlds(self, compact=False, reduce_symmetry=False,
+                   named_states=()):
         """
         Return a generator for the generation of all possible worlds
         :math:`(w;\widehat{\\rho})` derivable from the calling NamedState
         object.
 
+        When ``reduce_symmetry`` is ``True``, only one total
+        ConstantAssignment :math:`\widehat{\\rho}` is generated per orbit of
+        the interchangeable objects of the calling NamedState object (see
+        ``_get_interchangeable_objects``), i.e., constant assignments that
+        only differ by a permutation of interchangeable objects are generated
+        once. Every world left out is then the image of a generated world
+        under such a permutation, so properties invariant under the
+        permutation of interchangeable objects (e.g., entailment) are
+        unaffected.
+
+        :param compact: Whether or not to generate World objects (i.e., \
+        lightweight views sharing the AttributeSystem, ConstantAssignment \
+        and discretized values of the calling NamedState object) instead of \
+        full NamedState objects.
+        :type  compact: ``bool``
+        :param reduce_symmetry: Whether or not to generate a single \
+        representative world per orbit of interchangeable objects.
+        :type  reduce_symmetry: ``bool``
+        :param named_states: Other NamedState objects which must not \
+        distinguish interchangeable objects either (e.g., a NamedState object \
+        whose entailment is being checked).
+        :type  named_states: ``list``
+
+        :return: A generator for the generation of all possible worlds \
+        :math:`(w;\widehat{\\rho})` derivable from this NamedState object.
+        :rtype: ``generator``
+
+        :raises WorldBudgetExceededError: The number of worlds derivable \
+        from the calling NamedState object must not exceed the world budget.
+        """
+
+        # check the budget here rather than in a generator so that an
+        # oversized NamedState raises when get_worlds is called, not on the
+        # first call to next
+        State._check_world_budget(
+            self.count_worlds(reduce_symmetry, named_states))
+
+        classes = None
+        if reduce_symmetry:
+            classes = self._get_interchangeable_objects(*named_states)
+
+        if compact:
+            return self._generate_compact_worlds(classes)
+
+        return self._generate_worlds(classes)
+
+    def _generate_worlds(self, classes=None):
+        """
+        Return a generator for the generation of all possible worlds
+        :math:`(w;\widehat{\\rho})` derivable from the calling NamedState
+        object as NamedState objects without checking the world budget (see
+        ``get_worlds``).
+
+        :param classes: The classes of interchangeable objects to generate a \
+        single representative ConstantAssignment for (see \
+        ``_get_interchangeable_objects``), or ``None`` to generate every \
+        ConstantAssignment.
+        :type  classes: ``list`` | ``None``
+
         :return: A generator for the generation of all possible worlds \
         :math:`(w;\widehat{\\rho})` derivable from this NamedState object.
         :rtype: ``generator``
         """
 
         if self.is_world():
-            from copy import deepcopy
-            yield deepcopy(self)
+            yield self._derive()
         else:
-            C = self._p._vocabulary._C
-            bound_constants = self._p._source
-            unbound_constants = [c for c in C if c not in bound_constants]
+            # regenerate the worlds of the State for each ConstantAssignment
+            # as they're produced lazily; nothing is held beyond the current
+            # world. Every world shares this NamedState's AttributeSystem.
+            for p in self._generate_constant_assignments(classes):
+                for self_world in State._generate_worlds(self):
+                    yield self._derive(self_world._ascriptions, p)
+
+    def count_worlds(self, reduce_symmetry=False, named_states=()):
+        """
+        Return the number of worlds :math:`(w;\widehat{\\rho})` derivable
+        from the calling NamedState object, i.e., the number of worlds
+        derivable from its State multiplied by the number of total
+        ConstantAssignment objects :math:`\widehat{\\rho}` extending
+        :math:`\\rho`, without enumerating any worlds.
+
+        :param reduce_symmetry: Whether or not to count a single \
+        representative world per orbit of interchangeable objects (see \
+        ``get_worlds``).
+        :type  reduce_symmetry: ``bool``
+        :param named_states: Other NamedState objects which must not \
+        distinguish interchangeable objects either.
+        :type  named_states: ``list``
+
+        :return: The number of worlds derivable from the calling NamedState \
+        object.
+        :rtype: ``int`` | ``long``
+        """
 
-            objects = self._attribute_system._objects
-            bound_objects = self._p._target
-            unbound_objects = [
-                obj for obj in objects if obj not in bound_objects]
+        if self._p.is_total():
+            return State.count_worlds(self)
+
+        unbound_constants = len(
+            [c for c in self._p._vocabulary._C if c not in self._p._source])
+        unbound_objects = len(self._attribute_system._objects) - \
+            len(self._p._target)
+        bound = min(unbound_constants, unbound_objects)
+
+        if reduce_symmetry:
+            classes = self._get_interchangeable_objects(*named_states)
+
+            # ways[t] is the number of ways to bind t of the (ordered)
+            # unbound constants to the classes considered so far, where only
+            # the number of constants bound to each class matters
+            choose = NamedState._count_combinations
+            ways = [1] + [0] * bound
+            for cls in classes:
+                new_ways = [0] * (bound + 1)
+                for t in range(bound + 1):
+                    for a in range(min(len(cls), bound - t) + 1):
+                        new_ways[t + a] += ways[t] * choose(
+                            unbound_constants - t, a)
+                ways = new_ways
+            completions = ways[bound]
+        else:
+            completions = NamedState._count_permutations(
+                max(unbound_constants, unbound_objects), bound)
+
+        return State.count_worlds(self) * completions
+
+    def count_variable_assignments(self):
+        """
+        Return the number of VariableAssignment objects :math:`\chi`
+        generated for each world :math:`(w;\widehat{\\rho})` derivable from
+        the calling NamedState object (see
+        ``NamedState._generate_variable_assignments``), without generating any
+        of them. The number of (world, VariableAssignment) pairs checked
+        during entailment is ``count_worlds() * count_variable_assignments()``.
+
+        :return: The number of VariableAssignment objects :math:`\chi` per \
+        world.
+        :rtype: ``int`` | ``long``
+        """
+
+        V = self._p._vocabulary._V
+        if not V:
+            return 1
+
+        unbound_constants = len(
+            [c for c in self._p._vocabulary._C if c not in self._p._source])
+        unbound_objects = len(self._attribute_system._objects) - \
+            len(self._p._target)
+
+        # objects bound by the constants each world binds on top of p
+        unbound_objects -= min(unbound_constants, unbound_objects)
+
+        return NamedState._count_permutations(
+            max(len(V), unbound_objects), min(len(V), unbound_objects))
+
+    def _generate_compact_worlds(self, classes=None, start=0, stop=None):
+        """
+        Generate the World objects derivable from the calling NamedState
+        object (see ``get_worlds``) whose positions in the order of
+        ``get_worlds`` are from ``start`` up to (but not including) ``stop``.
+        The worlds before ``start`` are not generated: the ConstantAssignment
+        objects before that of the first world are counted rather than built
+        (see ``_generate_constant_assignments``) and the indices of the
+        values of the first world are computed directly from ``start``, so
+        disjoint ranges of worlds can be generated independently.
+
+        :param classes: Classes of interchangeable objects (see \
+        ``_generate_constant_assignments``).
+        :type  classes: ``list`` | ``None``
+        :param start: The position of the first World object to generate.
+        :type  start: ``int`` | ``long``
+        :param stop: The position after the last World object to generate \
+        or ``None`` to generate every World object from ``start``.
+        :type  stop: ``int`` | ``long`` | ``None``
+
+        :return: A generator for the World objects in the range.
+        :rtype: ``generator``
+        """
 
+        from itertools import product
+        from world import World
+
+        # share the discretized ascriptions between every World
+        ao_pairs, valuations = self._discretize_ascriptions()
+        positions = {ao_pair: i for i, ao_pair in enumerate(ao_pairs)}
+        sizes = [len(values) for values in valuations]
+        ranges = [xrange(size) for size in sizes]
+
+        # every ConstantAssignment is paired with the same number of value
+        # index tuples, so start splits into the position of the
+        # ConstantAssignment and that of the value indices
+        worlds_per_p = 1
+        for size in sizes:
+            worlds_per_p *= size
+        skipped_ps, offset = divmod(start, worlds_per_p)
+        remaining = None if stop is None else stop - start
+
+        for p in self._generate_constant_assignments(classes, skipped_ps):
+            if offset:
+                indices_iter = NamedState._generate_indices(sizes, offset)
+                offset = 0
+            else:
+                indices_iter = product(*ranges)
+            for indices in indices_iter:
+                if remaining is not None:
+                    if remaining <= 0:
+                        return
+                    remaining -= 1
+                yield World(self._attribute_system, p, positions,
+                            valuations, indices)
+
+    @staticmethod
+    def _generate_indices(sizes, start):
+        """
+        Generate the tuples of ``itertools.product(*[xrange(size) for size in
+        sizes])`` from the one at position ``start`` onwards, without
+        generating those before it.
+        """
+
+        # unravel start into one digit per size, the last varying fastest
+        digits = []
+        for size in reversed(sizes):
+            start, digit = divmod(start, size)
+            digits.append(digit)
+        digits.reverse()
+
+        while True:
+            yield tuple(digits)
+            for i in reversed(xrange(len(digits))):
+                digits[i] += 1
+                if digits[i] < sizes[i]:
+                    break
+                digits[i] = 0
+            else:
+                return
+
+    @staticmethod
+    def _count_permutations(n, k):
+        """Return the number of k-permutations of n items."""
+        count = 1
+        for i in xrange(n - k + 1, n + 1):
+            count *= i
+        return count
+
+    @staticmethod
+    def _count_combinations(n, k):
+        """Return the number of k-combinations of n items."""
+        count = NamedState._count_permutations(n, k)
+        for i in xrange(2, k + 1):
+            count //= i
+        return count
+
+    def _get_interchangeable_objects(self, *named_states):
+        """
+        Partition the objects of the calling NamedState object
+        :math:`(\sigma;\\rho)` that are not bound by :math:`\\rho` into
+        classes of interchangeable objects, i.e., objects :math:`s` and
+        :math:`s^{\prime}` such that
+        :math:`\delta_{i}(s) = \delta_{i}(s^{\prime})` for every attribute in
+        :math:`(\sigma;\\rho)` and every NamedState object in the
+        ``named_states`` parameter and that are not bound by the
+        ConstantAssignment of any NamedState object in ``named_states``.
+
+        :param named_states: Other NamedState objects which must not \
+        distinguish interchangeable objects either.
+        :type  named_states: NamedState
+
+        :return: A list of lists of interchangeable objects; each object not \
+        bound by :math:`\\rho` appears in exactly one list.
+        :rtype: ``list``
+        """
+
+        states = (self,) + named_states
+        labels = [attribute._label for attribute in
+                  self._attribute_system._attribute_structure._attributes]
+
+        distinguished = set([])
+        for named_state in named_states:
+            distinguished.update(named_state._p._target)
+
+        def profile(obj):
+            """Return the ascriptions of obj in every NamedState."""
+            return [state._ascriptions.get((label, obj))
+                    for state in states for label in labels]
+
+        classes = []
+        profiles = []
+        for obj in self._attribute_system._objects:
+            if obj in self._p._target:
+                continue
+
+            obj_profile = profile(obj)
+            if obj not in distinguished:
+                for cls, cls_profile in zip(classes, profiles):
+                    if cls[0] not in distinguished and \
+                            cls_profile == obj_profile:
+                        cls.append(obj)
+                        break
+                else:
+                    classes.append([obj])
+                    profiles.append(obj_profile)
+            else:
+                classes.append([obj])
+                profiles.append(obj_profile)
+
+        return classes
+
+    def _generate_constant_assignments(self, classes=None, start=0):
+        """
+        Generate all total ConstantAssignment objects
+        :math:`\widehat{\\rho}` that extend the ConstantAssignment object
+        :math:`\\rho` of the calling NamedState object, i.e., find all
+        combinations of unbound constants and objects not in :math:`\\rho`.
+        If :math:`\\rho` is already total, :math:`\\rho` is generated.
+
+        :param classes: Classes of interchangeable objects (see \
+        ``_get_interchangeable_objects``); if provided, only one \
+        ConstantAssignment object is generated among those differing by a \
+        permutation of the objects within each class.
+        :type  classes: ``list`` | ``None``
+        :param start: The position of the first ConstantAssignment object to \
+        generate; those before it are counted rather than generated.
+        :type  start: ``int`` | ``long``
+
+        :return: A generator for all total ConstantAssignment objects \
+        :math:`\widehat{\\rho}` extending :math:`\\rho`.
+        :rtype: ``generator``
+        """
+
+        if self._p.is_total():
+            if not start:
+                yield self._p
+            return
+
+        C = self._p._vocabulary._C
+        bound_constants = self._p._source
+        unbound_constants = [c for c in C if c not in bound_constants]
+
+        objects = self._attribute_system._objects
+        bound_objects = self._p._target
+        unbound_objects = [
+            obj for obj in objects if obj not in bound_objects]
+
+        if classes is not None:
+            combos = NamedState._generate_representatives(
+                unbound_constants, classes,
+                min(len(unbound_constants), len(unbound_objects)), start)
+        else:
             smaller = unbound_constants if len(unbound_constants) <= \
                 len(unbound_objects) else unbound_objects
             bigger = unbound_constants if len(unbound_constants) > \
                 len(unbound_objects) else unbound_objects
 
-            import itertools
+            if start:
+                permutations = NamedState._generate_permutations(
+                    bigger, len(smaller), start)
+            else:
+                import itertools
+                permutations = itertools.permutations(bigger, len(smaller))
+
             if smaller == unbound_constants:
-                combos = [zip(smaller, x) for x in itertools.permutations(
-                    bigger, len(smaller))]
+                combos = (zip(smaller, x) for x in permutations)
             else:
-                combos = [zip(x, smaller) for x in itertools.permutations(
-                    bigger, len(smaller))]
+                combos = (zip(x, smaller) for x in permutations)
 
-            constant_assignments = []
-            for combo in combos:
-                mapping = dict(combo + self._p._mapping.items())
-                p = ConstantAssignment(self._p._vocabulary,
-                                       self._attribute_system,
-                                       mapping)
-                constant_assignments.append(p)
+        # build each ConstantAssignment only when it's needed; each mapping
+        # binds unbound constants to unbound objects so it's valid as is
+        for combo in combos:
+            mapping = dict(combo + self._p._mapping.items())
+            yield self._p._derive(mapping, self._attribute_system)
+
+    @staticmethod
+    def _generate_permutations(items, k, start=0):
+        """
+        Generate the tuples of ``itertools.permutations(items, k)`` from the
+        one at position ``start`` onwards; the permutations before it are
+        counted a prefix at a time rather than generated.
+        """
 
-            self_worlds = State.get_worlds(self)
-            for p in constant_assignments:
-                for self_world in self_worlds:
-                    yield NamedState(self._attribute_system,
-                                     p,
-                                     self_world._ascriptions)
+        skip = [start]
+        prefix = []
+
+        def extend(available):
+            """Extend the prefix with each available item in turn."""
+            if len(prefix) == k:
+                if skip[0]:
+                    skip[0] -= 1
+                else:
+                    yield tuple(prefix)
+                return
+
+            for i, item in enumerate(available):
+                if skip[0]:
+                    count = NamedState._count_permutations(
+                        len(available) - 1, k - len(prefix) - 1)
+                    if skip[0] >= count:
+                        skip[0] -= count
+                        continue
+
+                prefix.append(item)
+                for permutation in extend(available[:i] + available[i + 1:]):
+                    yield permutation
+                prefix.pop()
+
+        return extend(list(items))
+
+    @staticmethod
+    def _generate_representatives(constants, classes, bound, start=0):
+        """
+        Generate one list of (constant, object) pairs binding exactly
+        ``bound`` of the constants in the ``constants`` parameter to distinct
+        objects per orbit under the permutation of the objects within each
+        class of the ``classes`` parameter. The representative of each orbit
+        binds the constants (in order) to the objects of each class in order.
+        The representatives before position ``start`` are counted a subtree
+        at a time (see ``_count_representatives``) rather than generated.
+        """
+
+        used = [0] * len(classes)
+        combo = []
+        skip = [start]
+
+        def skipped(i):
+            """Skip the representatives extending combo past constant i."""
+            if not skip[0]:
+                return False
+            count = NamedState._count_representatives(
+                len(constants) - i - 1,
+                [len(cls) - used[j] for j, cls in enumerate(classes)],
+                bound - len(combo))
+            if skip[0] < count:
+                return False
+            skip[0] -= count
+            return True
+
+        def assign(i):
+            """Bind or skip the i-th constant."""
+            if len(combo) == bound:
+                if skip[0]:
+                    skip[0] -= 1
+                else:
+                    yield list(combo)
+                return
+
+            # not enough constants left to bind
+            if len(constants) - i < bound - len(combo):
+                return
+
+            for j, cls in enumerate(classes):
+                if used[j] < len(cls):
+                    combo.append((constants[i], cls[used[j]]))
+                    used[j] += 1
+                    if not skipped(i):
+                        for representative in assign(i + 1):
+                            yield representative
+                    used[j] -= 1
+                    combo.pop()
+
+            # leave the i-th constant unbound
+            if not skipped(i):
+                for representative in assign(i + 1):
+                    yield representative
+
+        return assign(0)
+
+    @staticmethod
+    def _count_representatives(constants, capacities, bound):
+        """
+        Return the number of representatives ``_generate_representatives``
+        generates when binding ``bound`` of ``constants`` remaining constants
+        to classes with ``capacities`` unused objects each, i.e., the number
+        of ways to choose the constants to bind times the number of
+        sequences of classes to bind them to, in order.
+        """
+
+        # ways[t] is the number of sequences of t classes among those
+        # considered so far using no class more than its capacity
+        choose = NamedState._count_combinations
+        ways = [1] + [0] * bound
+        for capacity in capacities:
+            new_ways = [0] * (bound + 1)
+            for t in range(bound + 1):
+                for a in range(min(capacity, bound - t) + 1):
+                    new_ways[t + a] += ways[t] * choose(t + a, a)
+            ways = new_ways
+
+        return choose(constants, bound) * ways[bound]
 
     def is_named_alternate_extension(self, ns_prime, *named_states):
         """
@@ -378,9 +839,8 @@ class NamedState(State):
             # each superset (list of 2-tuples) into mapping by casting to dict
             supersets = []
             for superset in supersets_list:
-                p_prime = ConstantAssignment(self._p._vocabulary,
-                                             self._attribute_system,
-                                             dict(superset))
+                p_prime = self._p._derive(dict(superset),
+                                          self._attribute_system)
                 supersets.append(p_prime)
 
             return supersets
@@ -422,8 +882,7 @@ class NamedState(State):
                 # p_prime and add to named_alternate_extensions if not already
                 # in named_alternate_extensions.
                 for s_prime in phi_i:
-                    nae = NamedState(
-                        self._attribute_system, p_prime, s_prime._ascriptions)
+                    nae = self._derive(s_prime._ascriptions, p_prime)
 
                     if nae not in named_alternate_extensions:
                         named_alternate_extensions.append(nae)
@@ -432,8 +891,7 @@ class NamedState(State):
             # this NamedState's ascriptions and p_prime and add to
             # named_alternate_extensions.
             else:
-                from copy import deepcopy
-                nae = deepcopy(self)
+                nae = self._derive()
                 if nae not in named_alternate_extensions:
                     named_alternate_extensions.append(nae)
 
@@ -719,15 +1177,18 @@ class NamedState(State):
                 "Vocabulary's of NamedState, AssumptionBase, and "
                 "AttributeInterpretation must all match")
 
+        from formula import Formula
+
         # Get all possible alternate extensions first.
         alternate_extensions = self.get_named_alternate_extensions(
             *named_states)
 
         for alternate_extension in alternate_extensions:
             for X in self._generate_variable_assignments():
-                for formula in assumption_base:
-                    truth_value = formula.assign_truth_value(
-                        attribute_interpretation, alternate_extension, X)
+                truth_values = Formula.assign_truth_values(
+                    attribute_interpretation, alternate_extension, X,
+                    *assumption_base)
+                for truth_value in truth_values:
                     if truth_value is not False:
                         return False
         return True
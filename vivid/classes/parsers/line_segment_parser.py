@@ -13,6 +13,7 @@ class LineSegmentParser(object):
     LineSegment object related expressions (some of which can involve Point
     objects).
 
+    :ivar functions: The names of the functions of the LineSegment class.
     :ivar _is_Parser: An identifier to use in place of ``type`` or \
     ``isinstance``.
     """
@@ -22,8 +23,26 @@ class LineSegmentParser(object):
         Construct a LineSegmentParser object.
         """
 
+        self._functions = frozenset(dir(LineSegment))
         self._is_Parser = True
 
+    def handles(self, expression):
+        """
+        Determine if the calling LineSegmentParser object handles the
+        expression given by the ``expression`` parameter, i.e., if
+        ``expression`` calls a function of the LineSegment class; the calling
+        LineSegmentParser object is unable to evaluate any other expression.
+
+        :param expression: The expression to check.
+        :type  expression: ``str``
+
+        :return: Whether or not ``expression`` calls a function of the \
+        LineSegment class.
+        :rtype: ``bool``
+        """
+
+        return expression[:expression.find("(")] in self._functions
+
     def __call__(self, *args):
         """
         Call LineSegmentParser object
@@ -79,6 +98,133 @@ class LineSegmentParser(object):
         except Exception, e:
             raise ValueError("Bad args provided")
 
+    def _parse_call(self, string, variables):
+        """
+        Parse the expression in the ``string`` parameter, a call of a
+        function of the LineSegment class on variables in the ``variables``
+        parameter (e.g., "``is_on(h1, h2, h3)``").
+
+        :return: A 2-tuple of the name of the function and the position in \
+        ``variables`` of each argument of the call, in order.
+        :rtype: ``tuple``
+
+        :raises ValueError: ``string`` parameter must be a call of a function \
+        of the LineSegment class whose arguments are all in ``variables``.
+        """
+
+        string = string.strip()
+        fn_start, fn_end = string.find("("), string.rfind(")")
+        if fn_start < 0 or fn_end != len(string) - 1:
+            raise ValueError("expression must be a function call")
+
+        fn_name = string[:fn_start].strip()
+        if fn_name not in self._functions:
+            raise ValueError("Function not contained in dir of LineSegment")
+
+        variables = list(variables)
+        fn_args = [arg.strip()
+                   for arg in string[fn_start + 1:fn_end].split(",")]
+        if not set(fn_args) <= set(variables):
+            raise ValueError("Only variables acceptable as arguments")
+
+        return fn_name, [variables.index(arg) for arg in fn_args]
+
+    def compile(self, string, variables):
+        """
+        Parse the expression in the ``string`` parameter, a call of a
+        function of the LineSegment class on variables in the ``variables``
+        parameter, once and return a function calling the function of the
+        LineSegment class on given LineSegment and Point objects directly,
+        e.g., ``compile('meets(p,l1,l2)', ['p', 'l1', 'l2'])`` returns a
+        function ``f`` such that ``f(P, L1, L2)`` is
+        ``LineSegment.meets(P, L1, L2)``; see ``PointParser.compile``.
+
+        :param string: The expression to compile.
+        :type  string: ``str``
+        :param variables: The variables of the expression, in the order \
+        their values are provided to the returned function.
+        :type  variables: ``list``
+
+        :return: A function taking one LineSegment or Point object for each \
+        variable and returning the result of calling the function of the \
+        LineSegment class; the function raises a ValueError if some argument \
+        is neither a LineSegment nor a Point object or the function of the \
+        LineSegment class fails.
+        :rtype: ``function``
+
+        :raises ValueError: ``string`` parameter must be a call of a function \
+        of the LineSegment class whose arguments are all in ``variables``.
+        """
+
+        fn_name, positions = self._parse_call(string, variables)
+        line_segment_function = getattr(LineSegment, fn_name)
+        is_static = isinstance(vars(LineSegment).get(fn_name), staticmethod)
+
+        def evaluate(*values):
+            """Call the compiled function on the given objects."""
+            args = [values[position] for position in positions]
+            if not all([hasattr(arg, "_is_LineSegment") or
+                        hasattr(arg, "_is_Point") for arg in args]):
+                raise ValueError(
+                    "Only LineSegment and Point arguments acceptable")
+
+            # see PointParser.compile
+            try:
+                if is_static:
+                    return line_segment_function(*args)
+                return getattr(args[0], fn_name)(*args[1:])
+            except Exception, e:
+                raise ValueError("Bad args provided")
+
+        return evaluate
+
+    def vectorize(self, string, variables):
+        """
+        Parse the expression in the ``string`` parameter like ``compile``
+        and return a function evaluating it over NumPy arrays of the
+        coordinates of Point and LineSegment objects with the batch
+        counterpart of the function of the LineSegment class (e.g.,
+        ``LineSegment.batch_meets`` for ``meets``); see
+        ``PointParser.vectorize``. Requires NumPy.
+
+        :param string: The expression to vectorize.
+        :type  string: ``str``
+        :param variables: The variables of the expression, in the order \
+        their arrays are provided to the returned function.
+        :type  variables: ``list``
+
+        :return: A function taking one array of coordinates for each \
+        variable (2-dimensional for Point objects and 3-dimensional for \
+        LineSegment objects, i.e., one row of two endpoints per LineSegment \
+        object) and returning the boolean array of results for each row.
+        :rtype: ``function``
+
+        :raises ImportError: NumPy must be installed.
+        :raises ValueError: ``string`` parameter must be a call of a function \
+        of the LineSegment class with a batch counterpart whose arguments \
+        are all in ``variables``.
+        """
+
+        import numpy
+
+        fn_name, positions = self._parse_call(string, variables)
+        try:
+            batch_function = getattr(LineSegment, "batch_" + fn_name)
+        except AttributeError:
+            raise ValueError(
+                "Function has no batch counterpart in LineSegment")
+
+        def evaluate(*arrays):
+            """Evaluate the vectorized expression for the given arrays."""
+            args = [arrays[position] for position in positions]
+            if not all([numpy.ndim(arg) in [2, 3] for arg in args]):
+                raise ValueError(
+                    "Only arrays of LineSegment or Point coordinates "
+                    "acceptable")
+            return batch_function(*args)
+
+        return evaluate
+
 
 def main():
     """."""
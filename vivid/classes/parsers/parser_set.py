@@ -1,20 +1,38 @@
 """This section introduces the ParserSet class."""
 
+import threading
+from collections import OrderedDict, namedtuple
+from pyparsing import ParseBaseException
 from truth_value_parser import TruthValueParser
 from point_parser import PointParser
 from line_segment_parser import LineSegmentParser
 
 
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
 class ParserSet(object):
     """
     ParserSet class. The ParserSet object functions as a sequence/collection.
     The ParserSet class is part of the vivid object extension protocol.
 
+    The results of evaluating expressions with ``ParserSet.evaluate`` are
+    held in a bounded least-recently-used cache shared by all ParserSet
+    objects and keyed by expression; its size is set via
+    ``ParserSet.set_cache_size`` and its statistics are given by
+    ``ParserSet.get_cache_info``.
+
     :ivar parsers: The parsers contained in the ParserSet object.
     :ivar _is_ParserSet: An identifier to use in place of ``type`` or \
     ``isinstance``.
     """
 
+    _cache = OrderedDict()
+    _cache_size = 4096
+    _cache_hits = 0
+    _cache_misses = 0
+    _cache_lock = threading.Lock()
+
     def __init__(self):
         """
         Construct a ParserSet object.
@@ -56,6 +74,124 @@ class ParserSet(object):
         for parser in self._parsers:
             yield parser
 
+    def evaluate(self, expression, relation=None):
+        """
+        Evaluate the expression given by the ``expression`` parameter with
+        the first parser in the calling ParserSet object able to evaluate it;
+        the result is cached so evaluating the same expression again only
+        costs a lookup.
+
+        Only the parsers that handle ``expression`` (see the ``handles``
+        function of each parser) are tried. If the Relation object the
+        expression comes from is provided in the ``relation`` parameter, the
+        parser that evaluated the last expression of that Relation object is
+        tried first and the parser that evaluates ``expression`` is recorded
+        in it.
+
+        :param expression: The expression to evaluate.
+        :type  expression: ``str``
+        :param relation: The Relation object whose definition ``expression`` \
+        comes from.
+        :type  relation: Relation | ``None``
+
+        :return: The result of evaluating ``expression``.
+
+        :raises ValueError: Some parser in the calling ParserSet object must \
+        be able to evaluate ``expression``.
+        """
+
+        with ParserSet._cache_lock:
+            try:
+                result = ParserSet._cache.pop(expression)
+            except KeyError:
+                ParserSet._cache_misses += 1
+            else:
+                # reinsert to mark expression as most recently used
+                ParserSet._cache[expression] = result
+                ParserSet._cache_hits += 1
+                return result
+
+        indices = [i for i, parser in enumerate(self._parsers)
+                   if parser.handles(expression)]
+        if relation is not None and relation._parser in indices:
+            indices.remove(relation._parser)
+            indices.insert(0, relation._parser)
+
+        # Try each parser; raise ValueError if no parser can successfully
+        # parse expression
+        for i in indices:
+            try:
+                result = self._parsers[i](expression)
+                break
+            except (ParseBaseException, ArithmeticError, TypeError,
+                    ValueError):
+                pass
+        else:
+            raise ValueError("Unable to parse formula")
+
+        if relation is not None:
+            relation._parser = i
+
+        with ParserSet._cache_lock:
+            if ParserSet._cache_size:
+                ParserSet._cache[expression] = result
+                while len(ParserSet._cache) > ParserSet._cache_size:
+                    ParserSet._cache.popitem(last=False)
+
+        return result
+
+    @staticmethod
+    def set_cache_size(size):
+        """
+        Set the maximum number of expressions whose results are held in the
+        cache of ``ParserSet.evaluate``; the least recently used expressions
+        are evicted first.
+
+        :param size: The maximum number of cached expressions; ``0`` \
+        disables the cache.
+        :type  size: ``int``
+
+        :raises TypeError: ``size`` parameter must be an ``int``.
+        :raises ValueError: ``size`` parameter must be non-negative.
+        """
+
+        if type(size) not in [int, long]:
+            raise TypeError("size parameter must be of type int")
+
+        if size < 0:
+            raise ValueError("size parameter must be non-negative")
+
+        with ParserSet._cache_lock:
+            ParserSet._cache_size = size
+            while len(ParserSet._cache) > size:
+                ParserSet._cache.popitem(last=False)
+
+    @staticmethod
+    def get_cache_info():
+        """
+        Return the statistics of the cache of ``ParserSet.evaluate``.
+
+        :return: A CacheInfo named tuple of the number of cache hits, the \
+        number of cache misses, the maximum size of the cache and the \
+        current size of the cache.
+        :rtype: ``CacheInfo``
+        """
+
+        with ParserSet._cache_lock:
+            return CacheInfo(ParserSet._cache_hits, ParserSet._cache_misses,
+                             ParserSet._cache_size, len(ParserSet._cache))
+
+    @staticmethod
+    def clear_cache():
+        """
+        Clear the cache of ``ParserSet.evaluate`` and reset its statistics.
+        """
+
+        with ParserSet._cache_lock:
+            ParserSet._cache.clear()
+            ParserSet._cache_hits = 0
+            ParserSet._cache_misses = 0
+
 
 def main():
     """."""
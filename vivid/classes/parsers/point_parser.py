@@ -11,6 +11,7 @@ class PointParser(object):
     PointParser class. The PointParser class is used for parsing Point object
     related expressions.
 
+    :ivar functions: The names of the functions of the Point class.
     :ivar _is_Parser: An identifier to use in place of ``type`` or \
     ``isinstance``.
     """
@@ -20,8 +21,26 @@ class PointParser(object):
         Construct a PointParser object.
         """
 
+        self._functions = frozenset(dir(Point))
         self._is_Parser = True
 
+    def handles(self, expression):
+        """
+        Determine if the calling PointParser object handles the expression
+        given by the ``expression`` parameter, i.e., if ``expression`` calls a
+        function of the Point class; the calling PointParser object is
+        unable to evaluate any other expression.
+
+        :param expression: The expression to check.
+        :type  expression: ``str``
+
+        :return: Whether or not ``expression`` calls a function of the \
+        Point class.
+        :rtype: ``bool``
+        """
+
+        return expression[:expression.find("(")] in self._functions
+
     def __call__(self, *args):
         """
         Call PointParser object (e.g., ``PointParser(expression)``).
@@ -72,6 +91,131 @@ class PointParser(object):
         except Exception, e:
             raise ValueError("Bad args provided")
 
+    def _parse_call(self, string, variables):
+        """
+        Parse the expression in the ``string`` parameter, a call of a
+        function of the Point class on variables in the ``variables``
+        parameter (e.g., "``is_on(h1, h2, h3)``").
+
+        :return: A 2-tuple of the name of the function and the position in \
+        ``variables`` of each argument of the call, in order.
+        :rtype: ``tuple``
+
+        :raises ValueError: ``string`` parameter must be a call of a function \
+        of the Point class whose arguments are all in ``variables``.
+        """
+
+        string = string.strip()
+        fn_start, fn_end = string.find("("), string.rfind(")")
+        if fn_start < 0 or fn_end != len(string) - 1:
+            raise ValueError("expression must be a function call")
+
+        fn_name = string[:fn_start].strip()
+        if fn_name not in self._functions:
+            raise ValueError("Function not contained in dir of Point")
+
+        variables = list(variables)
+        fn_args = [arg.strip()
+                   for arg in string[fn_start + 1:fn_end].split(",")]
+        if not set(fn_args) <= set(variables):
+            raise ValueError("Only variables acceptable as arguments")
+
+        return fn_name, [variables.index(arg) for arg in fn_args]
+
+    def compile(self, string, variables):
+        """
+        Parse the expression in the ``string`` parameter, a call of a
+        function of the Point class on variables in the ``variables``
+        parameter, once and return a function calling the function of the
+        Point class on given Point objects directly, e.g.,
+        ``compile('is_on(p1,p2,p3)', ['p1', 'p2', 'p3'])`` returns a function
+        ``f`` such that ``f(P1, P2, P3)`` is ``P1.is_on(P2, P3)``. The Point
+        objects are used as they are rather than being stringified and
+        unstringified, so no precision is lost.
+
+        :param string: The expression to compile.
+        :type  string: ``str``
+        :param variables: The variables of the expression, in the order \
+        their values are provided to the returned function.
+        :type  variables: ``list``
+
+        :return: A function taking one Point object for each variable and \
+        returning the result of calling the function of the Point class; the \
+        function raises a ValueError if some argument is not a Point object \
+        or the function of the Point class fails.
+        :rtype: ``function``
+
+        :raises ValueError: ``string`` parameter must be a call of a function \
+        of the Point class whose arguments are all in ``variables``.
+        """
+
+        fn_name, positions = self._parse_call(string, variables)
+        point_function = getattr(Point, fn_name)
+        is_static = isinstance(vars(Point).get(fn_name), staticmethod)
+
+        def evaluate(*values):
+            """Call the compiled function on the given Point objects."""
+            args = [values[position] for position in positions]
+            if not all([hasattr(arg, "_is_Point") for arg in args]):
+                raise ValueError("Only Point arguments acceptable")
+
+            # call the method bound to the first Point object rather than the
+            # function of the Point class as the Point objects need not come
+            # from this module's import of the Point class
+            try:
+                if is_static:
+                    return point_function(*args)
+                return getattr(args[0], fn_name)(*args[1:])
+            except Exception, e:
+                raise ValueError("Bad args provided")
+
+        return evaluate
+
+    def vectorize(self, string, variables):
+        """
+        Parse the expression in the ``string`` parameter like ``compile``
+        and return a function evaluating it over NumPy arrays of the
+        coordinates of Point objects with the batch counterpart of the
+        function of the Point class (e.g., ``Point.batch_is_on`` for
+        ``is_on``); the vectorized counterpart of ``compile``. Requires
+        NumPy.
+
+        :param string: The expression to vectorize.
+        :type  string: ``str``
+        :param variables: The variables of the expression, in the order \
+        their arrays are provided to the returned function.
+        :type  variables: ``list``
+
+        :return: A function taking one 2-dimensional array of coordinates \
+        (one row per Point object, all of the same length) for each \
+        variable and returning the boolean array of results for each row; \
+        the function raises a ValueError if some array is not \
+        2-dimensional.
+        :rtype: ``function``
+
+        :raises ImportError: NumPy must be installed.
+        :raises ValueError: ``string`` parameter must be a call of a function \
+        of the Point class with a batch counterpart whose arguments are all \
+        in ``variables``.
+        """
+
+        import numpy
+
+        fn_name, positions = self._parse_call(string, variables)
+        try:
+            batch_function = getattr(Point, "batch_" + fn_name)
+        except AttributeError:
+            raise ValueError("Function has no batch counterpart in Point")
+
+        def evaluate(*arrays):
+            """Evaluate the vectorized expression for the given arrays."""
+            args = [arrays[position] for position in positions]
+            if not all([numpy.ndim(arg) == 2 for arg in args]):
+                raise ValueError("Only arrays of Point coordinates acceptable")
+            return batch_function(*args)
+
+        return evaluate
+
 
 def main():
     """."""
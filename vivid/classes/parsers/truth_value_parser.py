@@ -5,6 +5,7 @@ from pyparsing import (Literal, CaselessLiteral, Word, Combine, Group,
                        Optional, ZeroOrMore, Forward, nums, alphas, oneOf)
 import math
 import operator
+import threading
 
 # BNF:
 # expop       ::   '^'
@@ -22,79 +23,163 @@ import operator
 # negation    ::   [negop]* + relation
 # sentence    ::   negation [logop negation]*
 
+# The grammar is built once (on first use) and shared by every parse; the
+# parse actions only write to the state of the current parse, which is held
+# per thread, so any number of parses may run concurrently.
+_grammar = None
+_grammar_lock = threading.Lock()
+_parse_state = threading.local()
+
+
+def _push_first(strg, loc, toks):
+    """Push first token onto the stack."""
+    _parse_state.stack.append(toks[0])
+
+
+def _push_unary_minus(strg, loc, toks):
+    """Push unary minus operator onto the stack."""
+    if toks and toks[0] == '-':
+        _parse_state.stack.append('unary -')
+
+
+def _push_negation(strg, loc, toks):
+    """Push a negation into negation list."""
+    _parse_state.negations.append(toks[0])
+
+
+def _push_relation(strg, loc, toks):
+    """Push relational operator onto stack and possible negations."""
+    _parse_state.stack.append(toks[0])
+    for negation in _parse_state.negations:
+        _parse_state.stack.append("!")
+    _parse_state.negations = []
+
+
+def _is_variable(toks):
+    """Determine if an identifier is a variable of the current parse."""
+    return toks[0] in _parse_state.variables
+
+
+def _build_grammar():
+    """Build the grammar of the TruthValueParser."""
+    point = Literal(".")
+    e = CaselessLiteral("E")
+    fnumber = Combine(Word("+-" + nums, nums) +
+                      Optional(point + Optional(Word(nums))) +
+                      Optional(e + Word("+-" + nums, nums)))
+    ident = Word(alphas, alphas + nums + "_$")
+    # variables are only recognized when a parse has variables (see
+    # TruthValueParser.compile); otherwise the grammar is unchanged
+    variable = ident.copy().addCondition(_is_variable)
+
+    true = Literal("True")
+    false = Literal("False")
+    andop = CaselessLiteral("and")
+    orop = CaselessLiteral("or")
+    negop = Literal("!")
+    eop = Literal("=")
+    gop = Literal(">")
+    lop = Literal("<")
+    geop = Literal(">=")
+    leop = Literal("<=")
+    plus = Literal("+")
+    minus = Literal("-")
+    mult = Literal("*")
+    div = Literal("/")
+    lpar = Literal("(").suppress()
+    rpar = Literal(")").suppress()
+    logop = andop | orop
+    relop = eop | geop | leop | gop | lop
+    addop = plus | minus
+    multop = mult | div
+    expop = Literal("^")
+    pi = CaselessLiteral("PI")
+    sentence = Forward()
+    atom = (
+        (Optional(oneOf("- +")) +
+            (variable | pi | e | true | false | fnumber | ident + lpar + sentence + rpar).setParseAction(_push_first)) |
+        Optional(oneOf("- +")) + Group(lpar + sentence + rpar)).setParseAction(_push_unary_minus)
+    # by defining exponentiation as "atom [ ^ factor ]..." instead of
+    # "atom [ ^ atom ]...", we get right-to-left exponents, instead of
+    # left-to-right that is, 2^3^2 = 2^(3^2), not (2^3)^2.
+    factor = Forward()
+    factor << atom + ZeroOrMore((expop + factor).setParseAction(_push_first))
+
+    term = factor + ZeroOrMore((multop + factor).setParseAction(_push_first))
+    expr = Group(term + ZeroOrMore((addop + term).setParseAction(_push_first)))
+
+    relation = Group(expr + ZeroOrMore((relop + expr).setParseAction(
+        _push_relation)))
+
+    negation = ZeroOrMore(negop.setParseAction(_push_negation)) + relation
+
+    sentence << Group(negation + ZeroOrMore(
+        (logop + negation).setParseAction(_push_first)))
+
+    # streamline up front so parses never modify the shared grammar
+    sentence.streamline()
+    return sentence
+
+
+def _get_grammar():
+    """Return the grammar of the TruthValueParser, building it if need be."""
+    global _grammar
+    if _grammar is None:
+        with _grammar_lock:
+            if _grammar is None:
+                _grammar = _build_grammar()
+    return _grammar
+
+
+def parse(string, variables=()):
+    """
+    Parse the expression in the ``string`` parameter into a stack (in
+    postfix order) to be evaluated by ``TruthValueParser.evaluate_stack``.
+    This function is thread-safe and re-entrant; every parse has its own
+    stack.
+
+    :param string: The expression to parse.
+    :type  string: ``str``
+    :param variables: The identifiers to parse as variables rather than \
+    numbers or functions.
+    :type  variables: ``list``
+
+    :return: The stack of the parsed expression.
+    :rtype: ``list``
+
+    :raises ParseException: The expression must be parsable.
+    """
+
+    grammar = _get_grammar()
+
+    previous_state = dict(_parse_state.__dict__)
+    _parse_state.stack = []
+    _parse_state.negations = []
+    _parse_state.variables = frozenset(variables)
+    try:
+        grammar.parseString(string, True)
+        return _parse_state.stack
+    finally:
+        _parse_state.__dict__.clear()
+        _parse_state.__dict__.update(previous_state)
+
 
 class TruthValueParser(object):
     """
     TruthValueParser class. TruthValueParser provides parsing functionality for
-    entirely mathematical/logical strings.
+    entirely mathematical/logical strings. TruthValueParser objects hold no
+    parse state, so a single TruthValueParser object may be shared by any
+    number of threads.
 
     :ivar _is_Parser: An identifier to use in place of ``type`` or \
     ``isinstance``.
     """
 
-    negations = []
-
     def __init__(self):
         """
         Construct a TruthValueParser object.
         """
 
-        point = Literal(".")
-        e = CaselessLiteral("E")
-        fnumber = Combine(Word("+-" + nums, nums) +
-                          Optional(point + Optional(Word(nums))) +
-                          Optional(e + Word("+-" + nums, nums)))
-        ident = Word(alphas, alphas + nums + "_$")
-
-        true = Literal("True")
-        false = Literal("False")
-        andop = CaselessLiteral("and")
-        orop = CaselessLiteral("or")
-        negop = Literal("!")
-        eop = Literal("=")
-        gop = Literal(">")
-        lop = Literal("<")
-        geop = Literal(">=")
-        leop = Literal("<=")
-        plus = Literal("+")
-        minus = Literal("-")
-        mult = Literal("*")
-        div = Literal("/")
-        lpar = Literal("(").suppress()
-        rpar = Literal(")").suppress()
-        logop = andop | orop
-        relop = eop | geop | leop | gop | lop
-        addop = plus | minus
-        multop = mult | div
-        expop = Literal("^")
-        pi = CaselessLiteral("PI")
-        sentence = Forward()
-        atom = (
-            (Optional(oneOf("- +")) +
-                (pi | e | true | false | fnumber | ident + lpar + sentence + rpar).setParseAction(self.pushFirst)) |
-            Optional(oneOf("- +")) + Group(lpar + sentence + rpar)).setParseAction(self.pushUMinus)
-        # by defining exponentiation as "atom [ ^ factor ]..." instead of
-        # "atom [ ^ atom ]...", we get right-to-left exponents, instead of
-        # left-to-right that is, 2^3^2 = 2^(3^2), not (2^3)^2.
-        factor = Forward()
-        factor << atom + ZeroOrMore((expop + factor).setParseAction(
-            self.pushFirst))
-
-        term = factor + ZeroOrMore((multop + factor).setParseAction(
-            self.pushFirst))
-        expr = Group(term + ZeroOrMore((addop + term).setParseAction(
-            self.pushFirst)))
-
-        relation = Group(expr + ZeroOrMore((relop + expr).setParseAction(
-            self.pushRel)))
-
-        negation = ZeroOrMore(negop.setParseAction(self.pushNeg)) + relation
-
-        sentence << Group(negation + ZeroOrMore(
-            (logop + negation).setParseAction(self.pushFirst)))
-
-        self.bnf = sentence
-
         # map operator symbols to corresponding arithmetic operations
         epsilon = 1e-12
         self.opn = {"+": operator.add,
@@ -124,6 +209,22 @@ class TruthValueParser(object):
 
         self._is_Parser = True
 
+    def handles(self, expression):
+        """
+        Determine if the calling TruthValueParser object handles the
+        expression given by the ``expression`` parameter; the grammar has no
+        ``","`` so expressions containing one (e.g., calls to Point functions)
+        are never handled.
+
+        :param expression: The expression to check.
+        :type  expression: ``str``
+
+        :return: Whether or not ``expression`` may be parsable.
+        :rtype: ``bool``
+        """
+
+        return "," not in expression
+
     def __call__(self, *args):
         """
         Call TruthValueParser object (e.g., ``TruthValueParser(expression)``).
@@ -131,46 +232,31 @@ class TruthValueParser(object):
 
         return self._eval(*args)
 
-    def pushFirst(self, strg, loc, toks):
-        """Push first token onto the stack."""
-        self.exprStack.append(toks[0])
-
-    def pushUMinus(self, strg, loc, toks):
-        """Push unary minus operator onto the stack."""
-        if toks and toks[0] == '-':
-            self.exprStack.append('unary -')
-
-    def pushNeg(self, strg, loc, toks):
-        "Push a negation into negation list."
-        self.negations.append(toks[0])
-
-    def pushRel(self, strg, loc, toks):
-        """Push relational operator onto stach and possible negations."""
-        self.exprStack.append(toks[0])
-        if self.negations:
-            for i in range(len(self.negations)):
-                self.exprStack.append("!")
-            self.negations = []
-
-    def evaluate_stack(self, s):
-        """Evaluate internal stack of parse object."""
+    def evaluate_stack(self, s, bindings=None):
+        """
+        Evaluate internal stack of parse object; variables in the stack are
+        replaced by their values in ``bindings``.
+        """
+
         op = s.pop()
+        if bindings and op in bindings:
+            return bindings[op]
         if op == 'unary -':
-            return -self.evaluate_stack(s)
+            return -self.evaluate_stack(s, bindings)
         if op in "+-*/^":
-            op2 = self.evaluate_stack(s)
-            op1 = self.evaluate_stack(s)
+            op2 = self.evaluate_stack(s, bindings)
+            op1 = self.evaluate_stack(s, bindings)
             return self.opn[op](op1, op2)
         elif op in "<=>=":
-            op2 = self.evaluate_stack(s)
-            op1 = self.evaluate_stack(s)
+            op2 = self.evaluate_stack(s, bindings)
+            op1 = self.evaluate_stack(s, bindings)
             return self.rel[op](float(op1), float(op2))
         elif op in "!":
-            op = self.evaluate_stack(s)
+            op = self.evaluate_stack(s, bindings)
             return self.neg["!"](op)
         elif op in "andor":
-            op2 = self.evaluate_stack(s)
-            op1 = self.evaluate_stack(s)
+            op2 = self.evaluate_stack(s, bindings)
+            op1 = self.evaluate_stack(s, bindings)
             return self.log[op]([op1, op2])
         elif op == "True":
             return True
@@ -181,7 +267,71 @@ class TruthValueParser(object):
         elif op == "E":
             return math.e  # 2.718281828
         elif op in self.fn:
-            return self.fn[op](self.evaluate_stack(s))
+            return self.fn[op](self.evaluate_stack(s, bindings))
+        elif op[0].isalpha():
+            return 0
+        else:
+            return float(op)
+
+    def _evaluate_array_stack(self, s, bindings):
+        """
+        Evaluate internal stack of parse object elementwise over the NumPy
+        arrays in ``bindings``; the counterpart of ``evaluate_stack``.
+        """
+
+        import numpy
+
+        op = s.pop()
+        if op in bindings:
+            return bindings[op]
+        if op == 'unary -':
+            return -self._evaluate_array_stack(s, bindings)
+        if op in "+-*/^":
+            op2 = numpy.asarray(
+                self._evaluate_array_stack(s, bindings), dtype=float)
+            op1 = numpy.asarray(
+                self._evaluate_array_stack(s, bindings), dtype=float)
+            if op == "^":
+                return numpy.power(op1, op2)
+            return self.opn[op](op1, op2)
+        elif op in "<=>=":
+            op2 = numpy.asarray(
+                self._evaluate_array_stack(s, bindings), dtype=float)
+            op1 = numpy.asarray(
+                self._evaluate_array_stack(s, bindings), dtype=float)
+            return self.rel[op](op1, op2)
+        elif op in "!":
+            a = numpy.asarray(self._evaluate_array_stack(s, bindings))
+            # mirror evaluate_stack; only true is negated to false
+            if a.dtype == bool:
+                return numpy.logical_not(a)
+            return numpy.ones(a.shape, dtype=bool)
+        elif op in "andor":
+            op2 = self._evaluate_array_stack(s, bindings)
+            op1 = self._evaluate_array_stack(s, bindings)
+            if op == "and":
+                return numpy.logical_and(op1, op2)
+            return numpy.logical_or(op1, op2)
+        elif op == "True":
+            return True
+        elif op == "False":
+            return False
+        elif op == "PI":
+            return math.pi
+        elif op == "E":
+            return math.e
+        elif op in self.fn:
+            a = numpy.asarray(
+                self._evaluate_array_stack(s, bindings), dtype=float)
+            if op == "trunc":
+                return numpy.trunc(a)
+            if op == "round":
+                # round half away from zero like the round built-in function
+                return numpy.where(
+                    a >= 0, numpy.floor(a + 0.5), -numpy.floor(0.5 - a))
+            if op == "sgn":
+                return numpy.where(numpy.abs(a) > 1e-12, numpy.sign(a), 0)
+            return getattr(numpy, op)(a)
         elif op[0].isalpha():
             return 0
         else:
@@ -196,11 +346,354 @@ class TruthValueParser(object):
         :type  string: ``str``
         """
 
-        self.exprStack = []
-        parseAll = True
-        results = self.bnf.parseString(string, parseAll)
-        val = self.evaluate_stack(self.exprStack[:])
-        return val
+        return self.evaluate_stack(parse(string))
+
+    def compile(self, string, variables):
+        """
+        Parse the expression in the ``string`` parameter once and return a
+        function evaluating it for given values of the variables in the
+        ``variables`` parameter, e.g., ``compile('h1 > h2', ['h1', 'h2'])``
+        returns a function ``f`` such that ``f(13, 8)`` is the result of
+        evaluating ``'13 > 8'``. The values are used as they are rather than
+        being substituted into the expression as strings.
+
+        :param string: The expression to compile.
+        :type  string: ``str``
+        :param variables: The variables of the expression, in the order \
+        their values are provided to the returned function.
+        :type  variables: ``list``
+
+        :return: A function taking one value (a ``bool``, ``int``, \
+        ``float`` or ``long``) for each variable and returning the result of \
+        evaluating the expression; the function raises a ValueError if some \
+        value is not a ``bool``, ``int``, ``float`` or ``long``.
+        :rtype: ``function``
+
+        :raises ParseException: The expression must be parsable.
+        """
+
+        stack = parse(string, variables)
+        variables = list(variables)
+
+        def evaluate(*values):
+            """Evaluate the compiled expression for the given values."""
+            bindings = {}
+            for variable, value in zip(variables, values):
+                if value is True or value is False:
+                    bindings[variable] = value
+                elif type(value) in [int, float, long]:
+                    # numbers are evaluated as floats as in _eval
+                    bindings[variable] = float(value)
+                else:
+                    raise ValueError(
+                        "Only bool, int, float or long values acceptable")
+            return self.evaluate_stack(stack[:], bindings)
+
+        return evaluate
+
+    def vectorize(self, string, variables):
+        """
+        Parse the expression in the ``string`` parameter once and return a
+        function evaluating it elementwise over NumPy arrays of values of the
+        variables in the ``variables`` parameter; the vectorized counterpart
+        of ``compile``, e.g., ``vectorize('h1 > h2', ['h1', 'h2'])`` returns a
+        function ``f`` such that ``f(array([13, 8]), array([8, 8]))`` is
+        ``array([True, False])``. Requires NumPy.
+
+        :param string: The expression to vectorize.
+        :type  string: ``str``
+        :param variables: The variables of the expression, in the order \
+        their arrays are provided to the returned function.
+        :type  variables: ``list``
+
+        :return: A function taking one array of numbers for each variable \
+        (all of the same length) and returning the array of results of \
+        evaluating the expression for each index; the function raises a \
+        FloatingPointError where ``compile`` would raise an error (e.g., \
+        division by zero).
+        :rtype: ``function``
+
+        :raises ImportError: NumPy must be installed.
+        :raises ParseException: The expression must be parsable.
+        """
+
+        import numpy
+
+        stack = parse(string, variables)
+        variables = list(variables)
+
+        def evaluate(*arrays):
+            """Evaluate the vectorized expression for the given arrays."""
+            bindings = {variable: numpy.asarray(array, dtype=float)
+                        for variable, array in zip(variables, arrays)}
+            with numpy.errstate(all="raise"):
+                return self._evaluate_array_stack(stack[:], bindings)
+
+        return evaluate
+
+    def evaluate_intervals(self, string, values, variables=None,
+                           max_depth=16):
+        """
+        Evaluate the expression in the ``string`` parameter symbolically over
+        every point of the box given by the ``values`` parameter using
+        interval arithmetic, i.e., determine if the expression is true for
+        every point, false for every point, or neither.
+
+        The expression may refer to variables (given by the keys of the
+        ``variables`` parameter) in place of numbers; each variable ranges
+        over the value in ``values`` it is mapped to (variables mapped to the
+        same key always take the same value). int and long Intervals range
+        over their discrete values while float Intervals are treated as
+        continuous. The box is only split (bisecting its widest Interval)
+        when the expression is neither true nor false over the whole box;
+        int and long Intervals are split down to single values if need be,
+        float Intervals at most ``max_depth`` times (the truth value of a
+        box that is still undecided at that point is **unknown**).
+
+        :param string: The expression to evaluate.
+        :type  string: ``str``
+        :param values: A mapping from keys to the int, float or long values \
+        or Interval objects the variables range over.
+        :type  values: ``dict``
+        :param variables: A mapping from the variables in the expression to \
+        keys of ``values``; defaults to the identity mapping on the keys of \
+        ``values``.
+        :type  variables: ``dict`` | ``None``
+        :param max_depth: The maximum number of times a float Interval is \
+        split.
+        :type  max_depth: ``int``
+
+        :return: A truth value in the set \
+        :math:`\{\\textbf{true}, \\textbf{false}, \\textbf{unknown}\}`.
+        :rtype: ``bool`` | ``str``
+
+        :raises ParseException: The expression must be parsable.
+        :raises TypeError: Every value in ``values`` must be an int, float \
+        or long or an Interval object.
+        """
+
+        if variables is None:
+            variables = {key: key for key in values}
+
+        stack = parse(string, variables)
+
+        # each box maps every key to (infimum, supremum, is_discrete)
+        box = {}
+        for key, value in values.iteritems():
+            if hasattr(value, "_is_Interval"):
+                box[key] = (value[0], value[1], value._type != float)
+            elif type(value) in [int, float, long]:
+                box[key] = (value, value, type(value) != float)
+            else:
+                raise TypeError(
+                    "values must be of type int, float, long or Interval")
+
+        seen = set([])
+        boxes = [(box, 0)]
+        while boxes:
+            box, depth = boxes.pop()
+            bounds = {variable: box[key][:2]
+                      for variable, key in variables.iteritems()}
+            truth_value = self._truth_value(
+                self._evaluate_interval_stack(stack[:], bounds))
+
+            if truth_value != "unknown":
+                seen.add(truth_value)
+                if len(seen) == 2:
+                    return "unknown"
+                continue
+
+            # split the widest interval that can still be split
+            split_key, widest = None, None
+            for key, (inf, sup, is_discrete) in box.iteritems():
+                if inf == sup or (not is_discrete and depth >= max_depth):
+                    continue
+                if widest is None or sup - inf > widest:
+                    split_key, widest = key, sup - inf
+
+            if split_key is None:
+                return "unknown"
+
+            inf, sup, is_discrete = box[split_key]
+            if is_discrete:
+                lower = (inf, inf + (sup - inf) // 2, True)
+                upper = (lower[1] + 1, sup, True)
+            else:
+                lower = (inf, inf + (sup - inf) / 2, False)
+                upper = (lower[1], sup, False)
+
+            for half in [upper, lower]:
+                new_box = dict(box)
+                new_box[split_key] = half
+                boxes.append((new_box, depth + 1))
+
+        return seen.pop()
+
+    @staticmethod
+    def _truth_value(value):
+        """
+        Return the truth value of an operand of the interval stack; an
+        interval is true if it does not contain ``0``.
+        """
+
+        if value is True or value is False or value == "unknown":
+            return value
+
+        inf, sup = value
+        if inf == sup == 0:
+            return False
+        if inf > 0 or sup < 0:
+            return True
+        return "unknown"
+
+    def _evaluate_interval_stack(self, s, bounds):
+        """
+        Evaluate internal stack of parse object using interval arithmetic;
+        the counterpart of ``evaluate_stack`` where each number is an
+        interval (infimum, supremum) and each truth value is in
+        :math:`\{\\textbf{true}, \\textbf{false}, \\textbf{unknown}\}`.
+        """
+
+        inf = float("inf")
+
+        def interval(value):
+            """Return the interval of an operand."""
+            if value is True or value is False:
+                return (float(value), float(value))
+            if value == "unknown":
+                return (0.0, 1.0)
+            return value
+
+        def corners(op, a, b):
+            """Return the hull of op applied to the corners of a and b."""
+            try:
+                results = [op(x, y) for x in a for y in b]
+            except (OverflowError, ValueError, ZeroDivisionError):
+                return (-inf, inf)
+            if any(result != result for result in results):
+                return (-inf, inf)
+            return (min(results), max(results))
+
+        def power(a, b):
+            """Return the hull of a ^ b."""
+            if a[0] == a[1] and b[0] == b[1]:
+                result = self.opn["^"](a[0], b[0])
+                return (result, result)
+            if b[0] == b[1] and b[0] == int(b[0]) and b[0] >= 0:
+                n = int(b[0])
+                low, high = a[0] ** n, a[1] ** n
+                if n % 2 == 0 and a[0] < 0 < a[1]:
+                    return (0.0, max(low, high))
+                return (min(low, high), max(low, high))
+            if a[0] > 0:
+                return corners(self.opn["^"], a, b)
+            return (-inf, inf)
+
+        def relate(op, a, b):
+            """Return the truth value of a op b."""
+            if op == "=":
+                if a[0] == a[1] == b[0] == b[1]:
+                    return True
+                if a[1] < b[0] or b[1] < a[0]:
+                    return False
+            elif op == ">":
+                if a[0] > b[1]:
+                    return True
+                if a[1] <= b[0]:
+                    return False
+            elif op == "<":
+                if a[1] < b[0]:
+                    return True
+                if a[0] >= b[1]:
+                    return False
+            elif op == ">=":
+                if a[0] >= b[1]:
+                    return True
+                if a[1] < b[0]:
+                    return False
+            elif op == "<=":
+                if a[1] <= b[0]:
+                    return True
+                if a[0] > b[1]:
+                    return False
+            return "unknown"
+
+        op = s.pop()
+        if op in bounds:
+            return bounds[op]
+        if op == 'unary -':
+            a = interval(self._evaluate_interval_stack(s, bounds))
+            return (-a[1], -a[0])
+        if op in "+-*/^":
+            op2 = interval(self._evaluate_interval_stack(s, bounds))
+            op1 = interval(self._evaluate_interval_stack(s, bounds))
+            if op == "+":
+                return (op1[0] + op2[0], op1[1] + op2[1])
+            elif op == "-":
+                return (op1[0] - op2[1], op1[1] - op2[0])
+            elif op == "*":
+                return corners(operator.mul, op1, op2)
+            elif op == "/":
+                if op2[0] <= 0 <= op2[1]:
+                    return (-inf, inf)
+                return corners(operator.truediv, op1, op2)
+            else:
+                return power(op1, op2)
+        elif op in "<=>=":
+            op2 = interval(self._evaluate_interval_stack(s, bounds))
+            op1 = interval(self._evaluate_interval_stack(s, bounds))
+            return relate(op, op1, op2)
+        elif op in "!":
+            value = self._evaluate_interval_stack(s, bounds)
+            # mirror evaluate_stack; only true is negated to false
+            if value is True:
+                return False
+            if value == "unknown":
+                return "unknown"
+            return True
+        elif op in "andor":
+            op2 = self._truth_value(self._evaluate_interval_stack(s, bounds))
+            op1 = self._truth_value(self._evaluate_interval_stack(s, bounds))
+            if op == "and":
+                if op1 is False or op2 is False:
+                    return False
+                if op1 is True and op2 is True:
+                    return True
+            else:
+                if op1 is True or op2 is True:
+                    return True
+                if op1 is False and op2 is False:
+                    return False
+            return "unknown"
+        elif op == "True":
+            return True
+        elif op == "False":
+            return False
+        elif op == "PI":
+            return (math.pi, math.pi)
+        elif op == "E":
+            return (math.e, math.e)
+        elif op in self.fn:
+            a = interval(self._evaluate_interval_stack(s, bounds))
+            if a[0] == a[1]:
+                result = self.fn[op](a[0])
+                return (result, result)
+            # abs, trunc, round and sgn are monotonic on each side of 0
+            if op == "abs":
+                if a[0] >= 0:
+                    return a
+                if a[1] <= 0:
+                    return (-a[1], -a[0])
+                return (0.0, max(-a[0], a[1]))
+            if op in ["trunc", "round", "sgn"]:
+                return (self.fn[op](a[0]), self.fn[op](a[1]))
+            if op in ["sin", "cos"]:
+                return (-1.0, 1.0)
+            return (-inf, inf)
+        elif op[0].isalpha():
+            return (0.0, 0.0)
+        else:
+            return (float(op), float(op))
 
 
 def main():
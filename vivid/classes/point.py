@@ -15,6 +15,8 @@ class Point(object):
     ``isinstance``.
     """
 
+    _epsilon = .00000000000001
+
     def __init__(self, *coordinates):
         """
         Construct a Point object.
@@ -145,7 +147,7 @@ class Point(object):
                 sum([(p1[i] - p2[i]) ** 2 for i in range(self._dimension)]))
 
         def is_between(p1, p2, p3):
-            epsilon = .00000000000001
+            epsilon = Point._epsilon
             delta = (distance(p1, p2) + distance(p1, p3)) - distance(p2, p3)
             return - epsilon < delta < epsilon
 
@@ -243,6 +245,119 @@ class Point(object):
         else:
             return False
 
+    @staticmethod
+    def batch_is_on(points, endpoints_1, endpoints_2):
+        """
+        Determine, for a batch of points and line segments given as NumPy
+        arrays of coordinates, whether each point in the ``points`` parameter
+        lies on the line segment defined by the corresponding endpoints in
+        the ``endpoints_1`` and ``endpoints_2`` parameters; the batch
+        counterpart of ``is_on``. Requires NumPy.
+
+        The last axis of each array holds the coordinates of a point and the
+        remaining axes are broadcast against each other, so e.g. every point
+        can be checked against every line segment by adding an axis to
+        ``points``. The distances are computed exactly as ``is_on`` computes
+        them (the same operations in the same order) and compared with the
+        same tolerance, so the results always agree with ``is_on``.
+
+        :param points: The coordinates of the points.
+        :type  points: ``numpy.ndarray``
+        :param endpoints_1: The coordinates of the first endpoint of each \
+        line segment.
+        :type  endpoints_1: ``numpy.ndarray``
+        :param endpoints_2: The coordinates of the second endpoint of each \
+        line segment.
+        :type  endpoints_2: ``numpy.ndarray``
+
+        :return: A boolean array, of the broadcast shape of the parameters \
+        without the last axis, of whether or not each point lies on its line \
+        segment.
+        :rtype: ``numpy.ndarray``
+
+        :raises ImportError: NumPy must be installed.
+        :raises ValueError: The points and endpoints must all be in the same \
+        dimension of space and their arrays must be broadcastable.
+        """
+
+        import numpy
+
+        points = numpy.asarray(points, dtype=float)
+        endpoints_1 = numpy.asarray(endpoints_1, dtype=float)
+        endpoints_2 = numpy.asarray(endpoints_2, dtype=float)
+
+        if 0 in [points.ndim, endpoints_1.ndim, endpoints_2.ndim]:
+            raise ValueError("points and endpoints must be arrays of rows")
+
+        dimension = points.shape[-1]
+        if not dimension == endpoints_1.shape[-1] == endpoints_2.shape[-1]:
+            raise ValueError("point must be of same dimension as endpoints")
+
+        def distance(p1, p2):
+            # sum the squares one coordinate at a time with the pow of the C
+            # library, as the builtin sum and ** do in is_on
+            difference = p1 - p2
+            total = 0.0
+            for i in range(dimension):
+                total = total + numpy.power(difference[..., i], 2.0)
+            return numpy.sqrt(total)
+
+        delta = (distance(points, endpoints_1) +
+                 distance(points, endpoints_2)) - \
+            distance(endpoints_1, endpoints_2)
+
+        return (-Point._epsilon < delta) & (delta < Point._epsilon)
+
+    @staticmethod
+    def batch_meets(points, worldlines_1_start, worldlines_1_end,
+                    worldlines_2_start, worldlines_2_end):
+        """
+        Determine, for a batch of points and pairs of worldline segments
+        given as NumPy arrays of coordinates, whether each pair of worldline
+        segments meets at the corresponding point; the batch counterpart of
+        ``meets`` (see ``batch_is_on``). Requires NumPy.
+
+        :return: A boolean array of whether or not each pair of worldline \
+        segments meets at its point.
+        :rtype: ``numpy.ndarray``
+
+        :raises ImportError: NumPy must be installed.
+        :raises ValueError: See ``batch_is_on``.
+        """
+
+        return Point.batch_is_on(
+            points, worldlines_1_start, worldlines_1_end) & \
+            Point.batch_is_on(points, worldlines_2_start, worldlines_2_end)
+
+    @staticmethod
+    def batch_can_observe(points, spacetime_locs, worldlines_start,
+                          worldlines_end):
+        """
+        Determine, for a batch of points, spacetime locations and worldline
+        segments given as NumPy arrays of coordinates, whether each point can
+        observe the corresponding spacetime location through the
+        corresponding worldline segment; the batch counterpart of
+        ``can_observe`` (see ``batch_is_on``). Requires NumPy.
+
+        :return: A boolean array of whether or not each point can observe its \
+        spacetime location.
+        :rtype: ``numpy.ndarray``
+
+        :raises ImportError: NumPy must be installed.
+        :raises ValueError: See ``batch_is_on``.
+        """
+
+        import numpy
+
+        points = numpy.asarray(points, dtype=float)
+        spacetime_locs = numpy.asarray(spacetime_locs, dtype=float)
+
+        both_on_same_worldline = Point.batch_is_on(
+            points, worldlines_start, worldlines_end) & \
+            Point.batch_is_on(spacetime_locs, worldlines_start, worldlines_end)
+
+        return (points == spacetime_locs).all(axis=-1) | both_on_same_worldline
+
     @staticmethod
     def unstringify(point_string):
         """
@@ -16,6 +16,10 @@ class Relation(object):
     Attributes objects; no assumptions are made on the labels of the \
     attributes.
     :ivar subscript: The subscript of the relation.
+    :ivar evaluators: The compiled (and vectorized) definition of the \
+    Relation object (see ``get_evaluator``), once compiled.
+    :ivar parser: The index of the parser in the ParserSet that evaluated \
+    the last expression of the Relation object (see ``ParserSet.evaluate``).
     :ivar _is_Relation: An identifier to use in place of ``type`` or \
     ``isinstance``.
     """
@@ -87,6 +91,8 @@ class Relation(object):
         self._definition = definition
         self._DR = D_of_r
         self._subscript = subscript
+        self._evaluators = {}
+        self._parser = None
         self._is_Relation = True
 
     def __eq__(self, other):
@@ -157,6 +163,16 @@ class Relation(object):
             deepcopy(self._DR),
             int(self._subscript))
 
+    def __getstate__(self):
+        """
+        Return the state of a Relation object for pickling; the compiled
+        definition is dropped and recompiled on demand.
+        """
+
+        state = dict(self.__dict__)
+        state["_evaluators"] = {}
+        return state
+
     def __str__(self):
         """Return a readable string representation of the Relation object."""
         return 'R' + str(self._subscript) + ' is a subset of ' + \
@@ -184,6 +200,9 @@ class Relation(object):
 
         if Relation.is_valid_definition(definition):
             self._definition = definition
+            # the compiled definition and parser are stale
+            self._evaluators = {}
+            self._parser = None
         else:
             raise ValueError(
                 "definition parameter must be of form 'Rs(x1,x2,...,xn) <=> ' "
@@ -253,6 +272,78 @@ class Relation(object):
 
         return len(self._DR)
 
+    def get_evaluator(self, vectorized=False):
+        """
+        Return the definition of the calling Relation object compiled into a
+        function of the values of its arguments, e.g., for the definition
+        ``R1(h1, h2) <=> h1 > h2`` a function ``f`` such that ``f(13, 8)`` is
+        the result of evaluating ``13 > 8``. The definition is compiled by
+        every parser of the ParserSet object that handles it and provides a
+        ``compile`` function (see ``TruthValueParser.compile``,
+        ``PointParser.compile`` and ``LineSegmentParser.compile``) the first
+        time this function is called and cached until the definition is
+        changed by ``set_definition``; as in ``ParserSet.evaluate``, the
+        compiled definitions are tried in the order of their parsers until
+        one succeeds, so e.g. definitions calling Point functions are
+        evaluated on the Point objects themselves.
+
+        If the ``vectorized`` parameter is ``True``, the definition is
+        compiled into a function of NumPy arrays of values of its arguments
+        instead by the parsers providing a ``vectorize`` function (see
+        ``TruthValueParser.vectorize``), e.g., ``f`` such that
+        ``f(array([13, 8]), array([8, 8]))`` is ``array([True, False])``.
+
+        :param vectorized: Whether or not to return the vectorized definition.
+        :type  vectorized: ``bool``
+
+        :return: The compiled definition, taking the value (or array of \
+        values) of each argument of the definition in order, or ``None`` if \
+        no parser can compile the definition (or NumPy is not installed).
+        :rtype: ``function`` | ``None``
+        """
+
+        if vectorized not in self._evaluators:
+            from pyparsing import ParseBaseException
+            from parsers.parser_set import ParserSet
+
+            start_paren = self._definition.find('(')
+            end_paren = self._definition.find(')')
+            arg_string = self._definition[start_paren + 1:end_paren]
+            r_args = [arg.strip() for arg in arg_string.split(',')]
+            expression = self.export().strip()
+
+            evaluators = []
+            for parser in ParserSet():
+                compile_definition = getattr(
+                    parser, "vectorize" if vectorized else "compile", None)
+                if compile_definition is None or \
+                        not parser.handles(expression):
+                    continue
+                try:
+                    evaluators.append(compile_definition(expression, r_args))
+                except (ParseBaseException, ImportError, TypeError,
+                        ValueError):
+                    # the parser cannot compile the definition (or NumPy is
+                    # not installed)
+                    pass
+
+            if len(evaluators) > 1:
+                def evaluate(*values):
+                    """Evaluate with the first compiled definition able to."""
+                    for evaluator in evaluators[:-1]:
+                        try:
+                            return evaluator(*values)
+                        except (ValueError, TypeError):
+                            pass
+                    return evaluators[-1](*values)
+
+                self._evaluators[vectorized] = evaluate
+            else:
+                self._evaluators[vectorized] = \
+                    evaluators[0] if evaluators else None
+
+        return self._evaluators[vectorized]
+
     def export(self):
         """Export definition of Relation object."""
         return self._definition.split("<=>")[1]
@@ -1,13 +1,40 @@
 """This section introduces the State class."""
 
-from copy import deepcopy
+from copy import copy, deepcopy
 from functools import total_ordering
-from valueset import ValueSet
+from valueset import ValueSet, FrozenValueSet
 from attribute import Attribute
 from attribute_structure import AttributeStructure
 from attribute_system import AttributeSystem
 
 
+class WorldBudgetExceededError(Exception):
+    """
+    WorldBudgetExceededError class. Raised before the enumeration of worlds
+    (and variable assignments) begins when the number of worlds to enumerate
+    exceeds the world budget set via ``State.set_world_budget``.
+
+    :ivar count: The number of worlds that would have been enumerated.
+    :ivar budget: The world budget that was exceeded.
+    """
+
+    def __init__(self, count, budget):
+        """
+        Construct a WorldBudgetExceededError object.
+
+        :param count: The number of worlds that would have been enumerated.
+        :type  count: ``int`` | ``long``
+        :param budget: The world budget that was exceeded.
+        :type  budget: ``int`` | ``long``
+        """
+
+        super(WorldBudgetExceededError, self).__init__(
+            "enumeration of " + str(count) + " worlds exceeds the world "
+            "budget of " + str(budget))
+        self.count = count
+        self.budget = budget
+
+
 @total_ordering
 class State(object):
     """
@@ -26,14 +53,61 @@ class State(object):
     respectively, despite the lack of magic functions for them.
 
     :ivar attribute_system: A copy of the AttributeSytem object \
-    :math:`\mathcal{S}` that the State object comes from.
+    :math:`\mathcal{S}` that the State object comes from; States derived \
+    from one another share it by reference until an object is added.
     :ivar ascriptions: The ascriptions of the state (i.e., the set of \
     attribute-object pairs and their corresponding ValueSet objects) \
     :math:`\delta_{i},~i=1, \ldots, k`.
+    :ivar _shared_ascriptions: Whether or not ``ascriptions`` is shared \
+    with another State object and must be copied before it is modified.
     :ivar _is_State: An identifier to use in place of ``type`` or \
     ``isinstance``.
+    :cvar _world_budget: The maximum number of worlds (and variable \
+    assignments) that may be enumerated at once or ``None`` for no maximum.
     """
 
+    _world_budget = None
+
+    @staticmethod
+    def set_world_budget(budget):
+        """
+        Set the maximum number of worlds (and variable assignments) that may
+        be enumerated at once by State, NamedState and Context objects; any
+        enumeration exceeding ``budget`` raises a WorldBudgetExceededError
+        before it starts.
+
+        :param budget: The maximum number of worlds to enumerate or ``None`` \
+        to remove the budget.
+        :type  budget: ``int`` | ``long`` | ``None``
+
+        :raises TypeError: ``budget`` parameter must be an ``int``, ``long`` \
+        or ``None``.
+        :raises ValueError: ``budget`` parameter must be non-negative.
+        """
+
+        if budget is not None:
+            if type(budget) != int and type(budget) != long:
+                raise TypeError("budget must be of type int, long or None")
+
+            if budget < 0:
+                raise ValueError("budget must be non-negative")
+
+        State._world_budget = budget
+
+    @staticmethod
+    def _check_world_budget(count):
+        """
+        Ensure the number of worlds in the ``count`` parameter is within the
+        world budget.
+
+        :raises WorldBudgetExceededError: ``count`` must not exceed the \
+        world budget.
+        """
+
+        budget = State._world_budget
+        if budget is not None and count > budget:
+            raise WorldBudgetExceededError(count, budget)
+
     def __init__(self, attribute_system, ascriptions={}):
         """
         Construct a State object.
@@ -62,20 +136,20 @@ class State(object):
 
         self._attribute_system = deepcopy(attribute_system)
         self._ascriptions = {}
+        self._shared_ascriptions = False
         self._is_State = True
 
-        # Initialize the state as empty
+        # Initialize the state as empty; ascriptions are immutable so every
+        # object shares the ValueSet of each Attribute
         for Ai in self._attribute_system._attribute_structure._attributes:
+            value_set = FrozenValueSet(Ai._value_set)
             for s_i in self._attribute_system._objects:
-                self._ascriptions[(Ai._label, s_i)] = deepcopy(Ai._value_set)
+                self._ascriptions[(Ai._label, s_i)] = value_set
 
         # Set any ascriptions provided to constructor
         for ao_pair, valueset in ascriptions.iteritems():
             self.set_ascription(ao_pair, valueset)
 
-        # break references by copying ascriptions
-        self._ascriptions = deepcopy(self._ascriptions)
-
     def __eq__(self, other):
         """
         Determine if two State objects are equal via the ``==`` operator.
@@ -119,9 +193,21 @@ class State(object):
 
         # for each attribute-object pair
         for ao_pair in ao_pairs:
+            self_values = self._ascriptions[ao_pair]
+            other_values = other._ascriptions[ao_pair]
+            # compare bitmasks when both ValueSets are within the finite
+            # domain of their Attribute and the bitmask subset relation
+            # agrees with that of ValueSet
+            self_mask = None
+            if State._is_listed(self_values):
+                self_mask, other_mask = self._get_bitmasks(
+                    ao_pair, self_values, other_values)
+            if self_mask is not None:
+                if self_mask & ~other_mask:
+                    return False
             # if the ValueSet of the ao-pair in this State is not a subset of
             # the corresponding ValueSet of the ao-pair in other State
-            if not self._ascriptions[ao_pair] <= other._ascriptions[ao_pair]:
+            elif not self_values <= other_values:
                 return False
 
         return True
@@ -135,10 +221,13 @@ class State(object):
 
     def __deepcopy__(self, memo):
         """
-        Deepcopy a State object via the ``copy.deepcopy`` method.
+        Deepcopy a State object via the ``copy.deepcopy`` method; the
+        ascriptions are immutable so they are shared with the copy.
         """
 
-        return State(self._attribute_system, self._ascriptions)
+        state_copy = State(self._attribute_system)
+        state_copy._ascriptions = dict(self._ascriptions)
+        return state_copy
 
     def __getitem__(self, key):
         """
@@ -245,21 +334,77 @@ class State(object):
                     raise ValueError(
                         "Invalid attribute-object pair: " + str(ao_pair))
 
-            self._attribute_system._objects = sorted(
-                self._attribute_system._objects + [obj])
-            # Extend ascriptions with new object
-            for Ai in attributes:
-                self._ascriptions[(Ai._label, obj)] = deepcopy(Ai._value_set)
+            self._add_object(obj, attributes)
 
             # Set any optional ascriptions
             for ao_pair, valueset in ascriptions.iteritems():
                 self.set_ascription(ao_pair, valueset)
         else:
-            self._attribute_system._objects = sorted(
-                self._attribute_system._objects + [obj])
-            # Extend ascriptions with new object
-            for Ai in attributes:
-                self._ascriptions[(Ai._label, obj)] = deepcopy(Ai._value_set)
+            self._add_object(obj, attributes)
+
+    def _add_object(self, obj, attributes):
+        """
+        Add the (validated) object ``obj`` to the calling State object with the
+        full ValueSet of each Attribute object in ``attributes`` as its
+        ascriptions; the AttributeSystem object and the ascriptions are copied
+        first if they're shared with another State object.
+        """
+
+        self._unshare_ascriptions()
+        # only the objects change, so the AttributeStructure is still shared
+        self._attribute_system = copy(self._attribute_system)
+        self._attribute_system._objects = sorted(
+            self._attribute_system._objects + [obj])
+        # Extend ascriptions with new object
+        for Ai in attributes:
+            self._ascriptions[(Ai._label, obj)] = FrozenValueSet(
+                Ai._value_set)
+
+    def _unshare_ascriptions(self):
+        """
+        Copy the ascriptions of the calling State object if they're shared
+        with another State object so they can be safely modified.
+        """
+
+        if self._shared_ascriptions:
+            self._ascriptions = dict(self._ascriptions)
+            self._shared_ascriptions = False
+
+    def _derive(self, ascriptions={}):
+        """
+        Return a State object derived from the calling State object that
+        shares its AttributeSystem object :math:`\mathcal{S}` and its
+        ascriptions by reference (copy-on-write); neither is copied until
+        ``set_ascription`` or ``add_object`` is called on either State object.
+
+        :param ascriptions: Already validated FrozenValueSet objects to \
+        ascribe to attribute-object pairs of the derived State object in \
+        place of those of the calling State object.
+        :type  ascriptions: ``dict``
+
+        :return: The derived State object.
+        :rtype: State
+        """
+
+        derived = object.__new__(State)
+        self._share(derived, ascriptions)
+        return derived
+
+    def _share(self, derived, ascriptions):
+        """
+        Initialize the State members of the uninitialized object ``derived``
+        from the calling State object; see ``_derive``.
+        """
+
+        derived._attribute_system = self._attribute_system
+        if ascriptions:
+            derived._ascriptions = dict(self._ascriptions)
+            derived._ascriptions.update(ascriptions)
+            derived._shared_ascriptions = False
+        else:
+            derived._ascriptions = self._ascriptions
+            self._shared_ascriptions = derived._shared_ascriptions = True
+        derived._is_State = True
 
     def get_alternate_extensions(self, *states):
         """
@@ -378,9 +523,9 @@ class State(object):
             Make an alternate extension from a single properly spanning list.
             """
 
-            # First make a new copy of this State and create the ascriptions
-            # available from the properly spanning list
-            ae = State(self._attribute_system, self._ascriptions)
+            # First derive a State sharing this State's ascriptions and create
+            # the ascriptions available from the properly spanning list
+            ae = State._derive(self)
             ascriptions = make_ascriptions(proper_spanning_list)
             # for each ascription, complement it w.r.t. the original ascription
             # and replace the original ascription with the complement
@@ -418,46 +563,284 @@ class State(object):
 
     def get_worlds(self):
         """
-        Return a list of all possible worlds :math:`(w;\widehat{\\rho})`
-        derivable from the calling State object.
+        Return a generator for the generation of all possible worlds
+        :math:`(w;\widehat{\\rho})` derivable from the calling State object.
 
-        :return: all worlds :math:`(w;\widehat{\\rho})` derivable from this \
-        State object.
-        :rtype: ``list``
+        Worlds are generated lazily, one at a time, so callers that stop at
+        the first world of interest never pay for the remaining worlds.
+
+        :return: A generator for the generation of all worlds \
+        :math:`(w;\widehat{\\rho})` derivable from this State object.
+        :rtype: ``generator``
+
+        :raises WorldBudgetExceededError: The number of worlds derivable \
+        from the calling State object must not exceed the world budget.
+        """
+
+        # check the budget here rather than in the generator so that an
+        # oversized State raises when get_worlds is called, not on the first
+        # call to next
+        State._check_world_budget(State.count_worlds(self))
+
+        return State._generate_worlds(self)
+
+    def _generate_worlds(self):
+        """
+        Return a generator for the generation of all possible worlds
+        :math:`(w;\widehat{\\rho})` derivable from the calling State object
+        without checking the world budget (see ``get_worlds``).
+
+        :return: A generator for the generation of all worlds \
+        :math:`(w;\widehat{\\rho})` derivable from this State object.
+        :rtype: ``generator``
         """
 
         from itertools import product
 
-        # get a copy of the ascriptions
-        ascription_list = [item for item in self._ascriptions.items()]
-        new_valuesets = []
-        labels = []
-        # for each ascription
-        for (label, valueset) in ascription_list:
-            # discretize any Intervals within the valueset
-            new_valueset = []
+        labels, new_valuesets = self._discretize_ascriptions()
+
+        # create each possible world from this State one at a time; product
+        # is itself lazy so the full set of combinations is never built.
+        # Every world shares this State's AttributeSystem and each value was
+        # drawn from this State's ascriptions so none needs validation.
+        for values in product(*new_valuesets):
+            yield State._derive(self, {
+                label: FrozenValueSet([value])
+                for label, value in zip(labels, values)})
+
+    def count_worlds(self):
+        """
+        Return the number of worlds derivable from the calling State object,
+        computed from the sizes of its ValueSets and the lengths of the
+        Intervals within them, without enumerating any worlds.
+
+        :return: The number of worlds derivable from the calling State object.
+        :rtype: ``int`` | ``long``
+        """
+
+        count = 1
+        for valueset in self._ascriptions.itervalues():
+            size = 0
             for value in valueset:
                 if hasattr(value, "_is_Interval"):
-                    new_valueset.extend(value.discretize())
+                    size += value.count_values()
                 else:
-                    new_valueset.append(value)
-            # set ascription to discretized version
-            new_valuesets.append(new_valueset)
-            labels.append(label)
+                    size += 1
+            count *= size
+
+        return count
+
+    def get_projected_valuations(self, basis, spread=False):
+        """
+        Return a generator for the generation of every distinct valuation of
+        the attribute-object pairs in the ``basis`` parameter derivable from
+        the calling State object, i.e., the worlds derivable from this State
+        object projected onto ``basis``. Attribute-object pairs outside of
+        ``basis`` are never enumerated, so the number of valuations generated
+        is the product of the sizes of the discretized ValueSets of the
+        attribute-object pairs in ``basis`` alone.
+
+        If the ``spread`` parameter is ``True``, the valuations are generated
+        so that valuations that differ the most come up first: the values of
+        each attribute-object pair are ordered extremes first (e.g. the
+        bounds of an Interval before its midpoint) and the valuations are
+        generated in layers of increasing depth into these orderings, so
+        every combination of extreme values is generated before any interior
+        value is used.
+
+        :param basis: The attribute-object pairs to project onto (e.g., the \
+        result of ``Formula.get_basis``).
+        :type  basis: ``list``
+        :param spread: Whether or not to generate the valuations extremes \
+        first.
+        :type  spread: ``bool``
+
+        :return: A generator for the generation of tuples of values; the \
+        i-th value of each tuple is the value of the i-th attribute-object \
+        pair in ``basis``.
+        :rtype: ``generator``
+
+        :raises KeyError: Every attribute-object pair in ``basis`` must be in \
+        the calling State object.
+        """
+
+        from itertools import product
+
+        labels, new_valuesets = self._discretize_ascriptions(basis)
+
+        if spread:
+            new_valuesets = [State._spread_values(valueset)
+                             for valueset in new_valuesets]
+            for values in State._generate_layered_product(new_valuesets):
+                yield values
+            return
+
+        for values in product(*new_valuesets):
+            yield values
+
+    @staticmethod
+    def _spread_values(values):
+        """
+        Reorder the list of values in the ``values`` parameter extremes
+        first, i.e., the first and last values, then the value halfway
+        between them, then the values a quarter of the way, and so on.
+
+        :param values: The list of values to reorder.
+        :type  values: ``list``
+
+        :return: The reordered list of values.
+        :rtype: ``list``
+        """
+
+        from collections import deque
 
-        combos = list(product(*new_valuesets))
+        if len(values) <= 2:
+            return list(values)
 
-        worlds = []
+        order = [0, len(values) - 1]
+        intervals = deque([(0, len(values) - 1)])
+        while intervals:
+            low, high = intervals.popleft()
+            if high - low > 1:
+                middle = (low + high) // 2
+                order.append(middle)
+                intervals.append((low, middle))
+                intervals.append((middle, high))
 
-        # create each possible world from this NamedState and
-        # return them in a list.
-        for values in combos:
-            world = State(self._attribute_system)
-            for i, label in enumerate(labels):
-                world.set_ascription(label, [values[i]])
-            worlds.append(world)
+        return [values[i] for i in order]
 
-        return worlds
+    @staticmethod
+    def _generate_layered_product(valuesets):
+        """
+        Generate the cartesian product of the lists in the ``valuesets``
+        parameter in layers; layer :math:`k` consists of the tuples whose
+        largest index into any list is :math:`k`, so every tuple drawn from
+        the first :math:`k` values of each list is generated before any
+        tuple using a :math:`(k+1)`\ th value.
+
+        :param valuesets: The lists to take the product of.
+        :type  valuesets: ``list``
+
+        :return: A generator for the generation of the tuples of the product.
+        :rtype: ``generator``
+        """
+
+        from itertools import product
+
+        if not valuesets:
+            yield ()
+            return
+
+        if not all(valuesets):
+            return
+
+        for depth in range(max([len(valueset) for valueset in valuesets])):
+            # the i-th list is the first to be at the current depth
+            for i, valueset in enumerate(valuesets):
+                if len(valueset) <= depth:
+                    continue
+                ranges = [v[:depth] for v in valuesets[:i]] + \
+                    [[valueset[depth]]] + \
+                    [v[:depth + 1] for v in valuesets[i + 1:]]
+                for values in product(*ranges):
+                    yield values
+
+    def get_fingerprint(self, ao_pairs):
+        """
+        Return a hashable fingerprint of the contents of the ascriptions of
+        the attribute-object pairs in the ``ao_pairs`` parameter; State (and
+        World) objects ascribing the same values in the same order to these
+        attribute-object pairs have the same fingerprint. Every value is
+        paired with its type so that e.g. ``1``, ``1.0`` and ``True`` are told
+        apart.
+
+        :param ao_pairs: The attribute-object pairs to fingerprint.
+        :type  ao_pairs: ``list``
+
+        :return: A tuple holding a tuple of (type, value) pairs for each \
+        attribute-object pair in ``ao_pairs``.
+        :rtype: ``tuple``
+
+        :raises KeyError: Every attribute-object pair in ``ao_pairs`` must \
+        be in the calling State object.
+        """
+
+        return tuple(tuple((type(value), value) for value in self[ao_pair])
+                     for ao_pair in ao_pairs)
+
+    def _get_bitmasks(self, ao_pair, *value_sets):
+        """
+        Return the bitmasks of the ValueSet objects in the optional
+        positional arguments w.r.t. the finite domain of the Attribute object
+        labeled by the attribute of the ``ao_pair`` parameter (see
+        ``Attribute.get_bitmask``).
+
+        :param ao_pair: The attribute-object pair the ValueSet objects are \
+        ascribed to.
+        :type  ao_pair: ``tuple``
+
+        :return: The bitmask of every ValueSet object or ``None`` for each \
+        ValueSet object if some ValueSet object has no bitmask.
+        :rtype: ``list``
+        """
+
+        attribute = self._attribute_system._attribute_structure[ao_pair[0]]
+        bitmasks = []
+        for value_set in value_sets:
+            bitmask = attribute.get_bitmask(value_set)
+            if bitmask is None:
+                return [None] * len(value_sets)
+            bitmasks.append(bitmask)
+
+        return bitmasks
+
+    @staticmethod
+    def _is_listed(value_set):
+        """
+        Determine if the ValueSet object in the ``value_set`` parameter
+        contains no Interval objects; only then does the subset relation of
+        bitmasks (see ``_get_bitmasks``) agree with ``ValueSet.__le__``, under
+        which an Interval is only a subset of an Interval containing it and
+        not of its values listed one by one.
+
+        :return: Whether or not ``value_set`` contains no Interval objects.
+        :rtype: ``bool``
+        """
+
+        return not value_set._type_lists.get("_is_Interval")
+
+    def _discretize_ascriptions(self, ao_pairs=None):
+        """
+        Discretize the ascriptions of the calling State object, i.e., replace
+        any Interval object within the ValueSet of each attribute-object pair
+        by its discrete values.
+
+        :param ao_pairs: The attribute-object pairs to discretize (in order) \
+        or ``None`` to discretize every ascription.
+        :type  ao_pairs: ``list`` | ``None``
+
+        :return: A 2-tuple consisting of the list of attribute-object pairs \
+        and the list of sequences of their corresponding discretized values \
+        (see ``ValueSet.discretize``), which must not be modified.
+        :rtype: ``tuple``
+        """
+
+        if ao_pairs is None:
+            ascriptions = self._ascriptions.iteritems()
+        else:
+            ascriptions = [(ao_pair, self._ascriptions[ao_pair])
+                           for ao_pair in ao_pairs]
+
+        new_valuesets = []
+        labels = []
+        # for each ascription, discretize any Intervals within the valueset;
+        # the discretization of a FrozenValueSet is memoized and shared by
+        # every State ascribing it
+        for (label, valueset) in ascriptions:
+            new_valuesets.append(valueset.discretize())
+            labels.append(label)
+
+        return labels, new_valuesets
 
     def is_alternate_extension(self, s_prime, *states):
         """
@@ -507,13 +890,26 @@ class State(object):
         :rtype: ``bool``
         """
 
-        # get all possible worlds for both States
-        self_worlds = self.get_worlds()
-        other_worlds = other.get_worlds()
-
-        # iterate over both sets of worlds and compare
-        for self_world in self_worlds:
-            for other_world in other_worlds:
+        # the worlds of two States of the same AttributeSystem are disjoint
+        # iff some pair of their ascriptions is; decide it from bitmasks
+        # when every ascription is within the finite domain of its Attribute.
+        # The worlds of NamedStates also carry their ConstantAssignments.
+        is_named = hasattr(self, "_is_NamedState") or \
+            hasattr(other, "_is_NamedState")
+        if not is_named and \
+                self._attribute_system == other._attribute_system:
+            masks = [self._get_bitmasks(ao_pair, values,
+                                        other._ascriptions[ao_pair])
+                     for ao_pair, values in self._ascriptions.iteritems()]
+            if all([self_mask is not None for self_mask, _ in masks]):
+                return any([not self_mask & other_mask
+                            for self_mask, other_mask in masks])
+
+        # iterate over both sets of worlds and compare; the worlds of other
+        # are regenerated for each world of this State as they're generated
+        # lazily
+        for self_world in self.get_worlds():
+            for other_world in other.get_worlds():
                 # if both states share some world, they're not disjoint
                 if self_world == other_world:
                     return False
@@ -600,11 +996,11 @@ class State(object):
                 "ao_pair must be a 2-tuple of strings (label, object)")
 
         new_values = None
-        # Enforce new_value_set as a list, set, or ValueSet
-        if isinstance(new_valueset, list) or isinstance(new_valueset, set):
-            new_values = ValueSet(new_valueset)
-        elif hasattr(new_valueset, "_is_ValueSet"):
-            new_values = deepcopy(new_valueset)
+        # Enforce new_value_set as a list, set, or ValueSet; ascriptions are
+        # stored as FrozenValueSets so they can be shared between States
+        if isinstance(new_valueset, list) or isinstance(new_valueset, set) or \
+                hasattr(new_valueset, "_is_ValueSet"):
+            new_values = FrozenValueSet(new_valueset)
         else:
             raise TypeError(
                 "Ascription values must be of type list, set, or ValueSet")
@@ -621,8 +1017,12 @@ class State(object):
             possible_values = attribute._value_set
 
             # If new value_set provided is a subset of the possible value_set
-            # of the Attribute
-            if new_values <= possible_values:
+            # of the Attribute, i.e., lists values that all have a bitmask
+            # w.r.t. its finite domain
+            is_in_domain = State._is_listed(new_values) and \
+                attribute.get_bitmask(new_values) is not None
+            if is_in_domain or new_values <= possible_values:
+                self._unshare_ascriptions()
                 self._ascriptions[ao_pair] = new_values
             else:
                 raise ValueError(
@@ -655,7 +1055,8 @@ class State(object):
 
         ao_pairs = s1._ascriptions.keys()
         join_ascriptions = {
-            ao_pair: s1[ao_pair] + s2[ao_pair] for ao_pair in ao_pairs}
+            ao_pair: FrozenValueSet(s1[ao_pair] + s2[ao_pair])
+            for ao_pair in ao_pairs}
 
         join_state = State(s1._attribute_system)
 
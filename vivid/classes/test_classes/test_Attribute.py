@@ -79,6 +79,8 @@ def test___deepcopy__():
 
     assert a == a_copy
     assert a is not a_copy
+    assert a_copy._bit_positions is a._bit_positions
+    assert a_copy._bitmasks is a._bitmasks
 
 
 def test___str__():
@@ -111,3 +113,69 @@ def test___hash__():
     B = Attribute("", [])
     assert type(hash(B._key())) == int
     assert type(hash(A._key())) == int
+
+
+def test_get_bitmask():
+    """Test get_bitmask function for Attribute."""
+    from vivid.classes.valueset import ValueSet, FrozenValueSet
+    from vivid.classes.interval import Interval
+    from vivid.classes.point import Point
+
+    hour = Attribute("hour", [Interval(0, 23)])
+    assert hour.get_bitmask(ValueSet([0])) == 1
+    assert hour.get_bitmask(ValueSet([2, 5])) == (1 << 2) | (1 << 5)
+    assert hour.get_bitmask(ValueSet([Interval(0, 23)])) == (1 << 24) - 1
+    assert hour.get_bitmask(ValueSet([Interval(2, 4)])) == \
+        hour.get_bitmask(ValueSet([2, 3, 4]))
+    # values outside the domain or of another type have no bitmask
+    assert hour.get_bitmask(ValueSet([24])) is None
+    assert hour.get_bitmask(ValueSet([2.0])) is None
+    assert hour.get_bitmask(ValueSet([2L])) is None
+    assert hour.get_bitmask(ValueSet([Interval(0, 10 ** 6)])) is None
+    assert hour.get_bitmask(ValueSet([Interval(0.0, 1.0)])) is None
+    assert hour.get_bitmask(ValueSet([Point(1.0)])) is None
+
+    # bitmasks of FrozenValueSets are cached
+    frozen = FrozenValueSet([Interval(10, 13)])
+    assert hour.get_bitmask(frozen) == 0b11110000000000
+    assert hour._bitmasks[frozen._content_key] == 0b11110000000000
+    assert hour.get_bitmask(FrozenValueSet([24])) is None
+
+    # Attributes without a small finite domain have no bitmasks
+    assert Attribute("x", [Interval(0.0, 1.0)]).get_bitmask(
+        ValueSet([0.5])) is None
+    assert Attribute("p", [Point(1.0)]).get_bitmask(
+        ValueSet([Point(1.0)])) is None
+
+
+def test__get_bit_positions():
+    """Test _get_bit_positions function for Attribute."""
+    from vivid.classes.interval import Interval
+    from vivid.classes.point import Point
+
+    a = Attribute("a", ['b', 1, True, Interval(3, 5)])
+    assert a._bit_positions is None
+    positions = a._get_bit_positions()
+    assert sorted(positions.values()) == range(6)
+    assert set(positions.keys()) == set(
+        [(int, 1), (int, 3), (int, 4), (int, 5), (str, 'b'), (bool, True)])
+    assert a._get_bit_positions() is positions
+
+    assert Attribute("a", [Interval(0.0, 1.0)])._get_bit_positions() == {}
+    assert Attribute("a", [Point(1.0)])._get_bit_positions() == {}
+    assert Attribute("a", [Interval(0, 10 ** 6)])._get_bit_positions() == {}
+
+
+def test__get_bit_keys():
+    """Test _get_bit_keys function for Attribute."""
+    from vivid.classes.interval import Interval
+    from vivid.classes.point import Point
+
+    assert Attribute._get_bit_keys('a') == [(str, 'a')]
+    assert Attribute._get_bit_keys(1.5) == [(float, 1.5)]
+    assert Attribute._get_bit_keys(Interval(1L, 2L)) == [(long, 1L),
+                                                          (long, 2L)]
+    with pytest.raises(ValueError) as excinfo:
+        Attribute._get_bit_keys(Interval(0.0, 1.0))
+    with pytest.raises(TypeError) as excinfo:
+        Attribute._get_bit_keys(Point(1.0))
@@ -336,6 +336,35 @@ def test___iter__():
     assert ai._table == [entry for entry in iter(ai)]
 
 
+def test_get_entry():
+    """Test get_entry() function for AttributeInterpretation object."""
+    a = Attribute('hour', ['0,...,23'])
+    a2 = Attribute('minute', ['0,...,59'])
+    r_ahead = Relation('R1(h1,m1,h2,m2) <=> h1 > h2 or (h1 = h2 and m1 > m2)',
+                       ['hour', 'minute', 'hour', 'minute'], 1)
+    r_pm = Relation('R3(h1) <=> h1 > 12', ['hour'], 3)
+    attribute_structure = AttributeStructure(a, a2, r_ahead, r_pm)
+
+    ahead_rs = RelationSymbol('Ahead', 4)
+    pm_rs = RelationSymbol('PM', 1)
+    vocabulary = Vocabulary(['C1', 'C2'], [ahead_rs, pm_rs], ['V1', 'V2'])
+
+    profiles = [
+        [ahead_rs, ('hour', 1), ('minute', 1), ('hour', 2), ('minute', 2)],
+        [pm_rs, ('hour', 1)]
+    ]
+
+    ai = AttributeInterpretation(
+        vocabulary, attribute_structure, {ahead_rs: 1, pm_rs: 3}, profiles)
+
+    for entry in ai:
+        assert ai.get_entry(entry[0]._name) is entry
+    assert ai.get_entry('PM') == [pm_rs, 1, 'R3', [('hour', 1)]]
+
+    with pytest.raises(KeyError) as excinfo:
+        ai.get_entry('Behind')
+
+
 def test___str__():
     """Test str(AttributeInterpretation)."""
     a = Attribute('hour', ['0,...,23'])
@@ -229,6 +229,36 @@ def test___deepcopy__():
     assert CA._mapping is not CA_copy._mapping
 
 
+def test__derive():
+    """Test _derive function for ConstantAssignment object."""
+    vocabulary = Vocabulary(['C', 'D'], [RelationSymbol('R', 1)], ['V'])
+
+    a = Attribute("a", [])
+    b = Attribute("b", [])
+    astr = AttributeStructure(a, b)
+    objs = ['a', 'b', 'c']
+    attribute_system = AttributeSystem(astr, objs)
+
+    CA = ConstantAssignment(vocabulary, attribute_system, {'C': 'a'})
+
+    CA_derived = CA._derive()
+    assert CA == CA_derived
+    assert CA is not CA_derived
+    assert CA._vocabulary is CA_derived._vocabulary
+    assert CA._attribute_system is CA_derived._attribute_system
+    assert CA._mapping is not CA_derived._mapping
+
+    CA_derived.add_mapping('D', 'b')
+    assert CA._mapping == {'C': 'a'}
+    assert CA_derived._source == ['C', 'D'] or \
+        CA_derived._source == ['D', 'C']
+
+    CA_derived = CA._derive({'C': 'a', 'D': 'c'}, attribute_system)
+    assert CA_derived._attribute_system is attribute_system
+    assert CA_derived['D'] == 'c'
+    assert CA_derived > CA
+
+
 def test_add_mapping():
     """Test add_mapping function for ConstantAssignment."""
     def test_TypeError(constant_assignment, constant_symbol, obj):
@@ -382,6 +382,18 @@ def test_entails_formula():
         assert context.entails_formula(f3, attribute_interpretation)
         assert context.entails_formula(f4, attribute_interpretation)
 
+        # 3 worlds with a single VariableAssignment each
+        from vivid.classes.state import State, WorldBudgetExceededError
+        try:
+            State.set_world_budget(2)
+            with pytest.raises(WorldBudgetExceededError) as excinfo:
+                context.entails_formula(f1, attribute_interpretation)
+            assert excinfo.value.count == 3
+            State.set_world_budget(3)
+            assert context.entails_formula(f1, attribute_interpretation)
+        finally:
+            State.set_world_budget(None)
+
         vocabulary = Vocabulary(
             ['C1'], [rs_ahead, rs_behind, rs_pm, rs_am], ['V1', 'V2'])
 
@@ -424,6 +436,52 @@ def test_entails_formula():
         assert not context.entails_formula(f4, attribute_interpretation)
         assert context.entails_formula(f5, attribute_interpretation)
 
+        # checking the worlds across worker processes gives the same results
+        for processes in [1, 2, 3]:
+            for f in [f1, f2, f3, f5]:
+                assert context.entails_formula(
+                    f, attribute_interpretation, processes=processes)
+            assert not context.entails_formula(
+                f4, attribute_interpretation, processes=processes)
+
+        # once a counterexample is found, the other workers stop checking
+        # their chunks; each chunk generates its worlds from its bounds
+        from multiprocessing import Event
+        from vivid.classes import context as context_module
+        world_count = named_state.count_worlds(True)
+        cancelled = Event()
+        context_module._initialize_worker(
+            cancelled, context, f4, attribute_interpretation)
+        assert context_module._check_chunk((0, world_count))
+        assert cancelled.is_set()
+
+        checked = []
+        refutes = context._refutes
+
+        def cancel_after_first(world, target, attribute_interpretation):
+            """Check one world, then cancel as another worker would."""
+            checked.append(world)
+            cancelled.set()
+            return False
+
+        try:
+            context._refutes = cancel_after_first
+            cancelled.clear()
+            assert not context_module._check_chunk((0, world_count))
+            assert len(checked) == 1
+            assert not context_module._check_chunk((1, world_count))
+            assert len(checked) == 1
+        finally:
+            context._refutes = refutes
+            context_module._worker.clear()
+
+        with pytest.raises(TypeError) as excinfo:
+            context.entails_formula(f1, attribute_interpretation, '2')
+        with pytest.raises(TypeError) as excinfo:
+            context.entails_formula(f1, attribute_interpretation, 2.0)
+        with pytest.raises(ValueError) as excinfo:
+            context.entails_formula(f1, attribute_interpretation, 0)
+
     def point_test():
         """Do test with Point object and its parser."""
         from vivid.classes.point import Point
@@ -496,8 +554,34 @@ def test_entails_formula():
         assert context.entails_formula(f3, attribute_interpretation)
         assert context.entails_formula(f4, attribute_interpretation)
 
+    def partial_test():
+        """Test entailment w.r.t. more constants than objects."""
+        hour = Attribute('hour', [3, 4])
+        r_big = Relation('R1(h1) <=> h1 > 2', ['hour'], 1)
+        attribute_structure = AttributeStructure(hour, r_big)
+
+        rs_big = RelationSymbol('BIG', 1)
+        vocabulary = Vocabulary(['C1', 'C2'], [rs_big], [])
+        attribute_interpretation = AttributeInterpretation(
+            vocabulary, attribute_structure, {rs_big: 1},
+            [[rs_big, ('hour', 1)]])
+
+        attribute_system = AttributeSystem(attribute_structure, ['s1'])
+        p = ConstantAssignment(vocabulary, attribute_system, {})
+        context = Context(AssumptionBase(vocabulary),
+                          NamedState(attribute_system, p))
+
+        # no world can bind both constants to objects so the worlds
+        # derivable from the NamedState are not worlds
+        f = Formula(vocabulary, 'BIG', 'C1')
+        with pytest.raises(ValueError) as excinfo:
+            context.entails_formula(f, attribute_interpretation)
+        with pytest.raises(ValueError) as excinfo:
+            context.entails_formula(f, attribute_interpretation, processes=2)
+
     standard_test()
     point_test()
+    partial_test()
 
 
 def test_entails_named_state():
@@ -583,6 +667,10 @@ def test_entails_named_state():
         # context do not extend the named state
         assert not context.entails_named_state(
             named_state, attribute_interpretation)
+        assert not context.entails_named_state(
+            named_state, attribute_interpretation, processes=2)
+        assert context.entails_named_state(
+            context._named_state, attribute_interpretation, processes=2)
 
         f1 = Formula(vocabulary, 'PM', 'C1')
         assumption_base = AssumptionBase(f1)
@@ -715,5 +803,103 @@ def test_entails_named_state():
         assert context.entails_named_state(
             named_state, attribute_interpretation)
 
+    def symmetry_test():
+        """Do test with interchangeable objects."""
+        hour = Attribute('hour', [Interval(10, 13)])
+        r_pm = Relation('R1(h1) <=> h1 > 11', ['hour'], 1)
+        attribute_structure = AttributeStructure(hour, r_pm)
+        rs_pm = RelationSymbol('PM', 1)
+        vocabulary = Vocabulary(['C1'], [rs_pm], [])
+        attribute_system = AttributeSystem(attribute_structure, ['s1', 's2'])
+        attribute_interpretation = AttributeInterpretation(
+            vocabulary, attribute_structure, {rs_pm: 1}, [[rs_pm, ('hour', 1)]])
+
+        p = ConstantAssignment(vocabulary, attribute_system, {})
+        named_state = NamedState(attribute_system, p, {})
+        context = Context(
+            AssumptionBase(Formula(vocabulary, 'PM', 'C1')), named_state)
+
+        # s1 and s2 are interchangeable in the context but not in the named
+        # state; C1 may be s2 while s1 is 10
+        named_state = NamedState(attribute_system, p, {
+                                 ('hour', 's1'): [Interval(12, 13)]})
+        assert not context.entails_named_state(
+            named_state, attribute_interpretation)
+        assert not context.entails_named_state(
+            named_state, attribute_interpretation, processes=2)
+
+        assert context.entails_named_state(
+            context._named_state, attribute_interpretation)
+
     standard_test()
     point_test()
+    symmetry_test()
+
+
+def test__get_cache_key():
+    """Test _get_cache_key() function for Context."""
+    hour = Attribute('hour', [Interval(0, 23)])
+    r_pm = Relation('R1(h1) <=> h1 > 11', ['hour'], 1)
+    r_am = Relation('R2(h1) <=> h1 <= 11', ['hour'], 2)
+    attribute_structure = AttributeStructure(hour, r_pm, r_am)
+    rs_pm = RelationSymbol('PM', 1)
+    rs_am = RelationSymbol('AM', 1)
+    vocabulary = Vocabulary(['C1', 'C2'], [rs_pm, rs_am], [])
+    attribute_system = AttributeSystem(attribute_structure, ['s1', 's2'])
+    attribute_interpretation = AttributeInterpretation(
+        vocabulary, attribute_structure, {rs_pm: 1, rs_am: 2},
+        [[rs_pm, ('hour', 1)], [rs_am, ('hour', 1)]])
+
+    p = ConstantAssignment(
+        vocabulary, attribute_system, {'C1': 's1', 'C2': 's2'})
+    named_state = NamedState(attribute_system, p, {
+                             ('hour', 's1'): [Interval(12, 13)],
+                             ('hour', 's2'): [Interval(12, 13)]})
+    context = Context(AssumptionBase(vocabulary), named_state)
+    pm_c1 = Formula(vocabulary, 'PM', 'C1')
+    am_c1 = Formula(vocabulary, 'AM', 'C1')
+
+    from copy import deepcopy
+    size = Formula._cache_size
+    try:
+        Formula.set_cache_size(0)
+        assert context._get_cache_key(pm_c1, attribute_interpretation) is None
+
+        Formula.clear_cache()
+        Formula.set_cache_size(64)
+        key = context._get_cache_key(pm_c1, attribute_interpretation)
+        assert hash(key) == hash(context._get_cache_key(
+            pm_c1, attribute_interpretation))
+        assert key == deepcopy(context)._get_cache_key(
+            pm_c1, attribute_interpretation)
+        assert key != context._get_cache_key(am_c1, attribute_interpretation)
+        assert key != context._get_cache_key(
+            Formula(vocabulary, 'PM', 'C2'), attribute_interpretation)
+        assert key != context._get_cache_key(
+            named_state, attribute_interpretation)
+
+        # a Context with different ascriptions has a different key
+        other_state = NamedState(attribute_system, p, {
+                                 ('hour', 's1'): [Interval(10, 13)],
+                                 ('hour', 's2'): [Interval(12, 13)]})
+        other_context = Context(AssumptionBase(vocabulary), other_state)
+        assert key != other_context._get_cache_key(
+            pm_c1, attribute_interpretation)
+
+        # repeated entailments are looked up rather than checked again
+        assert context.entails_formula(pm_c1, attribute_interpretation)
+        hits = Formula.get_cache_info().hits
+        assert deepcopy(context).entails_formula(
+            pm_c1, attribute_interpretation)
+        assert Formula.get_cache_info().hits == hits + 1
+        assert not other_context.entails_formula(
+            pm_c1, attribute_interpretation)
+        assert Formula.get_cache_info().hits == hits + 1
+        assert context.entails_named_state(
+            named_state, attribute_interpretation)
+        assert context.entails_named_state(
+            named_state, attribute_interpretation)
+        assert Formula.get_cache_info().hits == hits + 2
+    finally:
+        Formula.set_cache_size(size)
+        Formula.clear_cache()
@@ -0,0 +1,99 @@
+"""DiscreteRange class unit tests."""
+
+import pytest
+from vivid.classes.interval import DiscreteRange
+
+
+def test___init__():
+    """Test DiscreteRange constructor."""
+    r = DiscreteRange(2, 3, 4)
+    assert r._start == 2
+    assert r._jump == 3
+    assert r._length == 4
+
+
+def test___len__():
+    """Test len of DiscreteRange."""
+    assert len(DiscreteRange(0, 1, 0)) == 0
+    assert len(DiscreteRange(0, 1, 10 ** 9)) == 10 ** 9
+
+
+def test___getitem__():
+    """Test indexing of DiscreteRange."""
+    r = DiscreteRange(2, 3, 4)
+    assert [r[0], r[1], r[3]] == [2, 5, 11]
+    assert r[-1] == 11
+    assert r[-4] == 2
+    assert r[1:3] == [5, 8]
+    assert r[::-2] == [11, 5]
+    assert DiscreteRange(0.0, .5, 3)[2] == 1.0
+    assert type(DiscreteRange(0L, 1L, 3)[2]) is long
+
+    with pytest.raises(IndexError) as excinfo:
+        r[4]
+    with pytest.raises(IndexError) as excinfo:
+        r[-5]
+    with pytest.raises(TypeError) as excinfo:
+        r['0']
+    with pytest.raises(TypeError) as excinfo:
+        r[1.0]
+
+
+def test___iter__():
+    """Test iteration over DiscreteRange."""
+    assert [v for v in DiscreteRange(2, 3, 4)] == [2, 5, 8, 11]
+    assert [v for v in DiscreteRange(0.0, .5, 3)] == [0.0, .5, 1.0]
+    assert list(DiscreteRange(0, 1, 0)) == []
+
+
+def test___contains__():
+    """Test membership in DiscreteRange."""
+    r = DiscreteRange(2, 3, 4)
+    assert 2 in r
+    assert 11 in r
+    assert 3 not in r
+    assert 14 not in r
+    assert -1 not in r
+    assert .5 in DiscreteRange(0.0, .5, 3)
+    assert .25 not in DiscreteRange(0.0, .5, 3)
+
+    # membership is that of the list of values, so equal numbers of other
+    # types are in it too
+    assert 2.0 in r
+    assert 2L in r
+    assert 5.5 not in r
+    assert 1 in DiscreteRange(0.0, .5, 3)
+    assert True in DiscreteRange(0, 1, 3)
+    for r in [DiscreteRange(2, 3, 4), DiscreteRange(0.0, .5, 5),
+              DiscreteRange(2.56, .01, 431), DiscreteRange(0L, 2L, 5)]:
+        for value in list(r) + [-1, 2.5, 3.25, 11, 2.565, 7L, '2', None,
+                                float('nan'), float('inf')]:
+            assert (value in r) == (value in list(r))
+
+
+def test___eq__():
+    """Test == operator for DiscreteRange."""
+    r = DiscreteRange(2, 3, 4)
+    assert r == [2, 5, 8, 11]
+    assert [2, 5, 8, 11] == r
+    assert r == DiscreteRange(2, 3, 4)
+    assert not r == [2, 5, 8]
+    assert not r == [2, 5, 8, 12]
+    assert not r == 2
+
+
+def test___ne__():
+    """Test != operator for DiscreteRange."""
+    r = DiscreteRange(2, 3, 4)
+    assert r != [2, 5, 8]
+    assert not r != [2, 5, 8, 11]
+
+
+def test___str__():
+    """Test str(DiscreteRange)."""
+    assert str(DiscreteRange(2, 3, 4)) == "DR(2, 3, 4)"
+
+
+def test___repr__():
+    """Test repr(DiscreteRange)."""
+    assert repr(DiscreteRange(2, 3, 4)) == "DR(2, 3, 4)"
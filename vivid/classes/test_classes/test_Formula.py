@@ -302,6 +302,124 @@ def test_assign_truth_value():
     test_ValueError(bad_t_f, attribute_interpretation, named_state, VA)
     assert f.assign_truth_value(attribute_interpretation, named_state, VA)
 
+    # only the basis of the formula is enumerated; the remaining 48 objects
+    # each take every hour and minute
+    objects = ['s' + str(i) for i in range(1, 51)]
+    attribute_system = AttributeSystem(attribute_structure, objects)
+    p = ConstantAssignment(
+        vocabulary, attribute_system, {'C1': 's1', 'C2': 's2'})
+    named_state = NamedState(attribute_system, p, {
+                             ('hour', 's1'): [9, 13],
+                             ('minute', 's1'): [12],
+                             ('hour', 's2'): [8],
+                             ('minute', 's2'): [27]})
+    assert f.assign_truth_value(
+        attribute_interpretation, named_state, VA) is True
+    named_state.set_ascription(('hour', 's2'), [Interval(8, 10)])
+    assert f.assign_truth_value(
+        attribute_interpretation, named_state, VA) == "unknown"
+
+    # symbolic evaluation agrees with enumeration
+    for ascription, truth_value in [([Interval(8, 10)], "unknown"),
+                                    ([Interval(0, 8)], True),
+                                    ([Interval(14, 23)], False)]:
+        named_state.set_ascription(('hour', 's2'), ascription)
+        assert f.assign_truth_value(
+            attribute_interpretation, named_state, VA) == truth_value
+        assert f.assign_truth_value(
+            attribute_interpretation, named_state, VA,
+            symbolic=True) == truth_value
+        assert f.assign_truth_value(
+            attribute_interpretation, named_state, VA,
+            spread=True) == truth_value
+        assert f.assign_truth_value(
+            attribute_interpretation, named_state, VA,
+            vectorized=True) == truth_value
+    named_state.set_ascription(('hour', 's1'), [Interval(9, 13)])
+    named_state.set_ascription(('minute', 's1'), [Interval(30, 59)])
+    named_state.set_ascription(('hour', 's2'), [9, 13])
+    named_state.set_ascription(('minute', 's2'), [Interval(0, 29)])
+    assert f.assign_truth_value(
+        attribute_interpretation, named_state, VA, symbolic=True) == \
+        "unknown"
+    named_state.set_ascription(('hour', 's1'), [13])
+    assert f.assign_truth_value(
+        attribute_interpretation, named_state, VA, symbolic=True) is True
+
+    # over float Intervals, symbolic evaluation falls back to enumeration
+    # rather than answer unknown, e.g., when a variable occurs more than once
+    time = Attribute('time', [Interval(0.0, 24.0)])
+    r_zero = Relation('R1(h1) <=> h1 - h1 = 0', ['time'], 1)
+    r_half = Relation('R2(h1) <=> h1 * 2 = trunc(h1 * 2)', ['time'], 2)
+    zero_rs = RelationSymbol('ZERO', 1)
+    half_rs = RelationSymbol('HALF', 1)
+    float_vocabulary = Vocabulary(['C1'], [zero_rs, half_rs], [])
+    float_attribute_interpretation = AttributeInterpretation(
+        float_vocabulary, AttributeStructure(time, r_zero, r_half),
+        {zero_rs: 1, half_rs: 2}, [[zero_rs, ('time', 1)],
+                                   [half_rs, ('time', 1)]])
+    float_attribute_system = AttributeSystem(
+        AttributeStructure(time, r_zero, r_half), ['s1'])
+    float_named_state = NamedState(
+        float_attribute_system,
+        ConstantAssignment(
+            float_vocabulary, float_attribute_system, {'C1': 's1'}),
+        {('time', 's1'): [Interval(0.0, 3.0)]})
+    float_VA = VariableAssignment(
+        float_vocabulary, float_attribute_system, {}, dummy=True)
+    for name in ['ZERO', 'HALF']:
+        formula = Formula(float_vocabulary, name, 'C1')
+        assert formula.assign_truth_value(
+            float_attribute_interpretation, float_named_state,
+            float_VA) is True
+        assert formula.assign_truth_value(
+            float_attribute_interpretation, float_named_state, float_VA,
+            symbolic=True) is True
+
+    # symbolic evaluation keeps the discretized semantics: 1.5 is within
+    # Interval(0.0, 3.0) but not among its discretized values
+    r_exact = Relation('R1(h1) <=> h1 = 1.5', ['time'], 1)
+    exact_rs = RelationSymbol('EXACT', 1)
+    exact_vocabulary = Vocabulary(['C1'], [exact_rs], [])
+    exact_attribute_interpretation = AttributeInterpretation(
+        exact_vocabulary, AttributeStructure(time, r_exact), {exact_rs: 1},
+        [[exact_rs, ('time', 1)]])
+    exact_attribute_system = AttributeSystem(
+        AttributeStructure(time, r_exact), ['s1'])
+    exact_named_state = NamedState(
+        exact_attribute_system,
+        ConstantAssignment(
+            exact_vocabulary, exact_attribute_system, {'C1': 's1'}),
+        {('time', 's1'): [Interval(0.0, 3.0)]})
+    exact_VA = VariableAssignment(
+        exact_vocabulary, exact_attribute_system, {}, dummy=True)
+    formula = Formula(exact_vocabulary, 'EXACT', 'C1')
+    for symbolic in [False, True]:
+        assert formula.assign_truth_value(
+            exact_attribute_interpretation, exact_named_state, exact_VA,
+            symbolic=symbolic) is False
+
+    # vectorized evaluation agrees with enumeration, however it's chunked
+    chunk_size = Formula._chunk_size
+    try:
+        for size in [1, 7, chunk_size]:
+            Formula._chunk_size = size
+            for h1, m1, h2, m2, truth_value in [
+                    ([Interval(9, 13)], [12], [Interval(0, 8)], [27], True),
+                    ([9, 13], [12], [13], [Interval(13, 59)], False),
+                    ([13], [Interval(0, 59)], [13], [30], "unknown")]:
+                named_state.set_ascription(('hour', 's1'), h1)
+                named_state.set_ascription(('minute', 's1'), m1)
+                named_state.set_ascription(('hour', 's2'), h2)
+                named_state.set_ascription(('minute', 's2'), m2)
+                assert f.assign_truth_value(
+                    attribute_interpretation, named_state, VA) == truth_value
+                assert f.assign_truth_value(
+                    attribute_interpretation, named_state, VA,
+                    vectorized=True) == truth_value
+    finally:
+        Formula._chunk_size = chunk_size
+
     from vivid.classes.point import Point
     point = Attribute('point', [Point('x', 'x', 'x', 'x')])
     r_is_on = Relation('R1(h1, h2, h3) <=> is_on(h1, h2, h3)',
@@ -374,10 +492,289 @@ def test_assign_truth_value():
 
     for f in assumption_base:
         assert f.assign_truth_value(attribute_interpretation, named_state, VA)
+        # non-numeric values fall back to enumeration
+        assert f.assign_truth_value(
+            attribute_interpretation, named_state, VA, symbolic=True)
+        assert f.assign_truth_value(
+            attribute_interpretation, named_state, VA, vectorized=True)
 
     named_state.set_ascription(('point', 'p4'), [Point(1.0, 1.0, 1.0, 1.0)])
     assert f5.assign_truth_value(attribute_interpretation, named_state, VA)
 
+    # vectorized evaluation agrees with is_on on points near the segment
+    named_state.set_ascription(('point', 'p3'), [Point(0.0, 0.0, 0.0, 0.0)])
+    for point, truth_value in [(Point(0.5, 0.5, 0.5, 0.50000003), True),
+                               (Point(1.0000000005, 1.0, 1.0, 1.0), False),
+                               (Point(0.5, 0.5, 0.5, 0.5001), False)]:
+        named_state.set_ascription(('point', 'p1'), [point])
+        assert point.is_on(Point(0.0, 0.0, 0.0, 0.0),
+                           Point(1.0, 1.0, 1.0, 1.0)) is truth_value
+        assert f1.assign_truth_value(
+            attribute_interpretation, named_state, VA) is truth_value
+        assert f1.assign_truth_value(
+            attribute_interpretation, named_state, VA,
+            vectorized=True) is truth_value
+
+
+def test_assign_truth_values():
+    """Test assign_truth_values() function of Formula object."""
+    hour = Attribute('hour', [Interval(0, 23)])
+    minute = Attribute('minute', [Interval(0, 59)])
+    r_pm = Relation('R1(h1) <=> h1 > 11', ['hour'], 1)
+    r_am = Relation('R2(h1) <=> h1 <= 11', ['hour'], 2)
+    r_ahead = Relation(
+        'R3(h1,m1,hhh2,mm2) <=> h1 > hhh2 or (h1 = hhh2 and m1 > mm2)',
+        ['hour', 'minute', 'hour', 'minute'], 3)
+    attribute_structure = AttributeStructure(
+        hour, minute, r_pm, r_am, r_ahead)
+
+    pm_rs = RelationSymbol('PM', 1)
+    am_rs = RelationSymbol('AM', 1)
+    ahead_rs = RelationSymbol('Ahead', 2)
+    vocabulary = Vocabulary(
+        ['C1', 'C2', 'C3'], [pm_rs, am_rs, ahead_rs], ['V1'])
+
+    profiles = [
+        [pm_rs, ('hour', 1)],
+        [am_rs, ('hour', 1)],
+        [ahead_rs, ('hour', 1), ('minute', 1), ('hour', 2), ('minute', 2)]]
+    attribute_interpretation = AttributeInterpretation(
+        vocabulary, attribute_structure,
+        {pm_rs: 1, am_rs: 2, ahead_rs: 3}, profiles)
+
+    attribute_system = AttributeSystem(
+        attribute_structure, ['s1', 's2', 's3'])
+    p = ConstantAssignment(vocabulary, attribute_system,
+                           {'C1': 's1', 'C2': 's2', 'C3': 's3'})
+    named_state = NamedState(attribute_system, p, {
+                             ('hour', 's1'): [Interval(13, 15)],
+                             ('minute', 's1'): [Interval(0, 30)],
+                             ('hour', 's2'): [Interval(8, 13)],
+                             ('minute', 's2'): [45],
+                             ('hour', 's3'): [Interval(1, 4)]})
+    VA = VariableAssignment(vocabulary, attribute_system, {}, dummy=True)
+
+    formulae = [Formula(vocabulary, 'PM', 'C1'),
+                Formula(vocabulary, 'AM', 'C2'),
+                Formula(vocabulary, 'AM', 'C3'),
+                Formula(vocabulary, 'Ahead', 'C1', 'C2'),
+                Formula(vocabulary, 'Ahead', 'C2', 'C1'),
+                Formula(vocabulary, 'Ahead', 'C1', 'C3'),
+                Formula(vocabulary, 'PM', 'V1'),
+                Formula(vocabulary, 'PM', 'C1')]
+
+    truth_values = Formula.assign_truth_values(
+        attribute_interpretation, named_state, VA, *formulae)
+    assert truth_values == [True, "unknown", True, "unknown", "unknown",
+                            True, "unknown", True]
+    assert truth_values == [
+        f.assign_truth_value(attribute_interpretation, named_state, VA)
+        for f in formulae]
+    assert Formula.assign_truth_values(
+        attribute_interpretation, named_state, VA) == []
+
+    # works on worlds
+    for world in named_state.get_worlds(compact=True):
+        assert Formula.assign_truth_values(
+            attribute_interpretation, world, VA, *formulae) == [
+            f.assign_truth_value(attribute_interpretation, world, VA)
+            for f in formulae]
+        break
+
+    # only Formulae with identical bases share an enumeration; overlapping
+    # bases are enumerated separately rather than as their union
+    bases = []
+    get_projected_valuations = named_state.get_projected_valuations
+
+    def record_basis(basis):
+        """Record each basis enumerated, then enumerate it."""
+        bases.append(set(basis))
+        return get_projected_valuations(basis)
+
+    named_state.get_projected_valuations = record_basis
+    assert Formula.assign_truth_values(
+        attribute_interpretation, named_state, VA, *formulae[3:6]) == \
+        ["unknown", "unknown", True]
+    assert sorted([sorted(basis) for basis in bases]) == [
+        [('hour', 's1'), ('hour', 's2'), ('minute', 's1'), ('minute', 's2')],
+        [('hour', 's1'), ('hour', 's3'), ('minute', 's1'), ('minute', 's3')]]
+
+    with pytest.raises(TypeError) as excinfo:
+        Formula.assign_truth_values(None, named_state, VA, *formulae)
+    with pytest.raises(TypeError) as excinfo:
+        Formula.assign_truth_values(
+            attribute_interpretation, None, VA, *formulae)
+    with pytest.raises(TypeError) as excinfo:
+        Formula.assign_truth_values(
+            attribute_interpretation, named_state, None, *formulae)
+    with pytest.raises(TypeError) as excinfo:
+        Formula.assign_truth_values(
+            attribute_interpretation, named_state, VA, formulae[0], None)
+    with pytest.raises(ValueError) as excinfo:
+        bad_vocabulary = Vocabulary(['C1'], [pm_rs], [])
+        Formula.assign_truth_values(
+            attribute_interpretation, named_state, VA,
+            Formula(bad_vocabulary, 'PM', 'C1'))
+
+
+def test__get_value_array():
+    """Test _get_value_array() function of Formula object."""
+    from vivid.classes.point import Point
+    from vivid.classes.line_segment import LineSegment
+
+    assert Formula._get_value_array([1, 2.5, 3L]).tolist() == [1.0, 2.5, 3.0]
+    assert Formula._get_value_array(
+        [Point(1.0, 2.0), Point(3.0, 4.0)]).shape == (2, 2)
+    assert Formula._get_value_array(
+        [LineSegment(Point(0.0, 0.0, 0.0), Point(1.0, 1.0, 1.0))]).shape == \
+        (1, 2, 3)
+
+    assert Formula._get_value_array([1, Point(1.0)]) is None
+    assert Formula._get_value_array([Point(1.0), Point(1.0, 2.0)]) is None
+    assert Formula._get_value_array([Point('x', 'x')]) is None
+    assert Formula._get_value_array(['a', 'b']) is None
+
+
+def test__get_template():
+    """Test _get_template() function of Formula object."""
+    hour = Attribute('hour', [Interval(0, 23)])
+    minute = Attribute('minute', [Interval(0, 59)])
+    r_ahead = Relation('R1(h1,m1,h2,m2) <=> h1 > h2 or (h1 = h2 and m1 > m2)',
+                       ['hour', 'minute', 'hour', 'minute'], 1)
+    attribute_structure = AttributeStructure(hour, minute, r_ahead)
+
+    ahead_rs = RelationSymbol('Ahead', 4)
+    vocabulary = Vocabulary(['C1', 'C2'], [ahead_rs], ['V1'])
+
+    profiles = [
+        [ahead_rs, ('hour', 1), ('minute', 1), ('hour', 2), ('minute', 2)]]
+    ai = AttributeInterpretation(
+        vocabulary, attribute_structure, {ahead_rs: 1}, profiles)
+    ai2 = AttributeInterpretation(
+        vocabulary, attribute_structure, {ahead_rs: 1}, profiles)
+
+    f = Formula(vocabulary, 'Ahead', 'C1', 'V1')
+    template = [('hour', 'C1'), ('minute', 'C1'),
+                ('hour', 'V1'), ('minute', 'V1')]
+
+    assert f._template is None
+    assert f._get_template(ai) == (1, template)
+    assert f._template[0] is ai
+    cached = f._template
+    assert f._get_template(ai) == (1, template)
+    assert f._template is cached
+    assert f._get_template(ai2) == (1, template)
+    assert f._template[0] is ai2
+
+    import pickle
+    assert pickle.loads(pickle.dumps(f))._template is None
+
+    pm_vocabulary = Vocabulary(['C1'], [RelationSymbol('PM', 1)], [])
+    with pytest.raises(ValueError) as excinfo:
+        Formula(pm_vocabulary, 'PM', 'C1')._get_template(ai)
+
+
+def test_set_cache_size():
+    """Test Formula.set_cache_size."""
+    hour = Attribute('hour', [Interval(0, 23)])
+    r_pm = Relation('R1(h1) <=> h1 > 11', ['hour'], 1)
+    attribute_structure = AttributeStructure(hour, r_pm)
+
+    pm_rs = RelationSymbol('PM', 1)
+    vocabulary = Vocabulary(['C1', 'C2'], [pm_rs], [])
+    attribute_interpretation = AttributeInterpretation(
+        vocabulary, attribute_structure, {pm_rs: 1}, [[pm_rs, ('hour', 1)]])
+
+    attribute_system = AttributeSystem(attribute_structure, ['s1', 's2'])
+    p = ConstantAssignment(vocabulary, attribute_system,
+                           {'C1': 's1', 'C2': 's2'})
+    named_state = NamedState(attribute_system, p, {
+                             ('hour', 's1'): [Interval(13, 15)],
+                             ('hour', 's2'): [Interval(13, 15)]})
+    VA = VariableAssignment(vocabulary, attribute_system, {}, dummy=True)
+
+    pm_c1 = Formula(vocabulary, 'PM', 'C1')
+    pm_c2 = Formula(vocabulary, 'PM', 'C2')
+
+    size = Formula._cache_size
+    try:
+        with pytest.raises(TypeError) as excinfo:
+            Formula.set_cache_size(None)
+        with pytest.raises(TypeError) as excinfo:
+            Formula.set_cache_size(1.0)
+        with pytest.raises(ValueError) as excinfo:
+            Formula.set_cache_size(-1)
+
+        Formula.clear_cache()
+        Formula.set_cache_size(2)
+        for i in range(2):
+            assert pm_c1.assign_truth_value(
+                attribute_interpretation, named_state, VA) is True
+        assert Formula.get_cache_info() == (1, 1, 2, 1)
+        assert pm_c2.assign_truth_value(
+            attribute_interpretation, named_state, VA) is True
+        assert Formula.get_cache_info() == (1, 2, 2, 2)
+
+        # the key is built from the contents of the ascriptions so changing
+        # an ascription never yields a stale truth value
+        named_state.set_ascription(('hour', 's1'), [Interval(10, 15)])
+        assert pm_c1.assign_truth_value(
+            attribute_interpretation, named_state, VA) == "unknown"
+        assert Formula.get_cache_info() == (1, 3, 2, 2)
+
+        # assign_truth_values shares the cache
+        assert Formula.assign_truth_values(
+            attribute_interpretation, named_state, VA, pm_c1, pm_c2) == \
+            ["unknown", True]
+        assert Formula.get_cache_info() == (3, 3, 2, 2)
+
+        # a World has the key of the NamedState with its single values
+        world = next(named_state.get_worlds(compact=True))
+        assert pm_c2.assign_truth_value(
+            attribute_interpretation, world, VA) is True
+        assert Formula.get_cache_info() == (3, 4, 2, 2)
+
+        Formula.set_cache_size(1)
+        assert len(Formula._cache) == 1
+
+        # a size of 0 disables the cache
+        Formula.set_cache_size(0)
+        for i in range(2):
+            assert pm_c2.assign_truth_value(
+                attribute_interpretation, named_state, VA) is True
+        assert Formula.get_cache_info() == (3, 4, 0, 0)
+    finally:
+        Formula.set_cache_size(size)
+        Formula.clear_cache()
+
+
+def test_clear_cache():
+    """Test Formula.clear_cache."""
+    hour = Attribute('hour', [Interval(0, 23)])
+    r_pm = Relation('R1(h1) <=> h1 > 11', ['hour'], 1)
+    attribute_structure = AttributeStructure(hour, r_pm)
+
+    pm_rs = RelationSymbol('PM', 1)
+    vocabulary = Vocabulary(['C1'], [pm_rs], [])
+    attribute_interpretation = AttributeInterpretation(
+        vocabulary, attribute_structure, {pm_rs: 1}, [[pm_rs, ('hour', 1)]])
+
+    attribute_system = AttributeSystem(attribute_structure, ['s1'])
+    p = ConstantAssignment(vocabulary, attribute_system, {'C1': 's1'})
+    named_state = NamedState(attribute_system, p)
+    VA = VariableAssignment(vocabulary, attribute_system, {}, dummy=True)
+
+    size = Formula._cache_size
+    try:
+        Formula.set_cache_size(8)
+        Formula(vocabulary, 'PM', 'C1').assign_truth_value(
+            attribute_interpretation, named_state, VA)
+        assert Formula.get_cache_info().currsize == 1
+        Formula.clear_cache()
+        assert Formula.get_cache_info() == (0, 0, 8, 0)
+    finally:
+        Formula.set_cache_size(size)
+
 
 def test_get_basis():
     """Test get_basis function for Formula."""
@@ -0,0 +1,123 @@
+"""FrozenValueSet class unit tests."""
+
+import pytest
+from vivid.classes.valueset import ValueSet, FrozenValueSet
+from vivid.classes.interval import Interval
+from vivid.classes.point import Point
+
+
+def test___new__():
+    """Test FrozenValueSet constructor."""
+    with pytest.raises(TypeError) as excinfo:
+        FrozenValueSet(None)
+    with pytest.raises(TypeError) as excinfo:
+        FrozenValueSet((1, 2))
+
+    f = FrozenValueSet([3, 'a', 1, Interval(0.0, 1.0), Point(1.0)])
+    assert f._values == [1, 3, 'a', Interval(0.0, 1.0), Point(1.0)]
+    assert f._is_ValueSet
+    assert f._is_FrozenValueSet
+
+    # FrozenValueSets are interned by content
+    assert FrozenValueSet([Point(1.0), 'a', 3, Interval(0.0, 1.0), 1]) is f
+    assert FrozenValueSet(set([1, 3, 'a', Interval(0.0, 1.0), Point(1.0)])) is f
+    assert FrozenValueSet(
+        ValueSet([1, 3, 'a', Interval(0.0, 1.0), Point(1.0)])) is f
+    assert FrozenValueSet(f) is f
+    # values of different types are never interned together
+    assert FrozenValueSet([1]) == FrozenValueSet([1.0])
+    assert FrozenValueSet([1]) is not FrozenValueSet([1.0])
+    assert FrozenValueSet([1.0])._values == [1.0]
+
+
+def test___lt__():
+    """Test < operator for FrozenValueSet."""
+    f = FrozenValueSet([1, 2, Interval(5, 10)])
+    assert FrozenValueSet([1]) < f
+    assert ValueSet([6]) < f
+    assert not ValueSet([1, 2, Interval(5, 10)]) < f
+    assert not ValueSet([11]) < f
+
+
+def test___ge__():
+    """Test >= operator for FrozenValueSet."""
+    f = FrozenValueSet([Interval(12, 23)])
+    assert f >= ValueSet([15])
+    assert f >= f
+    assert not f >= ValueSet([10])
+    # ValueSet <= FrozenValueSet is a subset test
+    assert ValueSet([15]) <= f
+    assert not ValueSet([10]) <= f
+
+
+def test___gt__():
+    """Test > operator for FrozenValueSet."""
+    f = FrozenValueSet([Interval(12, 23)])
+    assert f > ValueSet([15, 16])
+    assert not f > f
+    assert not f > ValueSet([10])
+
+
+def test___hash__():
+    """Test hash of FrozenValueSet."""
+    f = FrozenValueSet([1, 'a', Interval(0, 10)])
+    assert hash(f) == hash(FrozenValueSet([1, 'a', Interval(0, 10)]))
+    assert hash(FrozenValueSet([1, 2])) == hash(FrozenValueSet([1.0, 2L]))
+    assert f._hash == hash(f)
+    assert len(set([f, FrozenValueSet([Interval(0, 10), 'a', 1]),
+                    FrozenValueSet(['b'])])) == 2
+
+
+def test___setitem__():
+    """Test FrozenValueSet item assignment."""
+    f = FrozenValueSet([1, 2])
+    with pytest.raises(TypeError) as excinfo:
+        f[0] = 3
+    assert f._values == [1, 2]
+
+
+def test___iadd__():
+    """Test += operator for FrozenValueSet."""
+    f = g = FrozenValueSet([1, 2])
+    f += 5
+    assert f == ValueSet([1, 2, 5])
+    assert g == ValueSet([1, 2])
+
+
+def test___copy__():
+    """Test copy of FrozenValueSet."""
+    from copy import copy
+    f = FrozenValueSet([1, 2])
+    assert copy(f) is f
+
+
+def test___deepcopy__():
+    """Test deepcopy of FrozenValueSet."""
+    from copy import deepcopy
+    f = FrozenValueSet([1, 2])
+    assert deepcopy(f) is f
+    assert deepcopy([f])[0] is f
+
+
+def test_discretize():
+    """Test discretize function for FrozenValueSet."""
+    f = FrozenValueSet(['a', Interval(3, 5)])
+    assert f._discretized is None
+    discrete_values = f.discretize()
+    assert discrete_values == ['a', 3, 4, 5]
+    assert f.discretize() is discrete_values
+
+
+def test___reduce__():
+    """Test pickling of FrozenValueSet."""
+    import pickle
+    f = FrozenValueSet([1, 'a', Interval(0, 10), Point(1.0)])
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        assert pickle.loads(pickle.dumps(f, protocol)) is f
+
+
+def test__get_content_key():
+    """Test _get_content_key function for FrozenValueSet."""
+    f = FrozenValueSet([1, 'a', 2.0])
+    assert f._get_content_key() == frozenset(
+        [(int, 1), (str, 'a'), (float, 2.0)])
@@ -306,6 +306,45 @@ def test_discretize():
     assert i.discretize() == [0L, 1L, 2L]
     assert i.discretize(2L) == [0L, 2L]
 
+    # values are computed lazily
+    i = Interval(0, 10 ** 6)
+    assert len(i.discretize()) == 10 ** 6 + 1
+    assert i.discretize()[-1] == 10 ** 6
+    assert type(Interval(0L, 2L).discretize()[1]) is long
+
+    # membership is that of the list of values
+    assert 3L in Interval(0, 5).discretize()
+    assert 3.0 in Interval(0, 5).discretize()
+
+    # float values never exceed the supremum, and the next one would
+    i = Interval(2.56, 6.87)
+    assert i.discretize(.01)[-1] <= 6.87
+    assert len(i.discretize(.01)) == i.count_values(.01) == 431
+    for i, jump in [(Interval(2.56, 6.87), .01), (Interval(5.74, 8.59), .01),
+                    (Interval(0.0, 0.3), .1), (Interval(0.0, 0.7), .1)]:
+        values = i.discretize(jump)
+        assert values[-1] <= i[1]
+        assert i[0] + len(values) * jump > i[1]
+
+
+def test_count_values():
+    """Test Interval discrete value counting."""
+    for i in [Interval(0, 10), Interval(0.0, 2.0), Interval(0L, 2L),
+              Interval(0.0, 2.5)]:
+        assert i.count_values() == len(i.discretize())
+
+    i = Interval(0, 10)
+    assert i.count_values(2) == 6
+    assert i.count_values(3) == 4
+    assert Interval(0.0, 2.0).count_values(.5) == 5
+    assert Interval(0L, 2L).count_values(2L) == 2
+    assert Interval(0, 10 ** 12).count_values() == 10 ** 12 + 1
+
+    with pytest.raises(TypeError) as excinfo:
+        i.count_values('a')
+    with pytest.raises(TypeError) as excinfo:
+        i.count_values(1.0)
+
 
 def test___str__():
     """Test str() of Interval object."""
@@ -337,3 +376,25 @@ def test_collapse_intervals():
         Interval(-10.0, 15.0), Interval(-100L, -99L), Interval(-10L, 15L)]
 
     assert Interval.collapse_intervals(intervals) == out
+
+
+def test__sweep():
+    """Test Interval sweeping."""
+    assert Interval._sweep([], [], 1) == ([], [])
+    assert Interval._sweep([], [3, 1, 2], 1) == ([], [1, 2, 3])
+
+    # overlapping Intervals merge, adjacent ones only when diff allows it
+    intervals = [Interval(5, 8), Interval(0, 3), Interval(4, 6)]
+    assert Interval._sweep(intervals, [], 0) == (
+        [Interval(0, 3), Interval(4, 8)], [])
+    assert Interval._sweep(intervals, [], 1) == ([Interval(0, 8)], [])
+
+    # values are absorbed when contained in or adjacent to an Interval
+    assert Interval._sweep(
+        [Interval(2, 4), Interval(10, 12)], [-3, 0, 1, 3, 5, 7, 8, 13], 1) == \
+        ([Interval(0, 5), Interval(10, 13)], [-3, 7, 8])
+    assert Interval._sweep(
+        [Interval(2L, 4L)], [1L, 6L], 1L) == ([Interval(1L, 4L)], [6L])
+    assert Interval._sweep(
+        [Interval(2.0, 4.0), Interval(4.0, 5.5)], [1.0, 2.0, 3.3, 5.5, 6.5],
+        0.0) == ([Interval(2.0, 5.5)], [1.0, 6.5])
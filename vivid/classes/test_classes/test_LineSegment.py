@@ -239,6 +239,30 @@ def test_meets():
     assert LineSegment.meets(p4, a, c)
 
 
+def test_batch_meets():
+    """Test vectorized meets wrapper for Point function."""
+    import numpy
+    a = [[0.0, 0.0], [5.0, 5.0]]
+    c = [[5.0, 0.0], [0.0, 5.0]]
+    points = numpy.array([[0.0, 0.0], [1.0, 1.0], [5.0, 5.0], [2.5, 2.5]])
+    assert list(LineSegment.batch_meets(points, [a], [a])) == \
+        [True, True, True, True]
+    assert list(LineSegment.batch_meets(points, [a], [c])) == \
+        [False, False, False, True]
+    # every segment against every segment
+    results = LineSegment.batch_meets(
+        points[:, None, None], numpy.array([a, c])[None, :, None],
+        numpy.array([a, c])[None, None, :])
+    assert results.shape == (4, 2, 2)
+    assert list(results[3].flatten()) == [True, True, True, True]
+    assert list(results[0].flatten()) == [True, False, False, False]
+
+    with pytest.raises(ValueError) as excinfo:
+        LineSegment.batch_meets(points, a, [a])
+    with pytest.raises(ValueError) as excinfo:
+        LineSegment.batch_meets(points, [[[0.0, 0.0]]], [a])
+
+
 def test_unstringify():
     """Test unstringify function for LineSegment."""
     p1, p2 = Point(1.0), Point(2.0)
@@ -13,9 +13,60 @@ def test___call__():
     assert hasattr(LineSegmentParser(), '__call__')
 
 
+def test_handles():
+    """Test handles function."""
+    line_segment_parser = LineSegmentParser()
+    assert line_segment_parser.handles(
+        "meets(P(2.5,2.5),L(P(0.0,0.0),P(5.0,5.0)),L(P(5.0,0.0),P(0.0,5.0)))")
+    assert not line_segment_parser.handles(
+        "is_on(P(2.0,2.0),P(-1.0,-1.0),P(3.0,3.0))")
+    assert not line_segment_parser.handles("2 < 3")
+
+
 def test__eval():
     """Test _eval function."""
     # Test eval of is_on function contained in Point class
     eval_str = "meets(P(2.5,2.5),L(P(0.0,0.0),P(5.0,5.0)),L(P(5.0,0.0),P(0.0,5.0)))"
     parser = LineSegmentParser()
     assert parser(eval_str)
+
+
+def test_compile():
+    """Test compile function."""
+    import pytest
+    from vivid.classes.point import Point
+    from vivid.classes.line_segment import LineSegment
+    parser = LineSegmentParser()
+
+    meets = parser.compile("meets(p, l1, l2)", ['l1', 'l2', 'p'])
+    l1 = LineSegment(Point(0.0, 0.0), Point(5.0, 5.0))
+    l2 = LineSegment(Point(5.0, 0.0), Point(0.0, 5.0))
+    assert meets(l1, l2, Point(2.5, 2.5))
+    assert not meets(l1, l2, Point(2.5, 2.0))
+
+    with pytest.raises(ValueError) as excinfo:
+        meets(l1, l2, 2.5)
+    with pytest.raises(ValueError) as excinfo:
+        meets(Point(0.0, 0.0), l2, Point(2.5, 2.5))
+    with pytest.raises(ValueError) as excinfo:
+        parser.compile("is_on(p, l1, l2)", ['p', 'l1', 'l2'])
+    with pytest.raises(ValueError) as excinfo:
+        parser.compile("meets(p, l1, l3)", ['p', 'l1', 'l2'])
+
+
+def test_vectorize():
+    """Test vectorize function."""
+    import numpy
+    import pytest
+    parser = LineSegmentParser()
+
+    meets = parser.vectorize("meets(p, l1, l2)", ['l1', 'l2', 'p'])
+    l1 = numpy.array([[[0.0, 0.0], [5.0, 5.0]]] * 2)
+    l2 = numpy.array([[[5.0, 0.0], [0.0, 5.0]]] * 2)
+    points = numpy.array([[2.5, 2.5], [2.5, 2.0]])
+    assert list(meets(l1, l2, points)) == [True, False]
+
+    with pytest.raises(ValueError) as excinfo:
+        meets(l1, l2, numpy.array([2.5, 2.5]))
+    with pytest.raises(ValueError) as excinfo:
+        parser.vectorize("is_on(p, l1, l2)", ['p', 'l1', 'l2'])
@@ -348,6 +348,51 @@ def test_add_object():
     assert named_state._p == p
     assert 'C' in vocabulary._C
 
+    # adding an object to a derived NamedState leaves the original untouched
+    p = ConstantAssignment(vocabulary, attribute_system, {'a': 's1'})
+    named_state = NamedState(attribute_system, p)
+    derived = named_state._derive()
+    derived.add_object("obj", constant_symbol="D")
+    assert derived._p._attribute_system is derived._attribute_system
+    assert derived._p._mapping == {'a': 's1', 'D': 'obj'}
+    assert named_state._p == p
+    assert named_state._attribute_system._objects == ['s1']
+    assert named_state._ascriptions == {("color", "s1"): ValueSet(
+        ['R', 'G', 'B'])}
+
+
+def test__derive():
+    """Test _derive function for NamedState."""
+    color = Attribute('color', ['R', 'G', 'B'])
+    attribute_structure = AttributeStructure(color)
+    objects = ['s1', 's2']
+    attribute_system = AttributeSystem(attribute_structure, objects)
+    vocabulary = Vocabulary(['a', 'b'], [], [])
+
+    p = ConstantAssignment(vocabulary, attribute_system, {'a': 's1'})
+    named_state = NamedState(attribute_system, p)
+    assert named_state._p._attribute_system is named_state._attribute_system
+
+    derived = named_state._derive()
+    assert derived == named_state
+    assert derived._attribute_system is named_state._attribute_system
+    assert derived._ascriptions is named_state._ascriptions
+    assert derived._p is named_state._p
+
+    derived.set_ascription(('color', 's2'), ['G'])
+    assert named_state[('color', 's2')] == ValueSet(['R', 'G', 'B'])
+
+    p2 = named_state._p._derive({'a': 's1', 'b': 's2'})
+    derived = named_state._derive(p=p2)
+    assert derived._p is p2
+    assert derived._p._attribute_system is named_state._attribute_system
+    assert named_state._p._mapping == {'a': 's1'}
+
+    # worlds share the AttributeSystem of the NamedState they come from
+    for world in named_state.get_worlds():
+        assert world._attribute_system is named_state._attribute_system
+        assert world._p._attribute_system is named_state._attribute_system
+
 
 def test_is_world():
     """Test is_world() function for NamedState."""
@@ -486,6 +531,10 @@ def test_get_worlds():
 
     assert worlds == worlds_manual
 
+    compact_worlds = [w for w in ns.get_worlds(compact=True)]
+    assert all([w.is_world() for w in compact_worlds])
+    assert [w.get_named_state() for w in compact_worlds] == worlds_manual
+
     color = Attribute('color', ['R', 'G'])
     attribute_structure = AttributeStructure(color)
     objects = ['s1', 's2', 's3']
@@ -603,6 +652,261 @@ def test_get_worlds():
     assert worlds == worlds_manual
 
 
+def test_get_worlds_reduce_symmetry():
+    """Test get_worlds() function for NamedState with symmetry reduction."""
+    def swap(world, obj1, obj2):
+        """Return world with obj1 and obj2 swapped."""
+        def swapped(obj):
+            return {obj1: obj2, obj2: obj1}.get(obj, obj)
+
+        mapping = {c: swapped(o) for c, o in world._p._mapping.iteritems()}
+        p = ConstantAssignment(world._p._vocabulary, world._attribute_system,
+                               mapping)
+        ascriptions = {(label, swapped(obj)): valueset for (label, obj),
+                       valueset in world._ascriptions.iteritems()}
+        return NamedState(world._attribute_system, p, ascriptions)
+
+    color = Attribute('color', ['R', 'G'])
+    attribute_structure = AttributeStructure(color)
+    objects = ['s1', 's2', 's3']
+    attribute_system = AttributeSystem(attribute_structure, objects)
+    vocabulary = Vocabulary(['a', 'b', 'c', 'd'], [], [])
+    p = ConstantAssignment(vocabulary, attribute_system, {'a': 's1'})
+    ns = NamedState(attribute_system, p, {})
+
+    worlds = list(ns.get_worlds())
+    reduced_worlds = list(ns.get_worlds(reduce_symmetry=True))
+
+    assert len(worlds) == 48
+    assert len(reduced_worlds) == 24
+    assert ns.count_worlds(reduce_symmetry=True) == 24
+    assert len(list(ns.get_worlds(compact=True, reduce_symmetry=True))) == 24
+
+    # every world is a representative or the image of one when the
+    # interchangeable objects s2 and s3 are swapped
+    for world in reduced_worlds:
+        assert world in worlds
+    for world in worlds:
+        assert world in reduced_worlds or \
+            swap(world, 's2', 's3') in reduced_worlds
+
+    # objects with different ascriptions are not interchangeable
+    ns.set_ascription(('color', 's2'), ['R'])
+    assert ns._get_interchangeable_objects() == [['s2'], ['s3']]
+    assert len(list(ns.get_worlds(reduce_symmetry=True))) == \
+        len(list(ns.get_worlds())) == ns.count_worlds(reduce_symmetry=True)
+
+    # five identical objects and five constants: one completion
+    objects = ['s1', 's2', 's3', 's4', 's5']
+    attribute_system = AttributeSystem(attribute_structure, objects)
+    vocabulary = Vocabulary(['a', 'b', 'c', 'd', 'e'], [], [])
+    p = ConstantAssignment(vocabulary, attribute_system, {})
+    ns = NamedState(attribute_system, p, {
+                    ('color', obj): ['R'] for obj in objects})
+    assert ns._get_interchangeable_objects() == [objects]
+    assert ns.count_worlds() == 120
+    assert ns.count_worlds(reduce_symmetry=True) == 1
+    assert len(list(ns.get_worlds(reduce_symmetry=True))) == 1
+
+    # objects bound or distinguished by other named states are kept apart
+    p_prime = ConstantAssignment(vocabulary, attribute_system, {'a': 's1'})
+    ns_prime = NamedState(attribute_system, p_prime, {
+                          ('color', 's2'): ['G']})
+    assert ns._get_interchangeable_objects(ns_prime) == \
+        [['s1'], ['s2'], ['s3', 's4', 's5']]
+    assert ns.count_worlds(True, [ns_prime]) == 5 * 4 * 1 * 1 * 1
+    assert len(list(ns.get_worlds(reduce_symmetry=True,
+                                  named_states=[ns_prime]))) == 20
+
+
+def test__generate_compact_worlds():
+    """Test _generate_compact_worlds() function for NamedState."""
+    def key(world):
+        """Return the ConstantAssignment and value indices of a World."""
+        return sorted(world._p._mapping.items()), world._indices
+
+    color = Attribute('color', ['R', 'G'])
+    size = Attribute('size', ['S', 'M', 'L'])
+    attribute_structure = AttributeStructure(color, size)
+    objects = ['s1', 's2', 's3']
+    attribute_system = AttributeSystem(attribute_structure, objects)
+    vocabulary = Vocabulary(['a', 'b', 'c', 'd'], [], [])
+    p = ConstantAssignment(vocabulary, attribute_system, {'a': 's1'})
+    ns = NamedState(attribute_system, p, {('size', 's2'): ['S', 'L']})
+
+    for classes in [None, ns._get_interchangeable_objects()]:
+        worlds = [key(world) for world in ns._generate_compact_worlds(classes)]
+        reduce_symmetry = classes is not None
+        assert worlds == [key(world) for world in ns.get_worlds(
+            compact=True, reduce_symmetry=reduce_symmetry)]
+        assert len(worlds) == ns.count_worlds(reduce_symmetry)
+
+        # any range of worlds is generated directly from its bounds
+        for start in range(len(worlds) + 1):
+            for stop in [start, start + 1, start + 5, start + 13, None]:
+                assert [key(world) for world in ns._generate_compact_worlds(
+                    classes, start, stop)] == worlds[start:stop]
+
+
+def test__generate_indices():
+    """Test _generate_indices() function for NamedState."""
+    from itertools import product
+    for sizes in [[], [1], [4], [2, 3], [3, 1, 2], [2, 2, 2, 2]]:
+        indices = list(product(*[range(size) for size in sizes]))
+        for start in range(len(indices)):
+            assert list(NamedState._generate_indices(sizes, start)) == \
+                indices[start:]
+
+
+def test__generate_constant_assignments():
+    """Test _generate_constant_assignments() function for NamedState."""
+    color = Attribute('color', ['R', 'G'])
+    attribute_structure = AttributeStructure(color)
+    objects = ['s1', 's2', 's3', 's4']
+    attribute_system = AttributeSystem(attribute_structure, objects)
+    vocabulary = Vocabulary(['a', 'b', 'c'], [], [])
+    p = ConstantAssignment(vocabulary, attribute_system, {'a': 's1'})
+    ns = NamedState(attribute_system, p, {('color', 's2'): ['G']})
+
+    for classes in [None, ns._get_interchangeable_objects()]:
+        ps = list(ns._generate_constant_assignments(classes))
+        for start in range(len(ps) + 2):
+            assert list(ns._generate_constant_assignments(
+                classes, start)) == ps[start:]
+
+        # the ConstantAssignments before start are never built
+        derive = ConstantAssignment._derive
+        built = []
+
+        def counting_derive(self, *args):
+            """Record each ConstantAssignment built."""
+            built.append(args)
+            return derive(self, *args)
+
+        ConstantAssignment._derive = counting_derive
+        try:
+            assert list(ns._generate_constant_assignments(
+                classes, len(ps) - 1)) == ps[-1:]
+        finally:
+            ConstantAssignment._derive = derive
+        assert len(built) == 1
+
+    total = ConstantAssignment(
+        vocabulary, attribute_system, {'a': 's1', 'b': 's2', 'c': 's3'})
+    ns = NamedState(attribute_system, total)
+    assert list(ns._generate_constant_assignments()) == [total]
+    assert list(ns._generate_constant_assignments(start=1)) == []
+
+
+def test__generate_permutations():
+    """Test _generate_permutations() function for NamedState."""
+    from itertools import permutations
+    for n in range(5):
+        for k in range(n + 2):
+            expected = list(permutations(range(n), k))
+            for start in range(len(expected) + 2):
+                assert list(NamedState._generate_permutations(
+                    range(n), k, start)) == expected[start:]
+
+
+def test__generate_representatives():
+    """Test _generate_representatives() function for NamedState."""
+    constants = ['a', 'b', 'c', 'd']
+    for classes in [[], [['s1']], [['s1', 's2']], [['s1'], ['s2', 's3']],
+                    [['s1', 's2'], ['s3'], ['s4', 's5', 's6']]]:
+        capacities = [len(cls) for cls in classes]
+        for bound in range(min(len(constants), sum(capacities)) + 1):
+            representatives = list(NamedState._generate_representatives(
+                constants, classes, bound))
+            assert NamedState._count_representatives(
+                len(constants), capacities, bound) == len(representatives)
+            for start in range(len(representatives) + 2):
+                assert list(NamedState._generate_representatives(
+                    constants, classes, bound, start)) == \
+                    representatives[start:]
+
+
+def test_count_worlds():
+    """Test count_worlds() function for NamedState."""
+    color = Attribute('color', ['R', 'G'])
+    size = Attribute('size', ['S', 'L'])
+    attribute_structure = AttributeStructure(color, size)
+    objects = ['s1', 's2']
+    attribute_system = AttributeSystem(attribute_structure, objects)
+    vocabulary = Vocabulary(['a', 'b'], [], [])
+
+    p = ConstantAssignment(vocabulary, attribute_system, {})
+    ns = NamedState(attribute_system, p, {('color', 's1'): ['R']})
+    assert ns.count_worlds() == 16
+    assert ns.count_worlds() == len(list(ns.get_worlds()))
+
+    p = ConstantAssignment(vocabulary, attribute_system, {'a': 's1'})
+    ns = NamedState(attribute_system, p, {('color', 's1'): ['R']})
+    assert ns.count_worlds() == 8
+    assert ns.count_worlds() == len(list(ns.get_worlds()))
+
+    world = list(ns.get_worlds())[0]
+    assert world.count_worlds() == 1
+
+    color = Attribute('color', ['R', 'G'])
+    attribute_structure = AttributeStructure(color)
+    objects = ['s1', 's2', 's3']
+    attribute_system = AttributeSystem(attribute_structure, objects)
+    vocabulary = Vocabulary(['a', 'b', 'c', 'd'], [], [])
+    p = ConstantAssignment(vocabulary, attribute_system, {'a': 's1'})
+    ns = NamedState(attribute_system, p, {})
+    assert ns.count_worlds() == 8 * 6
+    assert ns.count_worlds() == len(list(ns.get_worlds()))
+    assert ns.count_worlds() == len(list(ns.get_worlds(compact=True)))
+
+    from vivid.classes.state import WorldBudgetExceededError
+    try:
+        State.set_world_budget(47)
+        with pytest.raises(WorldBudgetExceededError) as excinfo:
+            ns.get_worlds().next()
+        with pytest.raises(WorldBudgetExceededError) as excinfo:
+            ns.get_worlds(compact=True).next()
+        # the budget is checked when get_worlds is called, not on next
+        with pytest.raises(WorldBudgetExceededError) as excinfo:
+            ns.get_worlds()
+        with pytest.raises(WorldBudgetExceededError) as excinfo:
+            ns.get_worlds(compact=True)
+        State.set_world_budget(48)
+        assert len(list(ns.get_worlds(compact=True))) == 48
+    finally:
+        State.set_world_budget(None)
+
+
+def test_count_variable_assignments():
+    """Test count_variable_assignments() function for NamedState."""
+    objects = ['s1', 's2']
+    attribute_system = AttributeSystem(AttributeStructure(), objects)
+    vocabulary = Vocabulary([], [], [])
+    p = ConstantAssignment(vocabulary, attribute_system, {})
+    state = NamedState(attribute_system, p, {})
+    assert state.count_variable_assignments() == 1
+
+    for objects, V in [(['s1'], ['V1', 'V2']),
+                       (['s1', 's2'], ['V1', 'V2']),
+                       (['s1', 's2', 's3', 's4'], ['V1', 'V2'])]:
+        attribute_system = AttributeSystem(AttributeStructure(), objects)
+        vocabulary = Vocabulary([], [], V)
+        p = ConstantAssignment(vocabulary, attribute_system, {})
+        state = NamedState(attribute_system, p, {})
+        assert state.count_variable_assignments() == \
+            len(list(state._generate_variable_assignments()))
+
+    # every world binds one more object to a constant
+    objects = ['s1', 's2', 's3', 's4']
+    attribute_system = AttributeSystem(AttributeStructure(), objects)
+    vocabulary = Vocabulary(['C1', 'C2'], [], ['V1', 'V2'])
+    p = ConstantAssignment(vocabulary, attribute_system, {'C1': 's1'})
+    state = NamedState(attribute_system, p, {})
+    assert state.count_variable_assignments() == 2
+    for world in state.get_worlds():
+        assert len(list(world._generate_variable_assignments())) == 2
+
+
 def test_is_named_alternate_extension():
     """Test is_named_alternate_extension() function for NamedState."""
     def test_paper_example():
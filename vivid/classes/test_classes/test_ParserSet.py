@@ -35,3 +35,81 @@ def test___iter__():
     parset_set = ParserSet()
     for parser in parset_set:
         assert hasattr(parser, "_is_Parser")
+
+
+def test_evaluate():
+    """Test ParserSet.evaluate."""
+    ParserSet.clear_cache()
+    parser_set = ParserSet()
+    assert parser_set.evaluate('5 > 4 or (5 = 4 and 12 > 27)') is True
+    assert parser_set.evaluate('is_on(P(1.0),P(0.0),P(2.0))') is True
+    assert ParserSet.get_cache_info() == (0, 2, ParserSet._cache_size, 2)
+
+    # the cache is shared by every ParserSet object
+    assert ParserSet().evaluate('5 > 4 or (5 = 4 and 12 > 27)') is True
+    assert ParserSet.get_cache_info().hits == 1
+
+    with pytest.raises(ValueError) as excinfo:
+        parser_set.evaluate('unparsable(')
+    with pytest.raises(ValueError) as excinfo:
+        parser_set.evaluate('1 / 0 = 1')
+    assert ParserSet.get_cache_info().currsize == 2
+
+    # the parser that evaluates a Relation's expressions is recorded
+    from vivid.classes.relation import Relation
+    r_meets = Relation('R1(p, l1, l2) <=> meets(p, l1, l2)',
+                       ['point', 'line', 'line'], 1)
+    assert r_meets._parser is None
+    assert parser_set.evaluate(
+        'meets(P(2.5,2.5),L(P(0.0,0.0),P(5.0,5.0)),L(P(5.0,0.0),P(0.0,5.0)))',
+        r_meets) is True
+    assert r_meets._parser == 2
+    assert parser_set.evaluate(
+        'meets(P(2.5,2.5),L(P(0.0,0.0),P(5.0,5.0)),L(P(5.0,0.0),P(0.0,4.0)))',
+        r_meets) is False
+    assert r_meets._parser == 2
+    # other parsers are still tried if the recorded one fails
+    assert parser_set.evaluate(
+        'meets(P(1.0),P(1.0),P(2.0),P(1.0),P(2.0))', r_meets) is True
+    assert r_meets._parser == 1
+    r_meets.set_definition('R1(p, l1, l2) <=> meets(l1, p, l2)')
+    assert r_meets._parser is None
+
+
+def test_set_cache_size():
+    """Test ParserSet.set_cache_size."""
+    size = ParserSet._cache_size
+    try:
+        with pytest.raises(TypeError) as excinfo:
+            ParserSet.set_cache_size(None)
+        with pytest.raises(TypeError) as excinfo:
+            ParserSet.set_cache_size(1.0)
+        with pytest.raises(ValueError) as excinfo:
+            ParserSet.set_cache_size(-1)
+
+        ParserSet.clear_cache()
+        ParserSet.set_cache_size(2)
+        parser_set = ParserSet()
+        for expression in ['1 < 2', '2 < 3', '1 < 2', '3 < 4']:
+            parser_set.evaluate(expression)
+        # '2 < 3' is the least recently used expression
+        assert ParserSet._cache.keys() == ['1 < 2', '3 < 4']
+        assert ParserSet.get_cache_info() == (1, 3, 2, 2)
+
+        ParserSet.set_cache_size(1)
+        assert ParserSet._cache.keys() == ['3 < 4']
+
+        # a size of 0 disables the cache
+        ParserSet.set_cache_size(0)
+        parser_set.evaluate('1 < 2')
+        parser_set.evaluate('1 < 2')
+        assert ParserSet.get_cache_info() == (1, 5, 0, 0)
+    finally:
+        ParserSet.set_cache_size(size)
+
+
+def test_clear_cache():
+    """Test ParserSet.clear_cache."""
+    ParserSet().evaluate('1 < 2')
+    ParserSet.clear_cache()
+    assert ParserSet.get_cache_info() == (0, 0, ParserSet._cache_size, 0)
@@ -199,6 +199,60 @@ def test_meets():
         worldline_1_start, worldline_1_end, worldline_2_start, worldline_2_end)
 
 
+def test_batch_is_on():
+    """Test vectorized is_on function."""
+    import numpy
+    from itertools import product
+
+    # agrees with is_on on a lattice of points
+    lattice = [Point(float(x), float(y)) for x, y in product(range(4), repeat=2)]
+    coordinates = numpy.array([point._coordinate for point in lattice])
+    results = Point.batch_is_on(coordinates[:, None, None],
+                                coordinates[None, :, None],
+                                coordinates[None, None, :])
+    assert results.shape == (16, 16, 16)
+    for i, j, k in product(range(16), repeat=3):
+        assert results[i, j, k] == lattice[i].is_on(lattice[j], lattice[k])
+
+    # agrees with is_on on points within and just beyond its tolerance
+    near = [Point(0.5, 0.50000003), Point(1.0000000005, 1.0),
+            Point(0.5, 0.5 + 1e-15), Point(1.0 + 1e-15, 1.0 + 1e-15),
+            Point(0.25, 0.2500001), Point(-1e-9, 0.0)]
+    start, end = Point(0.0, 0.0), Point(1.0, 1.0)
+    results = Point.batch_is_on([point._coordinate for point in near],
+                                start._coordinate, end._coordinate)
+    assert list(results) == [point.is_on(start, end) for point in near]
+    assert list(results) == [True, False, True, True, True, False]
+
+    # one dimension and degenerate segments
+    assert list(Point.batch_is_on(
+        [[1.0], [4.0], [0.0]], [[0.0], [0.0], [0.0]],
+        [[3.0], [3.0], [0.0]])) == [True, False, True]
+    assert not Point.batch_is_on([1.0, 1.0], [0.0, 0.0], [0.0, 0.0])
+
+    with pytest.raises(ValueError) as excinfo:
+        Point.batch_is_on([[1.0, 1.0]], [[0.0, 0.0, 0.0]], [[3.0, 3.0]])
+    with pytest.raises(ValueError) as excinfo:
+        Point.batch_is_on(1.0, 0.0, 3.0)
+
+
+def test_batch_meets():
+    """Test vectorized meets function."""
+    results = Point.batch_meets(
+        [[0.0, 0.0], [2.5, 2.5], [1.0, 1.0]],
+        [[0.0, 0.0]], [[5.0, 5.0]], [[5.0, 0.0]], [[0.0, 5.0]])
+    assert list(results) == [False, True, False]
+
+
+def test_batch_can_observe():
+    """Test vectorized can_observe function."""
+    results = Point.batch_can_observe(
+        [[1.0, 1.0], [1.0, 1.0], [1.0, 1.0], [1.0, 2.0]],
+        [[0.0, 0.0], [1.0, 1.0], [0.0, 1.0], [1.0, 2.0]],
+        [[-10.0, -10.0]], [[10.0, 10.0]])
+    assert list(results) == [True, True, False, True]
+
+
 def test_unstringify():
     """Test Point object reconstruction."""
     def test_ValueError(point_string):
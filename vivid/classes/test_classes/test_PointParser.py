@@ -13,6 +13,15 @@ def test___call__():
     assert hasattr(PointParser(), '__call__')
 
 
+def test_handles():
+    """Test handles function."""
+    point_parser = PointParser()
+    assert point_parser.handles("is_on(P(2.0,2.0),P(-1.0,-1.0),P(3.0,3.0))")
+    assert point_parser.handles("meets(P(1.0),P(1.0),P(1.0),P(1.0),P(1.0))")
+    assert not point_parser.handles("is_not_on(P(2.0),P(-1.0),P(3.0))")
+    assert not point_parser.handles("2 < 3")
+
+
 def test__eval():
     """Test _eval function."""
     # Test eval of is_on function contained in Point class
@@ -30,3 +39,55 @@ def test__eval():
     assert parser("is_on(P(1.5,1.5,1.5,1.5),P(1.0,1.0,1.0,1.0),P(3.0,3.0,3.0,3.0))")
     assert parser("not_same_point(P(1.5,1.5,1.5,1.5),P(2.0,2.0,2.0,2.0))")
     assert parser("meets(P(1.5,1.5,1.5,1.5),P(2.0,2.0,2.0,2.0),P(1.0,1.0,1.0,1.0),P(1.0,1.0,1.0,1.0),P(2.0,2.0,2.0,2.0))")
+
+
+def test_compile():
+    """Test compile function."""
+    import pytest
+    from vivid.classes.point import Point
+    parser = PointParser()
+
+    is_on = parser.compile(" is_on(h1, h2, h3)", ['h2', 'h1', 'h3'])
+    assert is_on(Point(1.0, 1.0), Point(2.0, 2.0), Point(3.0, 3.0))
+    assert not is_on(Point(2.0, 2.0), Point(6.0, 1.0), Point(3.0, 2.0))
+    # Point objects are not stringified so no precision is lost
+    third, rounded = Point(1.0 / 3.0), Point(float(str(1.0 / 3.0)))
+    not_same_point = parser.compile("not_same_point(p1, p2)", ['p1', 'p2'])
+    assert not_same_point(third, rounded)
+    assert not parser(
+        "not_same_point(" + str(third) + "," + str(rounded) + ")")
+
+    # arguments may be repeated
+    assert not parser.compile("not_same_point(p, p)", ['p'])(third)
+
+    with pytest.raises(ValueError) as excinfo:
+        is_on(Point(1.0, 1.0), 'P(2.0,2.0)', Point(3.0, 3.0))
+    with pytest.raises(ValueError) as excinfo:
+        is_on(Point('x', 'x'), Point(2.0, 2.0), Point(3.0, 3.0))
+    with pytest.raises(ValueError) as excinfo:
+        parser.compile("is_not_on(h1, h2, h3)", ['h1', 'h2', 'h3'])
+    with pytest.raises(ValueError) as excinfo:
+        parser.compile("is_on(h1, h2, h4)", ['h1', 'h2', 'h3'])
+    with pytest.raises(ValueError) as excinfo:
+        parser.compile("is_on(h1, h2, h3) and h1", ['h1', 'h2', 'h3'])
+
+
+def test_vectorize():
+    """Test vectorize function."""
+    import numpy
+    import pytest
+    parser = PointParser()
+
+    is_on = parser.vectorize("is_on(h1, h2, h3)", ['h2', 'h1', 'h3'])
+    results = is_on(numpy.array([[0.0, 0.0], [0.0, 0.0]]),
+                    numpy.array([[1.0, 1.0], [1.0, 2.0]]),
+                    numpy.array([[3.0, 3.0], [3.0, 3.0]]))
+    assert list(results) == [True, False]
+
+    with pytest.raises(ValueError) as excinfo:
+        is_on(numpy.array([0.0, 0.0]), numpy.array([[1.0, 1.0]]),
+              numpy.array([[3.0, 3.0]]))
+    with pytest.raises(ValueError) as excinfo:
+        parser.vectorize("not_same_point(p1, p2)", ['p1', 'p2'])
+    with pytest.raises(ValueError) as excinfo:
+        parser.vectorize("is_on(h1, h2, h4)", ['h1', 'h2', 'h3'])
@@ -135,6 +135,95 @@ def test_set_definition():
     test_ValueError("invalid definition")
 
 
+def test_get_evaluator():
+    """Test get_evaluator function."""
+    import pickle
+    r = Relation('R3(h1,m1, hhh2,mm2) <=> h1 > hhh2 or (h1 = hhh2 and m1 > mm2)',
+                 ['hour', 'minute', 'hour', 'minute'], 3)
+
+    evaluator = r.get_evaluator()
+    assert r.get_evaluator() is evaluator
+    assert evaluator(13, 0, 8, 0) is True
+    assert evaluator(8, 30, 8, 15) is True
+    assert evaluator(8, 15, 8, 30) is False
+    assert evaluator(8.5, 15, 8.5, 14.5) is True
+    with pytest.raises(ValueError) as excinfo:
+        evaluator('P(1.0)', 0, 8, 0)
+
+    # the compiled definition isn't pickled
+    r_copy = pickle.loads(pickle.dumps(r))
+    assert r_copy == r
+    assert r_copy._evaluators == {}
+    assert r_copy.get_evaluator()(13, 0, 8, 0) is True
+
+    # changing the definition invalidates the compiled definition
+    r.set_definition('R3(h1,m1,h2,m2) <=> h1 < h2')
+    assert r.get_evaluator() is not evaluator
+    assert r.get_evaluator()(13, 0, 8, 0) is False
+
+    # the arguments of the definition are substituted, not substrings of them
+    r = Relation('R1(a, an) <=> a > 1 and an < 1', ['a', 'a'], 1)
+    assert r.get_evaluator()(2, 0) is True
+
+    # Point and LineSegment functions are called on the objects themselves
+    import numpy
+    from vivid.classes.point import Point
+    from vivid.classes.line_segment import LineSegment
+    r = Relation('R1(h1, h2, h3) <=> is_on(h1, h2, h3)',
+                 ['point', 'point', 'point'], 1)
+    evaluator = r.get_evaluator()
+    assert r.get_evaluator() is evaluator
+    assert evaluator(Point(2.0, 2.0), Point(1.0, 1.0), Point(3.0, 3.0))
+    assert not evaluator(Point(2.0, 2.5), Point(1.0, 1.0), Point(3.0, 3.0))
+    # no precision is lost to stringification
+    third = 1.0 / 3.0
+    assert evaluator(Point(third, third), Point(0.0, 0.0), Point(1.0, 1.0))
+    with pytest.raises(ValueError) as excinfo:
+        evaluator(1, 2, 3)
+    assert list(r.get_evaluator(vectorized=True)(
+        numpy.array([[2.0, 2.0], [2.0, 2.5]]), numpy.array([[1.0, 1.0]]),
+        numpy.array([[3.0, 3.0]]))) == [True, False]
+
+    r = Relation('R1(p, l1, l2) <=> meets(p, l1, l2)',
+                 ['point', 'line', 'line'], 1)
+    l1 = LineSegment(Point(0.0, 0.0), Point(2.0, 2.0))
+    l2 = LineSegment(Point(0.0, 2.0), Point(2.0, 0.0))
+    assert r.get_evaluator()(Point(1.0, 1.0), l1, l2) is True
+    assert r.get_evaluator()(Point(0.5, 0.5), l1, l2) is False
+
+    r = Relation('R1(h1, h2) <=> unknown_function(h1, h2)',
+                 ['point', 'point'], 1)
+    assert r.get_evaluator() is None
+
+    # vectorized definitions are cached separately
+    r = Relation('R1(h1, h2) <=> h1 > h2', ['hour', 'hour'], 1)
+    evaluator = r.get_evaluator(vectorized=True)
+    assert r.get_evaluator(vectorized=True) is evaluator
+    assert r.get_evaluator() is not evaluator
+    assert list(evaluator(numpy.array([13, 8]), numpy.array([8, 8]))) == \
+        [True, False]
+    r.set_definition('R1(h1, h2) <=> h1 < h2')
+    assert list(r.get_evaluator(vectorized=True)(
+        numpy.array([13, 8]), numpy.array([8, 9]))) == [False, True]
+
+    # only parsers unable to compile the definition are skipped; other
+    # errors are not hidden
+    from vivid.classes.parsers.truth_value_parser import TruthValueParser
+
+    def broken_compile(self, string, variables):
+        """Fail as a bug in a parser's compile function would."""
+        raise RuntimeError("bug")
+
+    compile_definition = TruthValueParser.compile
+    TruthValueParser.compile = broken_compile
+    try:
+        r = Relation('R1(h1, h2) <=> h1 > h2', ['hour', 'hour'], 1)
+        with pytest.raises(RuntimeError) as excinfo:
+            r.get_evaluator()
+    finally:
+        TruthValueParser.compile = compile_definition
+
+
 def test_get_DR():
     """Test get_DR function."""
     r = Relation("R1(a,b,c) <=> ", ["a", 'b', 'c'], 1)
@@ -2,6 +2,7 @@
 
 import pytest
 from vivid.classes.valueset import ValueSet
+from vivid.classes.interval import Interval
 from vivid.classes.attribute import Attribute
 from vivid.classes.attribute_structure import AttributeStructure
 from vivid.classes.attribute_system import AttributeSystem
@@ -139,6 +140,27 @@ def test___le__():
     assert s1 <= s
     assert not s <= s1
 
+    # ascriptions are compared as bitmasks over their Attribute's domain
+    # whenever that agrees with ValueSet, i.e., an Interval is not a subset
+    # of its values listed one by one
+    hour = Attribute("hour", [Interval(0, 23)])
+    asys = AttributeSystem(AttributeStructure(hour), ['s1'])
+    s_interval = State(asys, {('hour', 's1'): [Interval(10, 12)]})
+    s_discrete = State(asys, {('hour', 's1'): [10, 11, 12]})
+    s_narrow = State(asys, {('hour', 's1'): [11, 12]})
+    assert s_discrete <= s_interval
+    assert not s_interval <= s_discrete
+    assert s_interval != s_discrete
+    assert s_narrow <= s_interval
+    assert not s_interval <= s_narrow
+    assert s_narrow <= s_discrete
+    assert not s_discrete <= s_narrow
+    for s_left in [s_interval, s_discrete, s_narrow]:
+        for s_right in [s_interval, s_discrete, s_narrow]:
+            ao_pair = ('hour', 's1')
+            assert (s_left <= s_right) == \
+                (s_left[ao_pair] <= s_right[ao_pair])
+
 
 def test___ne__():
     """Test != operator."""
@@ -200,6 +222,9 @@ def test___deepcopy__():
     assert s._attribute_system is not s_copy._attribute_system
     assert s._ascriptions == s_copy._ascriptions
     assert s._ascriptions is not s_copy._ascriptions
+    # ascriptions are immutable and shared between copies
+    assert all([s._ascriptions[ao_pair] is s_copy._ascriptions[ao_pair]
+                for ao_pair in s._ascriptions])
 
 
 def test_set_ascription():
@@ -259,6 +284,20 @@ def test_set_ascription():
     s.set_ascription(('size', 's1'), ['M', 'S'])
     assert s[('size', 's1')] == ValueSet(['S', 'M'])
 
+    # an Interval is not a subset of its values listed one by one
+    hour = Attribute("hour", [1, 2, 3])
+    asys = AttributeSystem(AttributeStructure(hour), ['s1'])
+    s = State(asys)
+    test_ValueError(s, ('hour', 's1'), [Interval(1, 3)])
+    s.set_ascription(('hour', 's1'), [1, 3])
+    assert s[('hour', 's1')] == ValueSet([1, 3])
+    hour = Attribute("hour", [Interval(0, 23)])
+    asys = AttributeSystem(AttributeStructure(hour), ['s1'])
+    s = State(asys)
+    s.set_ascription(('hour', 's1'), [Interval(1, 3), 5])
+    test_ValueError(s, ('hour', 's1'), [Interval(1, 30)])
+    test_ValueError(s, ('hour', 's1'), [24])
+
 
 def test___getitem__():
     """Test indexing for State"""
@@ -328,6 +367,49 @@ def test_add_object():
             ("color", "a"): ValueSet(['R'])}
     assert s._ascriptions == ascr
 
+    # adding an object to a derived State leaves the original untouched
+    s = State(asys)
+    derived = s._derive()
+    derived.add_object("a")
+    assert derived._attribute_system is not s._attribute_system
+    assert derived._attribute_system._attribute_structure is \
+        s._attribute_system._attribute_structure
+    assert s._attribute_system._objects == ['s1']
+    assert s._ascriptions == {("color", "s1"): ValueSet(['R', 'G', 'B'])}
+
+
+def test__derive():
+    """Test _derive function for State."""
+    color = Attribute("color", ['R', 'G', 'B'])
+    size = Attribute("size", ['S', 'M', 'L'])
+    a = AttributeStructure(color, size)
+    o = ['s1', 's2']
+    asys = AttributeSystem(a, o)
+
+    s = State(asys, {('color', 's1'): ['R', 'G']})
+    derived = s._derive()
+    assert type(derived) is State
+    assert derived == s
+    assert derived._attribute_system is s._attribute_system
+    assert derived._ascriptions is s._ascriptions
+
+    # set_ascription copies the shared ascriptions of the State it's called on
+    derived.set_ascription(('color', 's1'), ['R'])
+    assert derived._ascriptions is not s._ascriptions
+    assert derived[('color', 's1')] == ValueSet(['R'])
+    assert s[('color', 's1')] == ValueSet(['R', 'G'])
+    assert derived[('size', 's2')] is s[('size', 's2')]
+    s.set_ascription(('size', 's2'), ['S'])
+    assert derived[('size', 's2')] == ValueSet(['S', 'M', 'L'])
+
+    # derive with replacement ascriptions
+    from vivid.classes.valueset import FrozenValueSet
+    derived = s._derive({('color', 's2'): FrozenValueSet(['B'])})
+    assert derived._attribute_system is s._attribute_system
+    assert derived._ascriptions is not s._ascriptions
+    assert derived[('color', 's2')] == ValueSet(['B'])
+    assert s[('color', 's2')] == ValueSet(['R', 'G', 'B'])
+
 
 def test_is_valuation():
     """Test is_valuation function."""
@@ -421,10 +503,187 @@ def test_get_worlds():
     w4 = State(asys, ascr4)
     worlds = [w1, w2, w3, w4]
 
+    import types
+    assert isinstance(s.get_worlds(), types.GeneratorType)
+
     for w in s.get_worlds():
         assert w in worlds
+        # worlds share the AttributeSystem of the State they come from
+        assert w._attribute_system is s._attribute_system
+
+    assert len(list(s.get_worlds())) == len(worlds)
+
+
+def test_count_worlds():
+    """Test count_worlds function."""
+    from vivid.classes.interval import Interval
+    color = Attribute("color", ['R', 'G', 'B'])
+    size = Attribute("size", ['S', 'M', 'L'])
+    hour = Attribute("hour", [Interval(0, 23)])
+    a = AttributeStructure(color, size, hour)
+    asys = AttributeSystem(a, ['s1', 's2'])
+
+    s = State(asys)
+    assert s.count_worlds() == (3 * 3 * 24) ** 2
+    s.set_ascription(('color', 's2'), ['B', 'G'])
+    s.set_ascription(('hour', 's1'), [Interval(1, 3), 5])
+    s.set_ascription(('hour', 's2'), [7])
+    assert s.count_worlds() == 3 * 3 * 4 * 2 * 3 * 1
 
-    assert len(s.get_worlds()) == len(worlds)
+    s = State(AttributeSystem(AttributeStructure(color, size), ['s1', 's2']),
+              {('color', 's2'): ['B', 'G'], ('size', 's2'): ['L', 'S']})
+    assert s.count_worlds() == len(list(s.get_worlds()))
+
+    # no world is generated to count them
+    asys = AttributeSystem(AttributeStructure(hour), ['s' + str(i)
+                                                      for i in range(50)])
+    assert State(asys).count_worlds() == 24 ** 50
+
+
+def test_set_world_budget():
+    """Test set_world_budget function."""
+    from vivid.classes.state import WorldBudgetExceededError
+    color = Attribute("color", ['R', 'G', 'B'])
+    size = Attribute("size", ['S', 'M', 'L'])
+    asys = AttributeSystem(AttributeStructure(color, size), ['s1', 's2'])
+    s = State(asys, {('color', 's1'): ['R'], ('color', 's2'): ['B', 'G'],
+                     ('size', 's1'): ['M'], ('size', 's2'): ['L', 'S']})
+
+    with pytest.raises(TypeError) as excinfo:
+        State.set_world_budget('1')
+    with pytest.raises(TypeError) as excinfo:
+        State.set_world_budget(1.0)
+    with pytest.raises(ValueError) as excinfo:
+        State.set_world_budget(-1)
+
+    try:
+        State.set_world_budget(3)
+        with pytest.raises(WorldBudgetExceededError) as excinfo:
+            s.get_worlds().next()
+        assert excinfo.value.count == 4
+        assert excinfo.value.budget == 3
+        # the budget is checked when get_worlds is called, not on next
+        with pytest.raises(WorldBudgetExceededError) as excinfo:
+            s.get_worlds()
+
+        State.set_world_budget(4)
+        assert len(list(s.get_worlds())) == 4
+    finally:
+        State.set_world_budget(None)
+
+    assert State._world_budget is None
+    assert len(list(s.get_worlds())) == 4
+
+
+def test_get_projected_valuations():
+    """Test get_projected_valuations function."""
+    from vivid.classes.interval import Interval
+    color = Attribute("color", ['R', 'G', 'B'])
+    size = Attribute("size", ['S', 'M', 'L'])
+    hour = Attribute("hour", [Interval(0, 23)])
+    a = AttributeStructure(color, size, hour)
+    o = ['s1', 's2']
+    asys = AttributeSystem(a, o)
+
+    ascr = {
+        ('color', 's1'): ['R'],
+        ('color', 's2'): ['B', 'G'],
+        ('size', 's1'): ['M'],
+        ('size', 's2'): ['L', 'S'],
+        ('hour', 's1'): [Interval(1, 3)],
+        ('hour', 's2'): [Interval(0, 23)]}
+
+    s = State(asys, ascr)
+
+    import types
+    assert isinstance(
+        s.get_projected_valuations([('color', 's1')]), types.GeneratorType)
+
+    assert list(s.get_projected_valuations([('color', 's1')])) == [('R',)]
+    assert list(s.get_projected_valuations([('hour', 's1')])) == \
+        [(1,), (2,), (3,)]
+    assert set(s.get_projected_valuations(
+        [('size', 's2'), ('hour', 's1')])) == set(
+        [('L', 1), ('L', 2), ('L', 3), ('S', 1), ('S', 2), ('S', 3)])
+    assert list(s.get_projected_valuations([])) == [()]
+
+    # projecting onto every ao-pair gives back every world
+    ao_pairs = s._ascriptions.keys()
+    assert len(list(s.get_projected_valuations(ao_pairs))) == \
+        len(list(s.get_worlds()))
+
+    with pytest.raises(KeyError) as excinfo:
+        list(s.get_projected_valuations([('color', 's3')]))
+
+    # spread generates the same valuations, extremes first
+    basis = [('size', 's2'), ('hour', 's1'), ('hour', 's2')]
+    spread = list(s.get_projected_valuations(basis, spread=True))
+    assert len(spread) == len(set(spread)) == 2 * 3 * 24
+    assert set(spread) == set(s.get_projected_valuations(basis))
+    assert set(spread[:8]) == set(
+        [(size, h1, h2) for size in ['L', 'S'] for h1 in [1, 3]
+         for h2 in [0, 23]])
+    assert spread[8:] and all([2 in v or 11 in v for v in spread[8:12]])
+    assert list(s.get_projected_valuations([], spread=True)) == [()]
+    assert list(s.get_projected_valuations(
+        [('hour', 's1')], spread=True)) == [(1,), (3,), (2,)]
+
+
+def test__spread_values():
+    """Test _spread_values function."""
+    assert State._spread_values([]) == []
+    assert State._spread_values([1]) == [1]
+    assert State._spread_values([1, 2]) == [1, 2]
+    assert State._spread_values(range(9)) == [0, 8, 4, 2, 6, 1, 3, 5, 7]
+    assert sorted(State._spread_values(range(60))) == range(60)
+
+
+def test__generate_layered_product():
+    """Test _generate_layered_product function."""
+    from itertools import product
+    assert list(State._generate_layered_product([])) == [()]
+    assert list(State._generate_layered_product([[1, 2], []])) == []
+    assert list(State._generate_layered_product([[1, 2], [3, 4]])) == \
+        [(1, 3), (2, 3), (2, 4), (1, 4)]
+
+    valuesets = [range(3), range(5), range(1), range(4)]
+    layered = list(State._generate_layered_product(valuesets))
+    assert len(layered) == len(set(layered)) == 3 * 5 * 1 * 4
+    assert set(layered) == set(product(*valuesets))
+    # every tuple of a layer is generated before the next layer
+    depths = [max(values) for values in layered]
+    assert depths == sorted(depths)
+
+
+def test_get_fingerprint():
+    """Test get_fingerprint function."""
+    from vivid.classes.interval import Interval
+    color = Attribute("color", ['R', 'G', 'B'])
+    hour = Attribute("hour", [Interval(0, 23)])
+    asys = AttributeSystem(AttributeStructure(color, hour), ['s1', 's2'])
+
+    s = State(asys, {('color', 's1'): ['R'], ('hour', 's1'): [Interval(1, 3)]})
+    s2 = State(asys, {('color', 's1'): ['R'], ('hour', 's1'): [Interval(1, 4)]})
+
+    fingerprint = s.get_fingerprint([('color', 's1'), ('hour', 's1')])
+    assert fingerprint == ((((str, 'R'),), ((Interval, Interval(1, 3)),)))
+    assert hash(fingerprint) == hash(
+        State(asys, {('color', 's1'): ['R'],
+                     ('hour', 's1'): [Interval(1, 3)]}).get_fingerprint(
+            [('color', 's1'), ('hour', 's1')]))
+    assert s.get_fingerprint([('color', 's1')]) == \
+        s2.get_fingerprint([('color', 's1')])
+    assert s.get_fingerprint([('hour', 's1')]) != \
+        s2.get_fingerprint([('hour', 's1')])
+    assert s.get_fingerprint([]) == ()
+
+    # values are told apart by type
+    number = Attribute("number", [1, 2.0, True])
+    s3 = State(AttributeSystem(AttributeStructure(number), ['s1']))
+    assert len(set(s3.get_fingerprint([('number', 's1')])[0])) == 3
+
+    with pytest.raises(KeyError) as excinfo:
+        s.get_fingerprint([('color', 's3')])
 
 
 def test_is_disjoint():
@@ -463,6 +722,12 @@ def test_is_disjoint():
     assert not s1.is_disjoint(s1)
     assert not s1.is_disjoint(s3)
 
+    s4 = State(asys, {('length', 's1'): [5], ('length', 's2'): [5]})
+    s5 = State(asys, {('length', 's1'): [1, 5], ('length', 's2'): [3]})
+    assert s2.is_disjoint(s4)
+    assert not s2.is_disjoint(s5)
+    assert s4.is_disjoint(s5)
+
 
 def test_is_alternate_extension():
     """Test is_alternate_extension function."""
@@ -1,6 +1,6 @@
 """TruthValueParser unit tests."""
 
-from vivid.classes.parsers.truth_value_parser import TruthValueParser
+from vivid.classes.parsers.truth_value_parser import TruthValueParser, parse
 
 
 def test_eval():
@@ -14,3 +14,171 @@ def test_eval():
     assert lmtp(
         '!(4 < 5 * cos(2 * PI) and 4 * e^3 > 3 * 3 * (3 + 3)) and !!(2 < 3)') \
         is False
+
+
+def test_handles():
+    """Test handles function."""
+    lmtp = TruthValueParser()
+    assert lmtp.handles('(4 < 5 * cos(2 * PI)) and !!(2 < 3)')
+    assert not lmtp.handles('is_on(P(2.0,2.0),P(-1.0,-1.0),P(3.0,3.0))')
+
+
+def test_parse():
+    """Test parsing into a stack."""
+    import threading
+    import pytest
+    from pyparsing import ParseException
+
+    assert parse('2 < 3') == ['2', '3', '<']
+    assert parse('-h1 ^ 2', ['h1']) == ['h1', 'unary -', '2', '^']
+    assert parse('!(h1 > 0)', ['h1']) == ['h1', '0', '>', '!']
+    with pytest.raises(ParseException) as excinfo:
+        parse('h1 > 0')
+
+    # a negation left over from one parse doesn't carry into the next, even
+    # across TruthValueParser objects
+    assert TruthValueParser()('!True') is True
+    assert TruthValueParser()('2 < 3') is True
+
+    # a single TruthValueParser object can be shared across threads
+    lmtp = TruthValueParser()
+    errors = []
+
+    def evaluate(i):
+        """Evaluate expressions whose truth value is known."""
+        for j in range(100):
+            expression = '%d < %d and !(%d > 3)' % (j, j + i, i)
+            if lmtp(expression) != (j < j + i and not i > 3):
+                errors.append(expression)
+
+    threads = [threading.Thread(target=evaluate, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+
+
+def test_compile():
+    """Test TruthValueParser compilation of expressions."""
+    import pytest
+    from pyparsing import ParseException
+    lmtp = TruthValueParser()
+
+    ahead = lmtp.compile('h1 > hhh2 or (h1 = hhh2 and m1 > mm2)',
+                         ['h1', 'm1', 'hhh2', 'mm2'])
+    assert ahead(13, 0, 8, 0) is True
+    assert ahead(8, 30, 8, 15) is True
+    assert ahead(8, 15, 8, 30) is False
+
+    # the compiled expression agrees with evaluating the substituted string
+    f = lmtp.compile('!(x ^ 2 - 2 * x / 4 >= sin(y)) or z', ['x', 'y', 'z'])
+    for x, y, z in [(1, 2, False), (-3.5, 0.25, False), (2L, 1, True)]:
+        expression = '!(' + str(x) + ' ^ 2 - 2 * ' + str(x) + ' / 4 >= sin(' \
+            + str(y) + ')) or ' + str(z)
+        assert f(x, y, z) == lmtp(expression)
+
+    # compiled expressions don't interfere with one another or _eval
+    assert lmtp('2 < 3') is True
+    assert ahead(13, 0, 8, 0) is True
+
+    with pytest.raises(ValueError) as excinfo:
+        ahead('13', 0, 8, 0)
+    with pytest.raises(ValueError) as excinfo:
+        ahead(None, 0, 8, 0)
+    with pytest.raises(ParseException) as excinfo:
+        lmtp.compile('h1 > h2', ['h1'])
+    with pytest.raises(ParseException) as excinfo:
+        lmtp.compile('is_on(h1, h2, h3)', ['h1', 'h2', 'h3'])
+
+
+def test_vectorize():
+    """Test TruthValueParser vectorization of expressions."""
+    import numpy
+    import pytest
+    from itertools import product
+    from pyparsing import ParseException
+    lmtp = TruthValueParser()
+
+    ahead = lmtp.vectorize('h1 > hhh2 or (h1 = hhh2 and m1 > mm2)',
+                           ['h1', 'm1', 'hhh2', 'mm2'])
+    assert list(ahead(numpy.array([13, 8, 8]), numpy.array([0, 30, 15]),
+                      numpy.array([8, 8, 8]), numpy.array([0, 15, 30]))) == \
+        [True, True, False]
+
+    # the vectorized expression agrees with the compiled expression
+    for expression in ['!(x ^ 2 - 2 * x / 4 >= sin(y)) or z > 0',
+                       'round(x) = trunc(y) and sgn(-x) < abs(z)',
+                       '!!(x < y) and (PI * E > z or True)']:
+        f = lmtp.compile(expression, ['x', 'y', 'z'])
+        g = lmtp.vectorize(expression, ['x', 'y', 'z'])
+        values = [-3.5, -0.5, 0, 0.25, 2, 2.5]
+        x, y, z = zip(*product(values, values, values))
+        assert list(g(numpy.array(x), numpy.array(y), numpy.array(z))) == \
+            [f(*v) for v in zip(x, y, z)]
+
+    with pytest.raises(FloatingPointError) as excinfo:
+        lmtp.vectorize('1 / x > 0', ['x'])(numpy.array([1, 0]))
+    with pytest.raises(FloatingPointError) as excinfo:
+        lmtp.vectorize('x ^ 0.5 > 0', ['x'])(numpy.array([1, -1]))
+    with pytest.raises(ParseException) as excinfo:
+        lmtp.vectorize('is_on(h1, h2, h3)', ['h1', 'h2', 'h3'])
+
+
+def test_evaluate_intervals():
+    """Test TruthValueParser symbolic evaluation over intervals."""
+    import pytest
+    from vivid.classes.interval import Interval
+    lmtp = TruthValueParser()
+
+    ahead = 'h1 > hhh2 or (h1 = hhh2 and m1 > mm2)'
+    assert lmtp.evaluate_intervals(
+        ahead, {'h1': Interval(15, 17), 'hhh2': 11, 'm1': 23, 'mm2': 23}) \
+        is True
+    assert lmtp.evaluate_intervals(
+        ahead, {'h1': Interval(0, 10), 'hhh2': 11, 'm1': 23,
+                'mm2': Interval(0, 59)}) is False
+    assert lmtp.evaluate_intervals(
+        ahead, {'h1': Interval(9, 13), 'hhh2': 11, 'm1': 23,
+                'mm2': Interval(0, 59)}) == "unknown"
+    # only decided once h1 = hhh2 = 11 is split off
+    assert lmtp.evaluate_intervals(
+        ahead, {'h1': Interval(11, 13), 'hhh2': 11, 'm1': 23,
+                'mm2': Interval(0, 22)}) is True
+
+    # int Intervals are discrete
+    assert lmtp.evaluate_intervals('h1 * h1 = 121', {'h1': Interval(0, 23)}) \
+        == "unknown"
+    assert lmtp.evaluate_intervals('h1 * h1 = 120', {'h1': Interval(0, 23)}) \
+        is False
+    assert lmtp.evaluate_intervals('h1 > 10.5', {'h1': Interval(11, 23)}) \
+        is True
+    assert lmtp.evaluate_intervals('!(h1 < 11)', {'h1': Interval(11, 23)}) \
+        is True
+
+    # float Intervals are continuous
+    assert lmtp.evaluate_intervals('x > 0.5', {'x': Interval(0.0, 1.0)}) \
+        == "unknown"
+    assert lmtp.evaluate_intervals('x >= 0', {'x': Interval(0.0, 1.0)}) \
+        is True
+    assert lmtp.evaluate_intervals('x ^ 2 <= x', {'x': Interval(0.0, 1.0)}) \
+        == "unknown"
+    assert lmtp.evaluate_intervals(
+        'abs(x) <= 1 and sin(x) <= 1', {'x': Interval(-1.0, 1.0)}) is True
+
+    # variables mapped to the same key take the same value
+    assert lmtp.evaluate_intervals(
+        'h1 - h2 = 0', {0: Interval(0, 100)}, {'h1': 0, 'h2': 0}) is True
+    assert lmtp.evaluate_intervals(
+        'h1 - h2 = 0', {0: Interval(0, 100), 1: Interval(0, 100)},
+        {'h1': 0, 'h2': 1}) == "unknown"
+
+    # numeric evaluation is unaffected by variables
+    assert lmtp('2 < 3') is True
+    with pytest.raises(Exception) as excinfo:
+        lmtp('h1 < 3')
+    with pytest.raises(Exception) as excinfo:
+        lmtp.evaluate_intervals('h1 < h2', {'h1': 3})
+    with pytest.raises(TypeError) as excinfo:
+        lmtp.evaluate_intervals('h1 < 3', {'h1': 'a'})
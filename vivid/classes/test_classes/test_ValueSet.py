@@ -73,6 +73,11 @@ def test___eq__():
     assert VS1 == VS2
     VS1, VS2 = ValueSet([LineSegment(Point(1.0), Point(2.0))]), ValueSet([LineSegment(Point(-1.0), Point(-2.0))])
     assert VS1 != VS2
+    # numeric types compare equal across types
+    assert ValueSet([1, 2]) == ValueSet([1.0, 2L])
+    assert ValueSet([1, 'a']) != ValueSet([1.0, 'b'])
+    # values of different object types with the same hash are never equal
+    assert ValueSet([Interval(0, 1)]) != ValueSet([Point(0.0, 1.0)])
 
 
 def test___le__():
@@ -210,6 +215,8 @@ def test___add__():
         Interval(2L, 5L)])
 
     VSC = VSA + VSB
+    assert VSA + 'z' == VSA + ValueSet(['z'])
+    assert 'z' not in VSA
     assert VSC == ValueSet([-5, -2, 15L, 33L, 167.4, 555.679, 'c', 'e',
                            True, False, Interval(1, 10), Interval(10.0, 75.4),
                            Interval(2L, 5L), Point(1.0, 1.0)])
@@ -432,6 +439,17 @@ def test___sub__():
     VSR = ValueSet([1.00000000001])
     assert VSN - VSR == ValueSet([1.0, Interval(1.00000000002, 10.0)])
 
+    # Intervals and values covered by Intervals in other are removed
+    VSW = ValueSet([Interval(0, 100)])
+    VSX = ValueSet([2, 5L, Interval(10, 20), Interval(30, 40),
+                    Interval(0.0, 1.0), 'a'])
+    assert VSX - VSW == ValueSet([5L, Interval(0.0, 1.0), 'a'])
+    assert VSW - VSX == ValueSet([Interval(0, 1), Interval(3, 9),
+                                  Interval(21, 29), Interval(41, 100)])
+    VSY = ValueSet([Interval(-5, 15), Interval(25, 35), 50])
+    assert VSX - VSY == ValueSet([5L, Interval(16, 20), Interval(36, 40),
+                                  Interval(0.0, 1.0), 'a'])
+
     VSS = VSF + VSJ + VSN
     VST = VSG + VSK + VSO
     VSU = VSH + VSL + VSP
@@ -565,6 +583,14 @@ def test___contains__():
     assert not Interval(100.0, 1000.0) in v
     assert not Interval(100L, 1000L) in v
     assert not Point('x') in v
+    assert 1.0 in v
+    assert 2L in v
+    assert not 3 in v
+    assert not '1' in v
+    assert not [1] in v
+    assert not object() in v
+    # Point(100.0, 1000.0) hashes like Interval(100, 1000)
+    assert not Point(100.0, 1000.0) in v
 
 
 def test___len__():
@@ -627,6 +653,13 @@ def test___setitem__():
     test_ValueError(v, 1, 1)
     test_IndexError(v, 11, -37)
     test_TypeError(v, 1, object)
+    # membership and equality follow assignments
+    v[1] = 'z'
+    assert 'z' in v
+    assert 3 not in v
+    assert v == ValueSet([1000, 5, 'a', 'b', 'c', 'z', False, True,
+                          Interval(100, 105), Interval(2.0, 10.0),
+                          Point(1.0)])
 
 
 def test___nonzero__():
@@ -767,6 +800,15 @@ def test__parse():
     assert interval_collapsing == [
         Interval(-10, 500), Interval(-10.2, 500.442), Interval(-10L, 500L)]
 
+    # adjacent discrete Intervals and chains of adjacent values are merged
+    interval_merging = ValueSet._parse(
+        [Interval(0, 3), Interval(4, 6), 7, 8, 10, Interval(0L, 3L), 5L, 4L,
+         Interval(0.0, 3.0), Interval(4.0, 6.0), 3.5])
+
+    assert interval_merging == [
+        10, 3.5, Interval(0, 8), Interval(0.0, 3.0), Interval(4.0, 6.0),
+        Interval(0L, 5L)]
+
     point_duplicates = ValueSet._parse([Point(1.0), Point(1.0), Point('x')])
 
     assert point_duplicates == [Point(1.0), Point('x')]
@@ -781,3 +823,110 @@ def test__parse():
     assert line_segment_duplicates == [LineSegment(Point(1.0), Point(0.0)),
                                        LineSegment(Point('x'), Point('x')),
                                        LineSegment(Point('x', 'x'), Point('x', 'x'))]
+
+
+def test__reindex():
+    """Test _reindex function for ValueSet."""
+    v = ValueSet([1, 'a', Point(1.0)])
+    v._get_index()
+    v._values[1] = 'b'
+    v._reindex()
+    assert v._index is None
+    assert v._type_lists == {int: [1], str: ['b'], '_is_Point': [Point(1.0)]}
+    assert 'b' in v
+    assert 'a' not in v
+
+
+def test__get_index():
+    """Test _get_index function for ValueSet."""
+    v = ValueSet([1, 2L, 1.5, True, 'a', Interval(5, 10), Point(1.0)])
+    assert v._index is None
+    index = v._get_index()
+    assert index == {int: frozenset([1, 2L, 1.5, True]),
+                     str: frozenset(['a']),
+                     '_is_Interval': frozenset([Interval(5, 10)]),
+                     '_is_Point': frozenset([Point(1.0)])}
+    assert v._get_index() is index
+    assert ValueSet([])._get_index() == {}
+
+
+def test__get_type_key():
+    """Test _get_type_key function for ValueSet."""
+    assert ValueSet._get_type_key(1) is int
+    assert ValueSet._get_type_key(1L) is long
+    assert ValueSet._get_type_key(True) is bool
+    assert ValueSet._get_type_key('a') is str
+    assert ValueSet._get_type_key(Interval(0, 1)) == '_is_Interval'
+    assert ValueSet._get_type_key(Point(1.0)) == '_is_Point'
+    assert ValueSet._get_type_key(
+        LineSegment(Point(0.0), Point(1.0))) == '_is_LineSegment'
+
+    with pytest.raises(TypeError) as excinfo:
+        ValueSet._get_type_key(object())
+    with pytest.raises(TypeError) as excinfo:
+        ValueSet._get_type_key(None)
+    i = Interval(1, 10)
+    i._is_Point = True
+    with pytest.raises(AttributeError) as excinfo:
+        ValueSet._get_type_key(i)
+
+
+def test__get_index_key():
+    """Test _get_index_key function for ValueSet."""
+    for type_key in [int, long, float, bool]:
+        assert ValueSet._get_index_key(type_key) is int
+    assert ValueSet._get_index_key(str) is str
+    assert ValueSet._get_index_key('_is_Point') == '_is_Point'
+
+
+def test__join_types():
+    """Test _join_types function for ValueSet."""
+    assert ValueSet._join_types({}) == []
+    assert ValueSet._join_types(
+        {'_is_Point': [Point(1.0)], str: ['a', 'b'], int: [2, 1],
+         bool: [True], '_is_Interval': [Interval(5, 10)]}) == \
+        [2, 1, 'a', 'b', True, Interval(5, 10), Point(1.0)]
+
+
+def test__parse_by_types():
+    """Test _parse_by_types function for ValueSet."""
+    with pytest.raises(TypeError) as excinfo:
+        ValueSet._parse_by_types((1, 2))
+
+    type_lists = ValueSet._parse_by_types(
+        ['b', 3, 'a', 0, 7, 6, Interval(2, 5), Point(1.0), Point(1.0)])
+    assert type_lists[int] == [0]
+    assert type_lists[str] == ['a', 'b']
+    assert type_lists['_is_Interval'] == [Interval(2, 7)]
+    assert type_lists['_is_Point'] == [Point(1.0)]
+
+
+def test__normalize_intervals():
+    """Test _normalize_intervals function for ValueSet."""
+    from collections import defaultdict
+    type_lists = defaultdict(list)
+    type_lists[int] = [-5, 0, 11, 12]
+    type_lists[float] = [0.5, 20.0]
+    type_lists[str] = ['a']
+    type_lists["_is_Interval"] = [
+        Interval(5, 10), Interval(1, 4), Interval(0.0, 1.0)]
+
+    ValueSet._normalize_intervals(type_lists)
+    assert type_lists[int] == [-5]
+    assert type_lists[float] == [20.0]
+    assert type_lists[str] == ['a']
+    assert type_lists["_is_Interval"] == [
+        Interval(0, 12), Interval(0.0, 1.0)]
+
+
+def test_discretize():
+    """Test discretize function for ValueSet."""
+    from vivid.classes.interval import DiscreteRange
+    v = ValueSet(['a', 1, Interval(3, 5), Interval(0.0, 1.0)])
+    assert v.discretize() == [1, 'a', 3, 4, 5, 0.0, 1.0]
+    assert ValueSet([]).discretize() == []
+
+    # a single Interval is never materialized
+    discrete_values = ValueSet([Interval(0, 10 ** 6)]).discretize()
+    assert isinstance(discrete_values, DiscreteRange)
+    assert len(discrete_values) == 10 ** 6 + 1
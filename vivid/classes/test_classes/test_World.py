@@ -0,0 +1,242 @@
+"""World unit tests."""
+
+import pytest
+from vivid.classes.attribute import Attribute
+from vivid.classes.attribute_structure import AttributeStructure
+from vivid.classes.attribute_system import AttributeSystem
+from vivid.classes.attribute_interpretation import AttributeInterpretation
+from vivid.classes.assumption_base import AssumptionBase
+from vivid.classes.constant_assignment import ConstantAssignment
+from vivid.classes.variable_assignment import VariableAssignment
+from vivid.classes.context import Context
+from vivid.classes.formula import Formula
+from vivid.classes.interval import Interval
+from vivid.classes.named_state import NamedState
+from vivid.classes.relation import Relation
+from vivid.classes.relation_symbol import RelationSymbol
+from vivid.classes.vocabulary import Vocabulary
+from vivid.classes.world import World
+
+
+def get_hour_setup():
+    """Return an AttributeInterpretation, NamedState and Formulae to test."""
+    hour = Attribute('hour', [Interval(0, 23)])
+    r_pm = Relation('R1(h1) <=> h1 > 11', ['hour'], 1)
+    r_am = Relation('R2(h1) <=> h1 <= 11', ['hour'], 2)
+    attribute_structure = AttributeStructure(hour, r_pm, r_am)
+
+    pm_rs = RelationSymbol('PM', 1)
+    am_rs = RelationSymbol('AM', 1)
+    vocabulary = Vocabulary(['C1'], [pm_rs, am_rs], [])
+
+    profiles = [[pm_rs, ('hour', 1)], [am_rs, ('hour', 1)]]
+    attribute_interpretation = AttributeInterpretation(
+        vocabulary, attribute_structure, {pm_rs: 1, am_rs: 2}, profiles)
+
+    attribute_system = AttributeSystem(attribute_structure, ['c1'])
+    p = ConstantAssignment(vocabulary, attribute_system, {'C1': 'c1'})
+    named_state = NamedState(attribute_system, p,
+                             {('hour', 'c1'): [Interval(10, 13)]})
+
+    pm = Formula(vocabulary, 'PM', 'C1')
+    am = Formula(vocabulary, 'AM', 'C1')
+
+    return attribute_interpretation, named_state, pm, am
+
+
+def get_partial_world():
+    """
+    Return an AttributeInterpretation, a Formula and a World whose
+    ConstantAssignment cannot be total as there are more constants than
+    objects.
+    """
+    hour = Attribute('hour', [Interval(0, 23)])
+    r_pm = Relation('R1(h1) <=> h1 > 11', ['hour'], 1)
+    attribute_structure = AttributeStructure(hour, r_pm)
+
+    pm_rs = RelationSymbol('PM', 1)
+    vocabulary = Vocabulary(['C1', 'C2'], [pm_rs], [])
+    attribute_interpretation = AttributeInterpretation(
+        vocabulary, attribute_structure, {pm_rs: 1}, [[pm_rs, ('hour', 1)]])
+
+    attribute_system = AttributeSystem(attribute_structure, ['c1'])
+    p = ConstantAssignment(vocabulary, attribute_system, {})
+    named_state = NamedState(attribute_system, p,
+                             {('hour', 'c1'): [Interval(10, 13)]})
+    world = next(named_state.get_worlds(compact=True))
+
+    return attribute_interpretation, Formula(vocabulary, 'PM', 'C1'), world
+
+
+def test___init__():
+    """Test World constructor."""
+    color = Attribute('color', ['R', 'G'])
+    attribute_system = AttributeSystem(AttributeStructure(color), ['s1'])
+    vocabulary = Vocabulary(['a'], [], [])
+    p = ConstantAssignment(vocabulary, attribute_system, {'a': 's1'})
+
+    positions = {('color', 's1'): 0}
+    valuations = [['R', 'G']]
+
+    with pytest.raises(ValueError) as excinfo:
+        World(attribute_system, p, positions, valuations, (0, 1))
+    with pytest.raises(ValueError) as excinfo:
+        World(attribute_system, p, positions, [], (0,))
+
+    world = World(attribute_system, p, positions, valuations, (1,))
+    assert world._attribute_system is attribute_system
+    assert world._p is p
+    assert world._positions is positions
+    assert world._valuations is valuations
+    assert world._indices == (1,)
+    assert world._is_World
+
+
+def test___getitem__():
+    """Test indexing for World object."""
+    color = Attribute('color', ['R', 'G'])
+    attribute_system = AttributeSystem(AttributeStructure(color), ['s1'])
+    vocabulary = Vocabulary(['a'], [], [])
+    p = ConstantAssignment(vocabulary, attribute_system, {'a': 's1'})
+    world = World(attribute_system, p, {('color', 's1'): 0}, [['R', 'G']],
+                  (1,))
+
+    assert world[('color', 's1')] == 'G'
+    with pytest.raises(KeyError) as excinfo:
+        world[('color', 's2')]
+
+
+def test_is_world():
+    """Test is_world() function for World object."""
+    attribute_interpretation, named_state, pm, am = get_hour_setup()
+    for world in named_state.get_worlds(compact=True):
+        assert world.is_world()
+
+    # with more constants than objects the ConstantAssignment is not total
+    attribute_interpretation, pm, world = get_partial_world()
+    assert not world._p.is_total()
+    assert not world.is_world()
+
+
+def test_get_worlds():
+    """Test get_worlds() function for World object."""
+    attribute_interpretation, named_state, pm, am = get_hour_setup()
+    worlds = list(named_state.get_worlds(compact=True))
+    assert len(worlds) == 4
+
+    # every World shares the discretized values of the NamedState
+    assert all([w._valuations is worlds[0]._valuations for w in worlds])
+    assert [w[('hour', 'c1')] for w in worlds] == [10, 11, 12, 13]
+
+    for world in worlds:
+        assert list(world.get_worlds()) == [world]
+
+
+def test_get_projected_valuations():
+    """Test get_projected_valuations() function for World object."""
+    attribute_interpretation, named_state, pm, am = get_hour_setup()
+    worlds = list(named_state.get_worlds(compact=True))
+    assert [list(w.get_projected_valuations([('hour', 'c1')]))
+            for w in worlds] == [[(10,)], [(11,)], [(12,)], [(13,)]]
+    assert list(worlds[0].get_projected_valuations([])) == [()]
+
+    with pytest.raises(KeyError) as excinfo:
+        list(worlds[0].get_projected_valuations([('hour', 'c2')]))
+
+
+def test_get_fingerprint():
+    """Test get_fingerprint() function for World object."""
+    attribute_interpretation, named_state, pm, am = get_hour_setup()
+    worlds = list(named_state.get_worlds(compact=True))
+    assert worlds[0].get_fingerprint([('hour', 'c1')]) == (((int, 10),),)
+    assert worlds[0].get_fingerprint([]) == ()
+
+    # a World has the fingerprint of its NamedState
+    for world in worlds:
+        assert world.get_fingerprint([('hour', 'c1')]) == \
+            world.get_named_state().get_fingerprint([('hour', 'c1')])
+
+    with pytest.raises(KeyError) as excinfo:
+        worlds[0].get_fingerprint([('hour', 'c2')])
+
+
+def test_get_named_state():
+    """Test get_named_state() function for World object."""
+    attribute_interpretation, named_state, pm, am = get_hour_setup()
+    compact_worlds = named_state.get_worlds(compact=True)
+    for world, ns_world in zip(compact_worlds, named_state.get_worlds()):
+        assert world.get_named_state() == ns_world
+
+
+def test_satisfies_formula():
+    """Test satisfies_formula() function for World object."""
+    attribute_interpretation, named_state, pm, am = get_hour_setup()
+    worlds = list(named_state.get_worlds(compact=True))
+    X = VariableAssignment(pm._vocabulary, named_state._attribute_system,
+                           {}, dummy=True)
+
+    with pytest.raises(TypeError) as excinfo:
+        worlds[0].satisfies_formula(None, X, attribute_interpretation)
+    with pytest.raises(TypeError) as excinfo:
+        worlds[0].satisfies_formula(pm, None, attribute_interpretation)
+    with pytest.raises(TypeError) as excinfo:
+        worlds[0].satisfies_formula(pm, X, None)
+
+    assert [w.satisfies_formula(pm, X, attribute_interpretation)
+            for w in worlds] == [False, False, True, True]
+    assert [w.satisfies_formula(am, X, attribute_interpretation)
+            for w in worlds] == [True, True, False, False]
+
+    attribute_interpretation, pm, world = get_partial_world()
+    X = VariableAssignment(pm._vocabulary, world._attribute_system,
+                           {}, dummy=True)
+    with pytest.raises(ValueError) as excinfo:
+        world.satisfies_formula(pm, X, attribute_interpretation)
+
+
+def test_satisfies_named_state():
+    """Test satisfies_named_state() function for World object."""
+    attribute_interpretation, named_state, pm, am = get_hour_setup()
+    worlds = list(named_state.get_worlds(compact=True))
+
+    with pytest.raises(TypeError) as excinfo:
+        worlds[0].satisfies_named_state(None)
+
+    afternoon = NamedState(named_state._attribute_system, named_state._p,
+                           {('hour', 'c1'): [Interval(12, 23)]})
+
+    assert all([w.satisfies_named_state(named_state) for w in worlds])
+    assert [w.satisfies_named_state(afternoon)
+            for w in worlds] == [False, False, True, True]
+    assert [w.satisfies_named_state(afternoon) for w in worlds] == \
+        [w.get_named_state().satisfies_named_state(afternoon) for w in worlds]
+
+    attribute_interpretation, pm, world = get_partial_world()
+    with pytest.raises(ValueError) as excinfo:
+        world.satisfies_named_state(world.get_named_state())
+
+
+def test_satisfies_context():
+    """Test satisfies_context() function for World object."""
+    attribute_interpretation, named_state, pm, am = get_hour_setup()
+    worlds = list(named_state.get_worlds(compact=True))
+    X = VariableAssignment(pm._vocabulary, named_state._attribute_system,
+                           {}, dummy=True)
+    context = Context(AssumptionBase(pm), named_state)
+
+    with pytest.raises(TypeError) as excinfo:
+        worlds[0].satisfies_context(None, X, attribute_interpretation)
+    with pytest.raises(TypeError) as excinfo:
+        worlds[0].satisfies_context(context, None, attribute_interpretation)
+    with pytest.raises(TypeError) as excinfo:
+        worlds[0].satisfies_context(context, X, None)
+
+    assert [w.satisfies_context(context, X, attribute_interpretation)
+            for w in worlds] == [False, False, True, True]
+
+    attribute_interpretation, pm, world = get_partial_world()
+    X = VariableAssignment(pm._vocabulary, world._attribute_system,
+                           {}, dummy=True)
+    context = Context(AssumptionBase(pm), world.get_named_state())
+    with pytest.raises(ValueError) as excinfo:
+        world.satisfies_context(context, X, attribute_interpretation)
@@ -14,6 +14,7 @@ object if the object uses a non-standard form of equality,
 
 from copy import deepcopy
 from functools import total_ordering
+from weakref import WeakValueDictionary
 from interval import Interval
 
 
@@ -29,13 +30,22 @@ class ValueSet(object):
 
     :cvar _base_types: The literal types supported by the ValueSet class.
     :cvar _object_types: The object types supported by the ValueSet class.
+    :cvar _float_diff: The gap left between the pieces of a ``float`` \
+    Interval split by the ``-`` operator.
     :ivar values: The values contained in the ValueSet object.
+    :ivar _type_lists: The values contained in the ValueSet object \
+    partitioned by type (see ``_split_by_types``), in the same order as \
+    ``values``.
+    :ivar _index: A lazily built mapping from each group of mutually \
+    comparable types (see ``_get_index_key``) to a ``frozenset`` of the \
+    values of those types in the ValueSet object; ``None`` until first used.
     :ivar _is_ValueSet: An identifier to use in place of ``type`` or \
     ``isinstance``.
     """
 
     _base_types = [int, float, long, str, bool]
     _object_types = ["_is_Interval", "_is_Point", "_is_LineSegment"]
+    _float_diff = 0.00000000001
 
     @classmethod
     def add_object_type(cls, object_identifier):
@@ -77,7 +87,9 @@ class ValueSet(object):
         if not isinstance(valueset, list) and not isinstance(valueset, set):
             raise TypeError("valueset parameter must be of type list or set")
         # Save parsed output
-        self._values = ValueSet._parse(valueset)
+        self._type_lists = ValueSet._parse_by_types(valueset)
+        self._values = ValueSet._join_types(self._type_lists)
+        self._index = None
         self._is_ValueSet = True
 
     def __eq__(self, other):
@@ -85,9 +97,7 @@ class ValueSet(object):
         Determine if two ValueSet objects are equal via the ``==`` operator.
         """
 
-        union = set(self._values) | set(other._values)
-        intersection = set(self._values) & set(other._values)
-        return union == intersection
+        return self._get_index() == other._get_index()
 
     def __le__(self, other):
         """
@@ -96,8 +106,8 @@ class ValueSet(object):
         ``other`` parameter.
         """
 
-        self_dict = ValueSet._split_by_types(self)
-        other_dict = ValueSet._split_by_types(other)
+        self_dict = self._type_lists
+        other_dict = other._type_lists
 
         # filter out ints, floats, or longs contained in any Interval in other
         filtered_self_values = []
@@ -137,10 +147,12 @@ class ValueSet(object):
         if len(new_self_values) > len(other._values):
             return False
 
-        # if the intersection of both ValueSets is the same as this ValueSet
-        # then this ValueSet is contained in other and is a subset.
-        intersection = set(new_self_values) & set(other._values)
-        return intersection == set(new_self_values)
+        # if every remaining value is in other then this ValueSet is
+        # contained in other and is a subset.
+        for value in new_self_values:
+            if value not in other:
+                return False
+        return True
 
     def __ne__(self, other):
         """
@@ -164,9 +176,7 @@ class ValueSet(object):
             other_values = [v for v in iter(other)]
             return ValueSet(self._values + other_values)
         else:
-            new_values = self._values
-            new_values.append(other)
-            return ValueSet(new_values)
+            return ValueSet(self._values + [other])
 
     def __iadd__(self, other):
         """
@@ -183,250 +193,90 @@ class ValueSet(object):
         the set-theoretic difference.
         """
 
-        def resolve_intervals(intervals, other_type_lists):
+        def subtract_numerics(intervals, values, removals, diff):
             """
-            Break intervals up according to corresponding types of
-            non-iterables (int, long, float) in other.
+            Remove the sorted, disjoint ``(infimum, supremum)`` pairs in
+            ``removals`` from the sorted, disjoint Intervals and values of a
+            single numeric type in one sweep. Use differential diff provided
+            when splitting intervals.
             """
 
-            def resolve_interval_interval(self, other, self_danglers,
-                                          other_danglers, diff):
-                """
-                Break down a set of intervals according to another set of
-                intervals.
-                Use differential diff provided when splitting intervals.
-                """
-
-                for i, self_interval in enumerate(self):
-                    for j, other_interval in enumerate(other):
-
-                        other_inf = other_interval[0]
-                        other_sup = other_interval[1]
-                        self_inf = self_interval[0]
-                        self_sup = self_interval[1]
-
-                        if other_interval <= self_interval:
-                            # split both,removing overlap
-                            try:
-                                new_self = Interval(other_sup + diff, self_sup)
-                                self.append(new_self)
-                            except ValueError:
-                                self_danglers.append(self_sup)
-                            try:
-                                new_other = Interval(other_inf,
-                                                     self_inf - diff)
-                                other.append(new_other)
-                            except ValueError:
-                                other_danglers.append(other_inf)
-                            del self[i]
-                            del other[j]
-                            return True
-                        elif self_interval <= other_interval:
-                            # split both, removing overlap
-                            try:
-                                new_self = Interval(self_inf, other_inf - diff)
-                                self.append(new_self)
-                            except ValueError:
-                                self_danglers.append(self_inf)
-                            try:
-                                new_other = Interval(self_sup + diff,
-                                                     other_sup)
-                                other.append(new_other)
-                            except ValueError:
-                                other_danglers.append(other_sup)
-                            del self[i]
-                            del other[j]
-                            return True
-                        elif other_interval in self_interval:
-                            # split self_interval and destroy other, this is
-                            # the only case where we don't keep danglers
-                            try:
-                                new_l_self = Interval(self_inf,
-                                                      other_inf - diff)
-                                self.append(new_l_self)
-                            except ValueError:
-                                if self_inf == other_inf - diff:
-                                    self_danglers.append(self_inf)
-                            try:
-                                new_h_self = Interval(other_sup + diff,
-                                                      self_sup)
-                                self.append(new_h_self)
-                            except ValueError:
-                                if other_sup + diff == self_sup:
-                                    self_danglers.append(self_sup)
-                            del self[i]
-                            del other[j]
-                            return True
-
-                return False
-
-            def resolve_interval_singletons(self, other, danglers, diff):
-                """
-                Break down a set of intervals according to a set of singletons.
-                Use differential diff provided when splitting intervals.
-                """
-
-                for i, self_interval in enumerate(self):
-                    for j, other_signleton in enumerate(other):
-
-                        self_inf = self_interval[0]
-                        self_sup = self_interval[1]
-
-                        if other_signleton in self_interval:
-                            if other_signleton == self_inf:
-                                try:
-                                    new_self = Interval(self_inf + diff,
-                                                        self_sup)
-                                    self.append(new_self)
-                                except ValueError:
-                                    danglers.append(self_sup)
-                                del self[i]
-                                del other[j]
-                                return True
-                            elif other_signleton == self_sup:
-                                try:
-                                    new_self = Interval(self_inf,
-                                                        self_sup - diff)
-                                    self.append(new_self)
-                                except ValueError:
-                                    danglers.append(self_inf)
-                                del self[i]
-                                del other[j]
-                                return True
-                            else:
-                                try:
-                                    new_l_self = Interval(
-                                        self_inf, other_signleton - diff)
-                                    self.append(new_l_self)
-                                except ValueError:
-                                    danglers.append(self_inf)
-                                try:
-                                    new_h_self = Interval(
-                                        other_signleton + diff, self_sup)
-                                    self.append(new_h_self)
-                                except ValueError:
-                                    danglers.append(self_sup)
-                                del self[i]
-                                del other[j]
-                                return True
+            output = []
+
+            def add_piece(inf, sup):
+                """Add what is left of an Interval between inf and sup."""
+                if inf < sup:
+                    output.append(Interval(inf, sup))
+                else:
+                    output.append(inf)
+
+            # break every interval at the removals overlapping it; removals
+            # entirely below the current interval are never visited again
+            start = 0
+            for interval in intervals:
+                inf, sup = interval[0], interval[1]
+                while start < len(removals) and removals[start][1] < inf:
+                    start += 1
+
+                index, remaining = start, True
+                while index < len(removals) and removals[index][0] <= sup:
+                    removal_inf, removal_sup = removals[index]
+                    index += 1
+                    if removal_sup < inf:
+                        continue
+                    if inf < removal_inf:
+                        add_piece(inf, max(inf, removal_inf - diff))
+                    if sup <= removal_sup:
+                        remaining = False
+                        break
+                    inf = max(inf, min(removal_sup + diff, sup))
+                if remaining:
+                    add_piece(inf, sup)
+
+            # keep the values not covered by any removal
+            start = 0
+            for value in values:
+                while start < len(removals) and removals[start][1] < value:
+                    start += 1
+                if start == len(removals) or value < removals[start][0]:
+                    output.append(value)
+
+            return output
+
+        self_type_lists = self._type_lists
+        other_type_lists = other._type_lists
 
-                return False
+        output_set = []
 
-            self_danglers, other_danglers = [], []
-
-            if intervals:
-                # Split intervals by types
-                int_Intervals = [i for i in intervals if i._type is int]
-                long_Intervals = [i for i in intervals if i._type is long]
-                float_Intervals = [i for i in intervals if i._type is float]
-
-                # Split other type list into numerics and intervals
-                other_ints = other_type_lists[int]
-                other_longs = other_type_lists[long]
-                other_floats = other_type_lists[float]
-                other_intervals = other_type_lists["_is_Interval"]
-                other_int_Intervals = [
-                    i for i in other_intervals if i._type is int]
-                other_long_Intervals = [
-                    i for i in other_intervals if i._type is long]
-                other_float_Intervals = [
-                    i for i in other_intervals if i._type is float]
-
-                # Note: at this point, all intervals are guarenteed to be
-                # disjoint from collapse_intervals.
-
-                # Break intervals apart until its impossible to keep breaking
-                # them, then remove any singletons
-                if int_Intervals:
-                    while resolve_interval_interval(int_Intervals,
-                                                    other_int_Intervals,
-                                                    self_danglers,
-                                                    other_danglers,
-                                                    diff=1):
-                            pass
-
-                    # push dangling ints in other into other_ints, then reset
-                    # other_danglers
-                    other_ints.extend(other_danglers)
-                    other_danglers = []
-
-                    while resolve_interval_singletons(
-                            int_Intervals, other_ints, self_danglers, diff=1):
-                            pass
-
-                if long_Intervals:
-                    while resolve_interval_interval(long_Intervals,
-                                                    other_long_Intervals,
-                                                    self_danglers,
-                                                    other_danglers,
-                                                    diff=1L):
-                            pass
-
-                    # push dangling longs in other into other_longs, then reset
-                    # other_danglers
-                    other_longs.extend(other_danglers)
-                    other_danglers = []
-
-                    while resolve_interval_singletons(long_Intervals,
-                                                      other_longs,
-                                                      self_danglers,
-                                                      diff=1L):
-                            pass
-
-                f_min = 0.00000000001
-                if float_Intervals:
-                    while resolve_interval_interval(float_Intervals,
-                                                    other_float_Intervals,
-                                                    self_danglers,
-                                                    other_danglers,
-                                                    diff=f_min):
-                            pass
-
-                    # push dangling floats in other into other_floats, then
-                    # reset other_danglers
-                    other_floats.extend(other_danglers)
-                    other_danglers = []
-
-                    while resolve_interval_singletons(float_Intervals,
-                                                      other_floats,
-                                                      self_danglers,
-                                                      diff=f_min):
-                            pass
-
-                intervals = int_Intervals + long_Intervals + float_Intervals
-
-                return intervals, self_danglers
-            else:
-                return intervals, self_danglers
+        # numeric values are removed by equal values and by Intervals of their
+        # type in other, and their Intervals are broken by both
+        numeric_types = [
+            (int, 1), (long, 1L), (float, ValueSet._float_diff)]
+        for numeric_type, diff in numeric_types:
+            intervals = [
+                i for i in self_type_lists.get("_is_Interval", [])
+                if i._type is numeric_type]
+            values = sorted(self_type_lists.get(numeric_type, []))
+            if not intervals and not values:
+                continue
 
-        # Split the members of ValueSet's into lists defined by their
-        # respective types
-        self_type_lists = ValueSet._split_by_types(self._values)
-        other_type_lists = ValueSet._split_by_types(other._values)
+            removals = [
+                (i[0], i[1]) for i in other_type_lists.get("_is_Interval", [])
+                if i._type is numeric_type]
+            removals += [
+                (value, value)
+                for value in other_type_lists.get(numeric_type, [])]
+            removals.sort()
 
-        from collections import defaultdict
-        std_type_lists = defaultdict(list)
+            output_set += subtract_numerics(
+                sorted(intervals, key=lambda i: i[0]), values, removals, diff)
 
+        # every other value is only removed by an equal value in other
         for type_key, values in self_type_lists.iteritems():
-            try:
-                other_values = other_type_lists[type_key]
-                diff = set(values) - set(other_values)
-                std_type_lists[type_key] = diff
-            except KeyError:
-                std_type_lists[type_key] = values
-
-        output_set = []
-
-        # Break intervals if necessary and add any danglers to output_set
-        std_type_lists["_is_Interval"], danglers = resolve_intervals(
-            std_type_lists["_is_Interval"], other_type_lists)
-        output_set.extend(danglers)
-
-        # reconstruct list, sorting when possible
-        for base_type in ValueSet._base_types:
-            output_set += sorted(std_type_lists[base_type])
-        for object_type in ValueSet._object_types:
-            output_set += std_type_lists[object_type]
+            if type_key in [int, long, float, "_is_Interval"]:
+                continue
+            other_values = set(other_type_lists.get(type_key, []))
+            output_set += [v for v in values if v not in other_values]
 
         return ValueSet(output_set)
 
@@ -460,6 +310,13 @@ class ValueSet(object):
         object.
         """
 
+        try:
+            index_key = ValueSet._get_index_key(ValueSet._get_type_key(key))
+            return key in self._get_index().get(index_key, ())
+        except (AttributeError, TypeError):
+            pass
+
+        # fall back to a linear scan for keys the index cannot hold
         for value in self:
             try:
                 is_equal = key == value
@@ -516,6 +373,7 @@ class ValueSet(object):
             # if simple type, replace item at index with value
             if type(value) in ValueSet._base_types:
                 self._values[key] = value
+                self._reindex()
                 return
 
             # not simple type, check if it's a valid object type
@@ -529,6 +387,7 @@ class ValueSet(object):
                     identifier = object_identifier
             if identifier:
                 self._values[key] = value
+                self._reindex()
                 return
 
             # not a valid base type or object type
@@ -563,6 +422,112 @@ class ValueSet(object):
         """Return a string representation of the ValueSet object."""
         return self.__str__()
 
+    def discretize(self):
+        """
+        Return the values of the calling ValueSet object with every Interval
+        replaced by its discrete values (see ``Interval.discretize``).
+
+        :return: The discrete values of the calling ValueSet object; the \
+        lazy DiscreteRange of its Interval if it holds a single Interval so \
+        that large Intervals are never materialized, a ``list`` otherwise.
+        :rtype: ``list`` | DiscreteRange
+        """
+
+        if len(self._values) == 1 and hasattr(self._values[0], "_is_Interval"):
+            return self._values[0].discretize()
+
+        discrete_values = []
+        for value in self._values:
+            if hasattr(value, "_is_Interval"):
+                discrete_values.extend(value.discretize())
+            else:
+                discrete_values.append(value)
+
+        return discrete_values
+
+    def _reindex(self):
+        """
+        Rebuild ``_type_lists`` from ``_values`` and drop ``_index`` after the
+        values of the calling ValueSet object have been changed in place.
+        """
+
+        self._type_lists = ValueSet._split_by_types(self._values)
+        self._index = None
+
+    def _get_index(self):
+        """
+        Return the index of the calling ValueSet object, building it on first
+        use; the index maps each group of mutually comparable types to a
+        ``frozenset`` of the values of those types, so two ValueSet objects
+        are equal exactly when their indices are.
+
+        :return: The index of the calling ValueSet object.
+        :rtype: ``dict``
+        """
+
+        if self._index is None:
+            groups = {}
+            for type_key, values in self._type_lists.iteritems():
+                if values:
+                    index_key = ValueSet._get_index_key(type_key)
+                    groups.setdefault(index_key, []).extend(values)
+            self._index = dict(
+                (index_key, frozenset(values))
+                for index_key, values in groups.iteritems())
+
+        return self._index
+
+    @staticmethod
+    def _get_type_key(value):
+        """
+        Return the key of the type of the value in the ``value`` parameter
+        used to partition values, i.e., its type if it is one of
+        ``ValueSet._base_types`` or its identifier in
+        ``ValueSet._object_types`` otherwise.
+
+        :return: The type of ``value`` or its object identifier.
+        :rtype: ``type`` | ``str``
+
+        :raises AttributeError: Only objects contianing a single identifier \
+        in ``_object_types`` are supported.
+        :raises TypeError: ``value`` parameter must be of a supported type.
+        """
+
+        if type(value) in ValueSet._base_types:
+            return type(value)
+
+        identifier = None
+        for object_identifier in ValueSet._object_types:
+            if hasattr(value, object_identifier):
+                # Ensure no object has 2 identifiers
+                if identifier:
+                    raise AttributeError(
+                        "Any object passed must have only 1 "
+                        "supported identifier")
+                identifier = object_identifier
+
+        if not identifier:
+            raise TypeError(str(type(value)) + " not supported")
+
+        return identifier
+
+    @staticmethod
+    def _get_index_key(type_key):
+        """
+        Return the key of the group of types the type key in the
+        ``type_key`` parameter is indexed under; ``int``, ``long``, ``float``
+        and ``bool`` values compare equal to one another (e.g.
+        ``1 == 1.0 == True``) so they share a group, every other type is its
+        own group.
+
+        :return: ``int`` for the numeric types, ``type_key`` otherwise.
+        :rtype: ``type`` | ``str``
+        """
+
+        if type_key in [int, long, float, bool]:
+            return int
+        return type_key
+
     @staticmethod
     def _split_by_types(values):
         """
@@ -584,40 +549,53 @@ class ValueSet(object):
         :raises TypeError: An invalid type exists in the iterable object.
         """
 
-        # initialize a dictionary to separate types
+        # initialize a dictionary to separate types and a set of the values
+        # seen so far for each type to reject duplicates in constant time
         from collections import defaultdict
         type_lists = defaultdict(list)
+        seen = defaultdict(set)
 
-        # for each value provided
+        # store each value in its corresponding list if it's not a duplicate
         for value in values:
-            # if it's a base type, simply add to it's corresponding list
-            # while rejecting duplicates.
-            if type(value) in ValueSet._base_types:
-                if value not in type_lists[type(value)]:
-                    type_lists[type(value)].append(value)
-                continue
+            type_key = ValueSet._get_type_key(value)
+            try:
+                if value in seen[type_key]:
+                    continue
+                seen[type_key].add(value)
+            except TypeError:
+                # unhashable objects fall back to a scan of their list
+                if value in type_lists[type_key]:
+                    continue
+            type_lists[type_key].append(value)
 
-            # if it's an object type, check to see if it is in supported
-            # object types
-            identifier = None
-            for object_identifier in ValueSet._object_types:
-                if hasattr(value, object_identifier):
-                    # Ensure no object has 2 identifiers
-                    if identifier:
-                        raise AttributeError(
-                            "Any object passed must have only 1 "
-                            "supported identifier")
-                    identifier = object_identifier
+        return type_lists
 
-            # store object in its corresponding list if it's not a duplicate
-            if identifier:
-                if value not in type_lists[identifier]:
-                    type_lists[identifier].append(value)
-            else:
-                raise TypeError(
-                    str(type(value)) + " not supported")
+    @staticmethod
+    def _normalize_intervals(type_lists):
+        """
+        Normalize the numeric values of a partition of values by type (see
+        ``_split_by_types``) in place; overlapping Intervals are merged,
+        as are ``int`` and ``long`` Intervals adjacent to one another, and
+        ``int``\s, ``long``\s and ``float``\s contained in or (for ``int``
+        and ``long``) adjacent to an Interval of their type are absorbed
+        into it.
 
-        return type_lists
+        :param type_lists: The partition of values to normalize.
+        :type  type_lists: ``defaultdict(list)``
+        """
+
+        intervals = []
+        for numeric_type, diff in [(int, 1), (float, 0.0), (long, 1L)]:
+            typed_intervals = [
+                i for i in type_lists["_is_Interval"]
+                if i._type == numeric_type]
+            if not typed_intervals:
+                continue
+            merged, type_lists[numeric_type] = Interval._sweep(
+                typed_intervals, type_lists[numeric_type], diff)
+            intervals += merged
+
+        type_lists["_is_Interval"] = intervals
 
     @staticmethod
     def _parse(values):
@@ -634,99 +612,213 @@ class ValueSet(object):
         ``set``.
         """
 
-        def _extend_intervals(type_lists):
-            """
-            If int or long is just beyond infirmum or supremum, extend the
-            interval.
-            """
+        return ValueSet._join_types(ValueSet._parse_by_types(values))
 
-            for i in type_lists[int]:
-                for index, interval in enumerate(type_lists["_is_Interval"]):
-                    if interval._type == int:
-                        if i == interval[0] - 1:
-                            type_lists["_is_Interval"][index] = Interval(i, interval[1])
-                            type_lists[int].remove(i)
-                            return True
-                        if i == interval[1] + 1:
-                            type_lists["_is_Interval"][index] = Interval(interval[0], i)
-                            type_lists[int].remove(i)
-                            return True
-
-            for i in type_lists[long]:
-                for index, interval in enumerate(type_lists["_is_Interval"]):
-                    if interval._type == long:
-                        if i == interval[0] - 1:
-                            type_lists["_is_Interval"][index] = Interval(i, interval[1])
-                            type_lists[long].remove(i)
-                            return True
-                        if i == interval[1] + 1:
-                            type_lists["_is_Interval"][index] = Interval(interval[0], i)
-                            type_lists[long].remove(i)
-                            return True
-            return False
+    @staticmethod
+    def _join_types(type_lists):
+        """
+        Join the lists of a partition of values by type (see
+        ``_split_by_types``) into a single ``list``; base types come first,
+        in the order of ``ValueSet._base_types``, followed by object types,
+        in the order of ``ValueSet._object_types``.
+
+        :return: The values of every list in ``type_lists``.
+        :rtype: ``list``
+        """
+
+        output_set = []
+        for base_type in ValueSet._base_types:
+            output_set += type_lists.get(base_type, [])
+        for object_type in ValueSet._object_types:
+            output_set += type_lists.get(object_type, [])
 
-        def _filter_numerics(type_lists):
-            """Filter out numeric values subsumed by some Interval."""
-            # filter out the ints, floats, and longs, subsumed by some Interval
-            bad_ints, bad_floats, bad_longs = [], [], []
-            for i in type_lists[int]:
-                for interval in type_lists["_is_Interval"]:
-                    if interval._type == int:
-                        if i in interval:
-                            if i not in bad_ints:
-                                bad_ints.append(i)
-
-            for f in type_lists[float]:
-                for interval in type_lists["_is_Interval"]:
-                    if interval._type == float:
-                        if f in interval:
-                            if f not in bad_floats:
-                                bad_floats.append(f)
-
-            for l in type_lists[long]:
-                for interval in type_lists["_is_Interval"]:
-                    if interval._type == long:
-                        if l in interval:
-                            if l not in bad_longs:
-                                bad_longs.append(l)
-
-            for bi in bad_ints:
-                type_lists[int].remove(bi)
-
-            for bf in bad_floats:
-                type_lists[float].remove(bf)
-
-            for bl in bad_longs:
-                type_lists[long].remove(bl)
+        return output_set
+
+    @staticmethod
+    def _parse_by_types(values):
+        """
+        Parse a ``list`` into the standard format used by ValueSet objects
+        (see ``_parse``) and return the parsed values partitioned by type
+        (see ``_split_by_types``), with the lists of base types sorted.
+
+        :return: Filtered values in the ValueSet standard format, split by \
+        type.
+        :rtype: ``defaultdict(list)``
+
+        :raises TypeError: ``values`` parameter must be either a ``list`` or \
+        ``set``.
+        """
 
         # only accept sets and lists for valueset parameter
         if not isinstance(values, list) and not isinstance(values, set):
             raise TypeError("values paramter must be a list or set")
 
-        # make copy of input before processing
-        input_set = deepcopy(values)
-
-        # convert set to list
-        if isinstance(input_set, set):
-            input_set = list(input_set)
-
         type_lists = ValueSet._split_by_types(values)
 
         # If intervals are within this valueset
         if type_lists["_is_Interval"]:
-            type_lists["_is_Interval"] = Interval.collapse_intervals(
-                type_lists["_is_Interval"])
-            while _extend_intervals(type_lists): pass
-            _filter_numerics(type_lists)
+            ValueSet._normalize_intervals(type_lists)
 
-        output_set = []
-        # reconstruct list, sorting when possible
+        # sort base types when possible
         for base_type in ValueSet._base_types:
-            output_set += sorted(type_lists[base_type])
-        for object_type in ValueSet._object_types:
-            output_set += type_lists[object_type]
+            if base_type in type_lists:
+                type_lists[base_type].sort()
 
-        return output_set
+        return type_lists
+
+
+class FrozenValueSet(ValueSet):
+    """
+    FrozenValueSet class.
+
+    An immutable, hashable ValueSet. FrozenValueSet objects are interned by
+    content, so constructing a FrozenValueSet with the same values as a live
+    FrozenValueSet returns that object, and copying one returns it as is;
+    this lets States share the values of their ascriptions.
+
+    :cvar _interned: The live FrozenValueSet objects keyed by their content.
+    :ivar _content_key: The key the FrozenValueSet object is interned under \
+    (see ``_get_content_key``).
+    :ivar _discretized: The memoized result of ``discretize``; ``None`` \
+    until first used.
+    :ivar _hash: The hash of the FrozenValueSet object; ``None`` until first \
+    used.
+    :ivar _is_FrozenValueSet: An identifier to use in place of ``type`` or \
+    ``isinstance``.
+    """
+
+    _interned = WeakValueDictionary()
+
+    def __new__(cls, valueset):
+        """
+        Construct a FrozenValueSet object or return the live FrozenValueSet
+        object with the same values.
+
+        :param valueset: The values to place in the FrozenValueSet object. \
+        These values are passed through the ``_parse`` function before being \
+        stored.
+        :type  valueset: list|set|ValueSet
+
+        :raises TypeError: ``valueset`` parameter must be a ``list``, \
+        ``set`` or ValueSet object.
+        """
+
+        if hasattr(valueset, "_is_FrozenValueSet"):
+            return valueset
+        if hasattr(valueset, "_is_ValueSet"):
+            valueset = list(valueset._values)
+
+        self = super(FrozenValueSet, cls).__new__(cls)
+        ValueSet.__init__(self, valueset)
+        self._hash = None
+        self._discretized = None
+        self._content_key = self._get_content_key()
+        self._is_FrozenValueSet = True
+
+        return cls._interned.setdefault(self._content_key, self)
+
+    def __init__(self, valueset):
+        """
+        Do nothing; FrozenValueSet objects are fully constructed by
+        ``__new__``.
+        """
+
+        pass
+
+    def __lt__(self, other):
+        """
+        Overloaded ``<`` operator for FrozenValueSet. Determine if the calling
+        FrozenValueSet object is a strict subset of the ValueSet object in
+        ``other`` parameter.
+        """
+
+        return ValueSet.__le__(self, other) and self != other
+
+    def __ge__(self, other):
+        """
+        Overloaded ``>=`` operator for FrozenValueSet. Determine if the
+        calling FrozenValueSet object is a superset of the ValueSet object in
+        ``other`` parameter; as FrozenValueSet subclasses ValueSet, Python
+        also calls this for ``ValueSet <= FrozenValueSet``.
+        """
+
+        return ValueSet.__le__(other, self)
+
+    def __gt__(self, other):
+        """
+        Overloaded ``>`` operator for FrozenValueSet. Determine if the calling
+        FrozenValueSet object is a strict superset of the ValueSet object in
+        ``other`` parameter; as FrozenValueSet subclasses ValueSet, Python
+        also calls this for ``ValueSet < FrozenValueSet``.
+        """
+
+        return ValueSet.__le__(other, self) and self != other
+
+    def __hash__(self):
+        """Hash implementation for set functionality of FrozenValueSet."""
+        if self._hash is None:
+            self._hash = hash(frozenset(self._values))
+        return self._hash
+
+    def __setitem__(self, key, value):
+        """
+        Prevent item assignment on a FrozenValueSet object.
+
+        :raises TypeError: FrozenValueSet objects are immutable.
+        """
+
+        raise TypeError("FrozenValueSet objects are immutable")
+
+    def __copy__(self):
+        """
+        Copy a FrozenValueSet object via the ``copy.copy`` method; as
+        FrozenValueSet objects are immutable, the object itself is returned.
+        """
+
+        return self
+
+    def __deepcopy__(self, memo):
+        """
+        Deepcopy a FrozenValueSet object via the ``copy.deepcopy`` method; as
+        FrozenValueSet objects are immutable, the object itself is returned.
+        """
+
+        return self
+
+    def __reduce__(self):
+        """
+        Return the arguments to reconstruct a FrozenValueSet object with for
+        pickling; unpickled objects are interned again.
+        """
+
+        return (FrozenValueSet, (list(self._values),))
+
+    def discretize(self):
+        """
+        Return the values of the calling FrozenValueSet object with every
+        Interval replaced by its discrete values (see
+        ``ValueSet.discretize``); the result is memoized and shared, so it
+        must not be modified.
+
+        :return: The discrete values of the calling FrozenValueSet object.
+        :rtype: ``list`` | DiscreteRange
+        """
+
+        if self._discretized is None:
+            self._discretized = ValueSet.discretize(self)
+        return self._discretized
+
+    def _get_content_key(self):
+        """
+        Return the key the calling FrozenValueSet object is interned under;
+        unlike equality, it tells apart values of different types that
+        compare equal (e.g. ``1`` and ``1.0``).
+
+        :return: The types and values in the calling FrozenValueSet object.
+        :rtype: ``frozenset``
+        """
+
+        return frozenset((type(value), value) for value in self._values)
 
 
 def main():
@@ -0,0 +1,329 @@
+"""This section introduces the World class."""
+
+
+class World(object):
+    """
+    World class. A World object is a lightweight view of a world
+    :math:`(w;\widehat{\\rho})` derivable from some NamedState object
+    :math:`(\sigma;\\rho)`. Rather than holding its own ascriptions, a World
+    object holds a tuple of indices into the discretized values of each
+    attribute-object pair of :math:`(\sigma;\\rho)`; the AttributeSystem
+    object, the ConstantAssignment object and the discretized values are
+    shared (by reference) by every World object derived from the same
+    NamedState object. World objects are immutable.
+
+    :ivar attribute_system: A reference to the AttributeSystem object \
+    :math:`\mathcal{S}` of the NamedState the World object comes from.
+    :ivar p: A reference to the (total) ConstantAssignment object \
+    :math:`\widehat{\\rho}` of the World object.
+    :ivar positions: A reference to the mapping from the attribute-object \
+    pairs of the NamedState the World object comes from to their position \
+    in ``valuations`` and ``indices``.
+    :ivar valuations: A reference to the discretized values of each \
+    attribute-object pair.
+    :ivar indices: The index of the value of each attribute-object pair \
+    in the World object.
+    :ivar _is_World: An identifier to use in place of ``type`` or \
+    ``isinstance``.
+    """
+
+    def __init__(self, attribute_system, p, positions, valuations, indices):
+        """
+        Construct a World object.
+
+        :param attribute_system: The AttributeSystem object \
+        :math:`\mathcal{S}` the World object comes from.
+        :type  attribute_system: AttributeSystem
+        :param p: The ConstantAssignment object :math:`\widehat{\\rho}` of \
+        the World object.
+        :type  p: ConstantAssignment
+        :param positions: A mapping from each attribute-object pair to the \
+        position of its discretized values in ``valuations``.
+        :type  positions: ``dict``
+        :param valuations: A list of lists of discretized values; one for \
+        each attribute-object pair in ``positions``.
+        :type  valuations: ``list``
+        :param indices: The index of the value of each attribute-object pair \
+        in ``valuations``.
+        :type  indices: ``tuple``
+
+        :raises ValueError: ``positions``, ``valuations`` and ``indices`` \
+        parameters must all be of the same length.
+        """
+
+        if not len(positions) == len(valuations) == len(indices):
+            raise ValueError(
+                "positions, valuations and indices must be of the same length")
+
+        self._attribute_system = attribute_system
+        self._p = p
+        self._positions = positions
+        self._valuations = valuations
+        self._indices = indices
+        self._is_World = True
+
+    def __getitem__(self, key):
+        """
+        Retrieve the value of the attribute-object pair given by the ``key``
+        parameter in the calling World object via indexing
+        (e.g. ``World[key]``).
+
+        :param key: The attribute-object pair to use for retrieval.
+        :type  key: ``tuple``
+
+        :raises KeyError: ``key`` parameter must be an attribute-object pair \
+        of the calling World object.
+        """
+
+        try:
+            position = self._positions[key]
+        except KeyError:
+            raise KeyError(str(key) + " not a valid key.")
+
+        return self._valuations[position][self._indices[position]]
+
+    def __str__(self):
+        """Return a readable string representation of the World object."""
+        world_str = ''
+        for ao_pair in sorted(self._positions.keys()):
+            world_str += ao_pair[0] + "(" + ao_pair[1] + "): {"
+            world_str += str(self[ao_pair]) + "}\n"
+        return world_str + str(self._p)
+
+    def __repr__(self):
+        """Return a string representation of the World object."""
+        return self.__str__()
+
+    def is_world(self):
+        """
+        Determine if the calling World object is a world, i.e., if its
+        ConstantAssignment :math:`\widehat{\\rho}` is total; every
+        attribute-object pair of a World object holds a single value, but
+        :math:`\widehat{\\rho}` cannot be total when there are more
+        constants than objects.
+
+        :return: Whether or not the calling World object is a world.
+        :rtype: ``bool``
+        """
+
+        return self._p.is_total()
+
+    def get_worlds(self):
+        """
+        Return a generator for the generation of all possible worlds derivable
+        from the calling World object, i.e., the calling World object itself.
+
+        :return: A generator yielding the calling World object.
+        :rtype: ``generator``
+        """
+
+        yield self
+
+    def get_projected_valuations(self, basis, spread=False):
+        """
+        Return a generator for the generation of every distinct valuation of
+        the attribute-object pairs in the ``basis`` parameter derivable from
+        the calling World object, i.e., the single valuation of ``basis`` in
+        the calling World object.
+
+        :param basis: The attribute-object pairs to project onto.
+        :type  basis: ``list``
+        :param spread: Unused; there is only one valuation to generate.
+        :type  spread: ``bool``
+
+        :return: A generator yielding a tuple of values; the i-th value of \
+        the tuple is the value of the i-th attribute-object pair in ``basis``.
+        :rtype: ``generator``
+
+        :raises KeyError: Every attribute-object pair in ``basis`` must be in \
+        the calling World object.
+        """
+
+        yield tuple(self[ao_pair] for ao_pair in basis)
+
+    def get_fingerprint(self, ao_pairs):
+        """
+        Return a hashable fingerprint of the values of the attribute-object
+        pairs in the ``ao_pairs`` parameter in the calling World object; the
+        fingerprint matches that of a State object ascribing the single
+        element ValueSet of each of these values (see
+        ``State.get_fingerprint``).
+
+        :param ao_pairs: The attribute-object pairs to fingerprint.
+        :type  ao_pairs: ``list``
+
+        :return: A tuple holding a 1-tuple of a (type, value) pair for each \
+        attribute-object pair in ``ao_pairs``.
+        :rtype: ``tuple``
+
+        :raises KeyError: Every attribute-object pair in ``ao_pairs`` must be \
+        in the calling World object.
+        """
+
+        fingerprint = []
+        for ao_pair in ao_pairs:
+            value = self[ao_pair]
+            fingerprint.append(((type(value), value),))
+        return tuple(fingerprint)
+
+    def get_named_state(self):
+        """
+        Construct the full NamedState object :math:`(w;\widehat{\\rho})`
+        represented by the calling World object.
+
+        :return: The NamedState object represented by the calling World \
+        object.
+        :rtype: NamedState
+        """
+
+        from named_state import NamedState
+
+        ascriptions = {}
+        for ao_pair, position in self._positions.iteritems():
+            value = self._valuations[position][self._indices[position]]
+            ascriptions[ao_pair] = [value]
+
+        return NamedState(self._attribute_system, self._p, ascriptions)
+
+    def _generate_variable_assignments(self):
+        """
+        Generate all possible VariableAssignment objects :math:`\chi` derivable
+        from the calling World object; see
+        ``NamedState._generate_variable_assignments``.
+
+        :return: A generator for all derivable VariableAssignment objects \
+        :math:`\chi`.
+        :rtype: ``generator``
+        """
+
+        from named_state import NamedState
+        return NamedState._generate_variable_assignments.__func__(self)
+
+    def satisfies_formula(self, formula, X, attribute_interpretation):
+        """
+        Determine if the calling World object :math:`(w;\widehat{\\rho})`
+        satisfies the given Formula object :math:`F` in the ``formula``
+        parameter w.r.t. the VariableAssignment object :math:`\chi` in the
+        ``X`` parameter and given AttributeInterpretation :math:`I` in the
+        ``attribute_interpretation`` parameter, i.e.,
+        :math:`(w;\widehat{\\rho})\models_{\chi} F`.
+
+        :return: Whether or not :math:`(w;\widehat{\\rho})\models_{\chi}F`.
+        :rtype: ``bool``
+
+        :raises TypeError: ``formula`` parameter must be a Formula object, \
+        ``X`` parameter must be a VariableAssignment object and \
+        ``attribute_interpretation`` parameter must be an \
+        AttributeInterpretation object.
+        :raises ValueError: The calling World object must be a world.
+        """
+
+        if not hasattr(formula, "_is_Formula"):
+            raise TypeError(
+                'formula parameter must be of type Formula')
+
+        if not hasattr(X, "_is_VariableAssignment"):
+            raise TypeError(
+                'X parameter must be a VariableAssignment object')
+
+        if not hasattr(attribute_interpretation,
+                       "_is_AttributeInterpretation"):
+            raise TypeError(
+                "attribute_interpretation parameter must be of type "
+                "AttributeInterpretation")
+
+        if not self.is_world():
+            raise ValueError('this World object must be a world')
+
+        truth_value = formula.assign_truth_value(
+            attribute_interpretation, self, X)
+
+        return truth_value is True
+
+    def satisfies_named_state(self, named_state):
+        """
+        Determine if the calling World object :math:`(w;\widehat{\\rho})`
+        satisfies the given NamedState object :math:`(\sigma;\\rho)`, i.e.,
+        :math:`(w;\widehat{\\rho}) \models (\sigma;\\rho)`.
+
+        :return: Whether or not :math:`(w;\widehat{\\rho}) \models \
+        (\sigma;\\rho)`.
+        :rtype: ``bool``
+
+        :raises TypeError: ``named_state`` parameter must be a NamedState \
+        object.
+        :raises ValueError: The calling World object must be a world.
+        """
+
+        if not hasattr(named_state, "_is_NamedState"):
+            raise TypeError(
+                "named_state parameter must be NamedState object.")
+
+        if not self.is_world():
+            raise ValueError(
+                "this World object must be a world")
+
+        from valueset import ValueSet
+
+        if self._attribute_system is not named_state._attribute_system:
+            if self._attribute_system != named_state._attribute_system:
+                return False
+
+        if self._p._vocabulary != named_state._p._vocabulary:
+            return False
+
+        # the world is an extension of named_state when every value of the
+        # world is in the corresponding ascription of named_state
+        for ao_pair, position in self._positions.iteritems():
+            value = self._valuations[position][self._indices[position]]
+            if not ValueSet([value]) <= named_state._ascriptions[ao_pair]:
+                return False
+
+        return self._p >= named_state._p
+
+    def satisfies_context(self, context, X, attribute_interpretation):
+        """
+        Determine if the calling World object :math:`(w;\widehat{\\rho})`
+        satisfies the given Context object in the ``context`` parameter
+        :math:`\gamma = (\\beta;(\sigma;\\rho))` w.r.t. a given
+        VariableAssignment object :math:`\chi` and given
+        AttributeInterpretation object :math:`I`, i.e.,
+        :math:`(w;\widehat{\\rho})\models_{\chi}\gamma`.
+
+        :return: Whether or not \
+        :math:`(w;\widehat{\\rho})\models_{\chi}\gamma`.
+        :rtype: ``bool``
+
+        :raises TypeError: ``context`` parameter must be a Context object, \
+        ``X`` parameter must be a VariableAssignment object and \
+        ``attribute_interpretation`` must be an AttributeInterpretation object.
+        :raises ValueError: The calling World object must be a world.
+        """
+
+        if not hasattr(context, "_is_Context"):
+            raise TypeError(
+                "context parameter must be of type Context")
+
+        if not hasattr(X, "_is_VariableAssignment"):
+            raise TypeError(
+                "X parameter must be of type VariableAssignment")
+
+        if not hasattr(attribute_interpretation,
+                       "_is_AttributeInterpretation"):
+            raise TypeError(
+                "attribute_interpretation parameter must be of type "
+                "AttributeInterpretation")
+
+        if not self.is_world():
+            raise ValueError(
+                "this World object must be a world")
+
+        if not self.satisfies_named_state(context._named_state):
+            return False
+
+        for formula in context._assumption_base:
+            if not self.satisfies_formula(
+                    formula, X, attribute_interpretation):
+                return False
+
+        return True